@@ -11,12 +11,18 @@ style_mapping_config.py file.
 # Import all constants
 from .constants import (
     BULLET_CHARACTER_OPTIONS,
+    CAPTION_SEQUENCE_NAMES,
     DEFAULT_BULLET_LIST_INDENTATION,
     DEFAULT_NESTED_LEVEL_CONFIG,
+    FIELD_NUMBER_FORMATS,
     HEADER_FOOTER_FIELD_MAPPINGS,
     HEADER_FOOTER_LAYOUT_CONFIG,
+    HEADING_LEVEL_STYLES,
+    NUMBERING_SEPARATOR_SUFFIXES,
+    PAGE_SIZES,
     STYLE_ATTRIBUTES_NAMES_MAPPING,
     STYLE_NAMES_MAPPING,
+    WORD_NUMBER_FORMATS,
 )
 
 # Import all mappings
@@ -44,6 +50,12 @@ __all__ = [
     "HEADER_FOOTER_LAYOUT_CONFIG",
     "DEFAULT_NESTED_LEVEL_CONFIG",
     "DEFAULT_BULLET_LIST_INDENTATION",
+    "HEADING_LEVEL_STYLES",
+    "WORD_NUMBER_FORMATS",
+    "NUMBERING_SEPARATOR_SUFFIXES",
+    "FIELD_NUMBER_FORMATS",
+    "CAPTION_SEQUENCE_NAMES",
+    "PAGE_SIZES",
     # Mappings
     "FONT_MAPPING",
     "PARAGRAPH_FORMAT_MAPPING",
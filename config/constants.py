@@ -13,11 +13,19 @@ STYLE_NAMES_MAPPING = {
     "table_titles": "table_titles",
     "figure_titles": "figure_titles",
     "source_text": "source_text",
+    "table_style": "table_style",
     "header_row_style": "header_row_style",
     "header_style": "header_style",
     "footer_style": "footer_style",
 }
 
+# Heading styles in outline level order
+HEADING_LEVEL_STYLES = [
+    "chapter_titles",
+    "subchapter_titles_level_2",
+    "subchapter_titles_level_3",
+]
+
 # Style attribute name mappings
 STYLE_ATTRIBUTES_NAMES_MAPPING = {
     "font_format": "font_format",
@@ -47,6 +55,39 @@ BULLET_CHARACTER_OPTIONS = {
     "em_dash": "—",
 }
 
+# Word w:numFmt values for numbering_format types
+WORD_NUMBER_FORMATS = {
+    "ARABIC": "decimal",
+    "ROMAN": "upperRoman",
+    "LOWER_ROMAN": "lowerRoman",
+    "UPPER_ALPHA": "upperLetter",
+    "LOWER_ALPHA": "lowerLetter",
+    "ZERO_PADDED": "decimalZero",
+}
+
+# Word field \* switches for numbering_format types
+FIELD_NUMBER_FORMATS = {
+    "ARABIC": "ARABIC",
+    "ROMAN": "ROMAN",
+    "LOWER_ROMAN": "roman",
+    "UPPER_ALPHA": "ALPHABETIC",
+    "LOWER_ALPHA": "alphabetic",
+    "ZERO_PADDED": "ARABIC",
+}
+
+# SEQ field identifiers for caption styles
+CAPTION_SEQUENCE_NAMES = {
+    "table_titles": "Table",
+    "figure_titles": "Figure",
+}
+
+# Word w:suff values for numbering separators
+NUMBERING_SEPARATOR_SUFFIXES = {
+    " ": "space",
+    "\t": "tab",
+    "": "nothing",
+}
+
 # Default nested level configurations
 DEFAULT_NESTED_LEVEL_CONFIG = {
     0: {"bullet_char": "bullet", "left": 360, "hanging": 360},
@@ -82,3 +123,13 @@ HEADER_FOOTER_LAYOUT_CONFIG = {
     "column_widths": [33.33, 33.33, 33.34],
     "alignments": ["left", "center", "right"],
 }
+
+# Portrait page sizes (width, height) in twips for document_setup.page_size
+PAGE_SIZES = {
+    "A3": (16838, 23811),
+    "A4": (11906, 16838),
+    "A5": (8391, 11906),
+    "B5": (9979, 14175),
+    "LETTER": (12240, 15840),
+    "LEGAL": (12240, 20160),
+}
@@ -11,6 +11,7 @@ import re
 BASE_PATTERNS = {
     "arabic_number": r"\d+",
     "roman_number": r"[IVXLCDMivxlcdm\d]+",
+    "alpha_number": r"[A-Za-z\d]+",
     "decimal_number": r"\d+(?:\.\d+)*",
     "mixed_number": r"[IVXLCDMivxlcdm\d]+(?:\.[IVXLCDMivxlcdm\d]+)*",
     "word_boundary": r"\b",
@@ -75,6 +76,7 @@ OPENXML_FORMATS = {
     "PIC": "http://schemas.openxmlformats.org/drawingml/2006/picture",  # Pictures
     "M": "http://schemas.openxmlformats.org/officeDocument/2006/math",  # Office Math (equations)
     "R": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",  # Relationships
+    "PR": "http://schemas.openxmlformats.org/package/2006/relationships",  # Package relationships
     "V": "urn:schemas-microsoft-com:vml",  # Legacy VML shapes
 }
 
@@ -93,4 +95,41 @@ W_TAGS = {
     "numPr": f'{{{OPENXML_FORMATS["W"]}}}numPr',
     "numId": f'{{{OPENXML_FORMATS["W"]}}}numId',
     "ilvl": f'{{{OPENXML_FORMATS["W"]}}}ilvl',
+    "p": f'{{{OPENXML_FORMATS["W"]}}}p',
+    "pStyle": f'{{{OPENXML_FORMATS["W"]}}}pStyle',
+    "sectPr": f'{{{OPENXML_FORMATS["W"]}}}sectPr',
+    "tbl": f'{{{OPENXML_FORMATS["W"]}}}tbl',
+    "tr": f'{{{OPENXML_FORMATS["W"]}}}tr',
+    "drawing": f'{{{OPENXML_FORMATS["W"]}}}drawing',
+    "pict": f'{{{OPENXML_FORMATS["W"]}}}pict',
+    "r": f'{{{OPENXML_FORMATS["W"]}}}r',
+    "t": f'{{{OPENXML_FORMATS["W"]}}}t',
+    "proofErr": f'{{{OPENXML_FORMATS["W"]}}}proofErr',
+    "lastRenderedPageBreak": f'{{{OPENXML_FORMATS["W"]}}}lastRenderedPageBreak',
+    "noProof": f'{{{OPENXML_FORMATS["W"]}}}noProof',
+    "bookmarkStart": f'{{{OPENXML_FORMATS["W"]}}}bookmarkStart',
+    "bookmarkEnd": f'{{{OPENXML_FORMATS["W"]}}}bookmarkEnd',
+    "id": f'{{{OPENXML_FORMATS["W"]}}}id',
+    "name": f'{{{OPENXML_FORMATS["W"]}}}name',
+    "body": f'{{{OPENXML_FORMATS["W"]}}}body',
+    "hyperlink": f'{{{OPENXML_FORMATS["W"]}}}hyperlink',
+    "anchor": f'{{{OPENXML_FORMATS["W"]}}}anchor',
+    "fldSimple": f'{{{OPENXML_FORMATS["W"]}}}fldSimple',
+    "instr": f'{{{OPENXML_FORMATS["W"]}}}instr',
+    "fldChar": f'{{{OPENXML_FORMATS["W"]}}}fldChar',
+    "fldCharType": f'{{{OPENXML_FORMATS["W"]}}}fldCharType',
+    "instrText": f'{{{OPENXML_FORMATS["W"]}}}instrText',
+    "tab": f'{{{OPENXML_FORMATS["W"]}}}tab',
+    "ptab": f'{{{OPENXML_FORMATS["W"]}}}ptab',
+    "br": f'{{{OPENXML_FORMATS["W"]}}}br',
+    "cr": f'{{{OPENXML_FORMATS["W"]}}}cr',
+    "pageBreakBefore": f'{{{OPENXML_FORMATS["W"]}}}pageBreakBefore',
+    "noBreakHyphen": f'{{{OPENXML_FORMATS["W"]}}}noBreakHyphen',
+    "type": f'{{{OPENXML_FORMATS["W"]}}}type',
+    "headerReference": f'{{{OPENXML_FORMATS["W"]}}}headerReference',
+    "footerReference": f'{{{OPENXML_FORMATS["W"]}}}footerReference',
+    "oMath": f'{{{OPENXML_FORMATS["M"]}}}oMath',
+    "oMathPara": f'{{{OPENXML_FORMATS["M"]}}}oMathPara',
+    "rel_id": f'{{{OPENXML_FORMATS["R"]}}}id',
+    "Relationship": f'{{{OPENXML_FORMATS["PR"]}}}Relationship',
 }
@@ -0,0 +1,108 @@
+import argparse
+import copy
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+import docx
+from docx.document import Document
+
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+from paths import INPUT_DIR, INPUT_DOCX, OUTPUT_DIR, STYLE_SCHEMA_FILENAME
+
+_WORKER_STATE: dict[str, Document] = {}
+
+
+def format_document_with_configs(
+    input_docx: str,
+    configs: dict[str, DocumentFormatterConfig],
+    output_dir: str,
+    max_workers: int | None = None,
+) -> dict[str, str]:
+    """
+    Format one document against many style configs.
+
+    The input is parsed once per worker process, or once in this process when
+    workers are forked and inherit it; every config gets its own in-memory clone of
+    the parsed document, formatted in a worker process.
+    Returns a mapping of config name to output path.
+    """
+    with open(input_docx, "rb") as f:
+        source_blob = f.read()
+
+    input_stem = os.path.splitext(os.path.basename(input_docx))[0]
+    output_paths = {
+        name: os.path.join(output_dir, f"{input_stem}_{name}.docx") for name in configs
+    }
+    os.makedirs(output_dir, exist_ok=True)
+
+    fork_available = "fork" in multiprocessing.get_all_start_methods()
+    mp_context = multiprocessing.get_context("fork") if fork_available else None
+    if fork_available:
+        _WORKER_STATE["source_document"] = docx.Document(BytesIO(source_blob))
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_initialize_worker,
+            initargs=(source_blob,),
+        ) as executor:
+            futures = [
+                executor.submit(_format_document_clone, config, output_paths[name])
+                for name, config in configs.items()
+            ]
+            for future in futures:
+                future.result()
+    finally:
+        _WORKER_STATE.clear()
+
+    return output_paths
+
+
+def _initialize_worker(source_blob: bytes) -> None:
+    """Parse the source document once per worker unless it was inherited via fork."""
+    if "source_document" not in _WORKER_STATE:
+        _WORKER_STATE["source_document"] = docx.Document(BytesIO(source_blob))
+
+
+def _format_document_clone(config: DocumentFormatterConfig, output_path: str) -> str:
+    """Format a deep copy of the parsed source document and save it."""
+    doc = copy.deepcopy(_WORKER_STATE["source_document"])
+    agent = DocumentFormattingAgent(doc, config)
+    agent.apply_all_styles()
+    doc.save(output_path)
+    return output_path
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Format one document against several style configs."
+    )
+    parser.add_argument("configs", nargs="+", help="Style config YAML filenames")
+    parser.add_argument("--input", default=INPUT_DOCX, help="Input .docx path")
+    parser.add_argument("--config-dir", default=INPUT_DIR, help="Config directory")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="Output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    formatter_configs = {}
+    for style_filename in args.configs:
+        config_name = os.path.splitext(style_filename)[0]
+        formatter_configs[config_name] = DocumentFormatterConfig.load_and_validate_yaml(
+            input_dir=args.config_dir,
+            style_filename=style_filename,
+            schema_filename=STYLE_SCHEMA_FILENAME,
+        )
+    for output_path in format_document_with_configs(
+        input_docx=args.input,
+        configs=formatter_configs,
+        output_dir=args.output_dir,
+        max_workers=args.workers,
+    ).values():
+        print(output_path)
@@ -0,0 +1,31 @@
+import argparse
+
+from document_formatter_config import DocumentFormatterConfig
+from paths import INPUT_DIR, STYLE_CONFIG_FILENAME, STYLE_SCHEMA_FILENAME
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Validate style configs and write their JSON snapshots, loaded by "
+            "DocumentFormatterConfig instead of the YAML while it is unchanged."
+        )
+    )
+    parser.add_argument(
+        "configs", nargs="*", default=[STYLE_CONFIG_FILENAME], help="Style configs"
+    )
+    parser.add_argument("--config-dir", default=INPUT_DIR, help="Config directory")
+    parser.add_argument("--schema", default=STYLE_SCHEMA_FILENAME, help="Schema file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    for style_filename in args.configs:
+        print(
+            DocumentFormatterConfig.compile_snapshot(
+                input_dir=args.config_dir,
+                style_filename=style_filename,
+                schema_filename=args.schema,
+            )
+        )
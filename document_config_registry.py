@@ -0,0 +1,222 @@
+import hashlib
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from document_formatter_config import DocumentFormatterConfig, read_extends_chain
+from paths import INPUT_DIR, STYLE_SCHEMA_FILENAME
+
+CONFIG_EXTENSIONS = (".yaml", ".yml")
+
+
+class DocumentConfigRegistry:
+    """
+    Validated style configs by config id, for services formatting documents for many
+    tenants. Configs come from YAML files in config_dir ("<config_id>.yaml") or from
+    sources registered in memory.
+
+    Configs are kept in an LRU bounded by max_entries and by max_bytes, an estimate
+    of their in-memory size. A file-backed config and the files it extends are
+    stat-ed at most once per check_interval seconds (only the extended files for
+    an in-memory source); a changed mtime or size only rebuilds the config when
+    a file's content hash changed too. A hot tenant's config is a dict lookup.
+    """
+
+    def __init__(
+        self,
+        config_dir: str = INPUT_DIR,
+        style_schema: dict | None = None,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        check_interval: float = 1.0,
+    ):
+        self.config_dir = config_dir
+        self.style_schema = style_schema or DocumentFormatterConfig.load_yaml_file(
+            input_dir=config_dir, filename=STYLE_SCHEMA_FILENAME
+        )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.check_interval = check_interval
+
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._sources: dict[str, bytes] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "reloads": 0, "evictions": 0}
+
+    def get(self, config_id: str) -> DocumentFormatterConfig:
+        """
+        Return the validated config of config_id, loading it on a miss or after its
+        source changed. Raises FileNotFoundError for an unknown config id and
+        ValueError for an invalid config.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(config_id)
+            if entry is not None and now - entry["checked_at"] < self.check_interval:
+                self._entries.move_to_end(config_id)
+                self._stats["hits"] += 1
+                return entry["config"]
+            source = self._sources.get(config_id)
+
+        parents_changed = entry is not None and self._parents_changed(entry)
+        if entry is not None and source is not None and not parents_changed:
+            # register() drops the entry when the in-memory source changes
+            return self._touch(config_id, entry, now)
+
+        stamp = None
+        if source is None:
+            path = self._get_config_path(config_id)
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"File not found: {path}")
+            stamp = _get_stamp(path)
+            if entry is not None and entry["stamp"] == stamp and not parents_changed:
+                return self._touch(config_id, entry, now)
+            with open(path, "rb") as f:
+                source = f.read()
+
+        content_hash = hashlib.sha256(source).hexdigest()
+        if entry is not None and entry["hash"] == content_hash and not parents_changed:
+            entry["stamp"] = stamp
+            return self._touch(config_id, entry, now)
+
+        # Hashed before the config is built, so a parent changed meanwhile is reloaded
+        parent_hashes = read_extends_chain(self.config_dir, source)
+        config = DocumentFormatterConfig.from_yaml_source(
+            source,
+            self.style_schema,
+            base_dir=self.config_dir,
+        )
+        self._store(
+            config_id,
+            {
+                "config": config,
+                "hash": content_hash,
+                "stamp": stamp,
+                # Stamps are taken on the first check, before the file is re-read
+                "parents": {
+                    filename: {"hash": parent_hash, "stamp": None}
+                    for filename, parent_hash in parent_hashes.items()
+                },
+                "checked_at": now,
+                "size": _estimate_size(vars(config)),
+            },
+            reloaded=entry is not None,
+        )
+        return config
+
+    def register(self, config_id: str, source: str | bytes) -> None:
+        """
+        Register an in-memory YAML source for config_id, taking precedence over the
+        config directory. The cached config is dropped only if the content changed.
+        """
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        with self._lock:
+            self._sources[config_id] = source
+            entry = self._entries.get(config_id)
+            if (
+                entry is not None
+                and entry["hash"] != hashlib.sha256(source).hexdigest()
+            ):
+                self._drop(config_id)
+
+    def invalidate(self, config_id: str) -> None:
+        """Drop the cached config and any in-memory source of config_id."""
+        with self._lock:
+            self._sources.pop(config_id, None)
+            if config_id in self._entries:
+                self._drop(config_id)
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit, miss, reload and eviction counts and the cache size."""
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def _get_config_path(self, config_id: str) -> str:
+        """Return the YAML path of a config id; ids cannot leave config_dir."""
+        if not config_id or os.path.basename(config_id) != config_id:
+            raise ValueError(f"Invalid config id: {config_id!r}")
+        filename = (
+            config_id
+            if config_id.endswith(CONFIG_EXTENSIONS)
+            else f"{config_id}{CONFIG_EXTENSIONS[0]}"
+        )
+        return os.path.join(self.config_dir, filename)
+
+    def _parents_changed(self, entry: dict) -> bool:
+        """
+        Check the files an entry's config extends: a file whose stamp changed is
+        hashed again, and True is returned if its content changed or it is gone.
+        """
+        for filename, parent in entry["parents"].items():
+            path = os.path.join(self.config_dir, filename)
+            try:
+                stamp = _get_stamp(path)
+                if stamp == parent["stamp"]:
+                    continue
+                with open(path, "rb") as f:
+                    parent_hash = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                return True
+
+            if parent_hash != parent["hash"]:
+                return True
+            parent["stamp"] = stamp
+        return False
+
+    def _touch(
+        self, config_id: str, entry: dict, now: float
+    ) -> DocumentFormatterConfig:
+        """Mark an unchanged entry as checked and most recently used."""
+        with self._lock:
+            entry["checked_at"] = now
+            if config_id in self._entries:
+                self._entries.move_to_end(config_id)
+            self._stats["hits"] += 1
+        return entry["config"]
+
+    def _store(self, config_id: str, entry: dict, reloaded: bool) -> None:
+        """Insert an entry and evict the least recently used ones over the bounds."""
+        with self._lock:
+            if config_id in self._entries:
+                self._drop(config_id)
+            self._entries[config_id] = entry
+            self._total_bytes += entry["size"]
+            self._stats["reloads" if reloaded else "misses"] += 1
+
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries
+                or self._total_bytes > self.max_bytes
+            ):
+                self._drop(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def _drop(self, config_id: str) -> None:
+        """Remove a cached entry; the lock must be held."""
+        entry = self._entries.pop(config_id)
+        self._total_bytes -= entry["size"]
+
+
+def _get_stamp(path: str) -> tuple[int, int]:
+    """Return the (mtime in ns, size) of a file."""
+    file_stat = os.stat(path)
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def _estimate_size(value: object) -> int:
+    """Estimate the memory of a config value: dicts, lists and scalars."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            _estimate_size(key) + _estimate_size(item) for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple)):
+        size += sum(_estimate_size(item) for item in value)
+    return size
@@ -0,0 +1,67 @@
+import argparse
+import sys
+from typing import IO
+
+import config as MAPPING_CONF
+from document_formatter_config import DocumentFormatterConfig
+from paths import INPUT_DIR, INPUT_DOCX, STYLE_CONFIG_FILENAME, STYLE_SCHEMA_FILENAME
+from styling_utils import check_document_conformance
+
+
+def check_document(
+    docx_source: str | IO[bytes], config: DocumentFormatterConfig
+) -> list[dict[str, str | int | None]]:
+    """
+    Lint a document against a style config. The document is only read; nothing is
+    formatted or saved.
+    """
+    return check_document_conformance(
+        docx_source=docx_source,
+        config=config,
+        style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+        style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+        font_mapping=MAPPING_CONF.FONT_MAPPING,
+        paragraph_format_mapping=MAPPING_CONF.PARAGRAPH_FORMAT_MAPPING,
+        chapter_section_numbering_regex=MAPPING_CONF.CHAPTER_SECTION_NUMBERING_REGEX,
+        renumbering_regex=MAPPING_CONF.RENUMBERING_REGEX,
+        heading_level_styles=MAPPING_CONF.HEADING_LEVEL_STYLES,
+        caption_sequence_names=MAPPING_CONF.CAPTION_SEQUENCE_NAMES,
+        field_mappings=MAPPING_CONF.HEADER_FOOTER_FIELD_MAPPINGS,
+        openxml_formats=MAPPING_CONF.OPENXML_FORMATS,
+        w_tags=MAPPING_CONF.W_TAGS,
+    )
+
+
+def format_violation(violation: dict[str, str | int | None]) -> str:
+    """Format a violation as a single report line."""
+    location = violation["part"]
+    if violation["paragraph"] is not None:
+        location = f"{location}#paragraph {violation['paragraph']}"
+    style = f" [{violation['style']}]" if violation["style"] else ""
+    return (
+        f"{location}{style} {violation['rule']}: "
+        f"expected {violation['expected']!r}, found {violation['actual']!r}"
+    )
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Report style violations of a document without formatting it."
+    )
+    parser.add_argument("--input", default=INPUT_DOCX, help="Input .docx path")
+    parser.add_argument("--config", default=STYLE_CONFIG_FILENAME, help="Style config")
+    parser.add_argument("--config-dir", default=INPUT_DIR, help="Config directory")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    formatter_config = DocumentFormatterConfig.load_and_validate_yaml(
+        input_dir=args.config_dir,
+        style_filename=args.config,
+        schema_filename=STYLE_SCHEMA_FILENAME,
+    )
+    violations = check_document(args.input, formatter_config)
+    for violation in violations:
+        print(format_violation(violation))
+    sys.exit(1 if violations else 0)
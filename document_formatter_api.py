@@ -0,0 +1,45 @@
+from io import BytesIO
+from typing import BinaryIO
+
+import docx
+
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+
+
+def format_docx(
+    data: bytes | BinaryIO,
+    config: DocumentFormatterConfig,
+    output: BinaryIO | None = None,
+    max_workers: int = 1,
+) -> bytes | None:
+    """
+    Format a .docx held in memory with a style config, for callers embedding the
+    formatter without temp files. data is the document content or a readable
+    binary stream; non-seekable streams are read into memory first, as the zip
+    directory sits at the end of the file.
+
+    Returns the formatted .docx content. With output, a writable binary stream,
+    the zip is written to it directly instead and None is returned; the stream
+    does not need to be seekable. Nothing is written to the filesystem and
+    nothing is read from it other than the config's reference_template.
+    max_workers only overlaps phases on separate package parts, see
+    run_phase_stages; body phases run one after another.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        source = BytesIO(data)
+    elif data.seekable():
+        source = data
+    else:
+        source = BytesIO(data.read())
+
+    doc = docx.Document(source)
+    DocumentFormattingAgent(doc, config).apply_all_styles(max_workers=max_workers)
+
+    if output is not None:
+        doc.save(output)
+        return None
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
@@ -1,8 +1,35 @@
+import copy
+import hashlib
+import json
 import os
+import threading
+from collections import OrderedDict
 from typing import Any, Dict
 
 import yaml
-from jsonschema import ValidationError, validate
+
+from document_schema_validator import SchemaValidator, get_schema_validator
+
+CONFIG_ROOT_KEY = "document_formatter_config"
+EXTENDS_KEY = "extends"
+MAX_CACHED_LAYERS = 512
+
+# Bumped when the snapshot layout or the normalized config changes
+SNAPSHOT_VERSION = 2
+SNAPSHOT_SUFFIX = ".snapshot"
+
+# libyaml's loader when PyYAML was built with it, the pure-Python one otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class ConfigExtendsError(ValueError):
+    """An extends chain that cannot be resolved: a parent outside the config
+    directory, a cycle or an invalid parent config."""
+
+
+# Parsed YAML sources and merged, validated config layers by content hash
+_LAYER_CACHE: OrderedDict[str, dict] = OrderedDict()
+_LAYER_CACHE_LOCK = threading.Lock()
 
 
 class DocumentFormatterConfig:
@@ -10,7 +37,7 @@ class DocumentFormatterConfig:
         """
         Initialize the configuration object with a validated config dictionary.
         """
-        doc_config = config.get("document_formatter_config", {})
+        doc_config = config.get(CONFIG_ROOT_KEY, {})
 
         self.document_setup = doc_config.get("document_setup", {})
         self.paragraph_styles = doc_config.get("paragraph_styles", {})
@@ -21,6 +48,7 @@ class DocumentFormatterConfig:
         self.formula_rules = doc_config.get("formula_rules", {})
         self.list_rules = doc_config.get("list_rules", {})
         self.header_footer_rules = doc_config.get("header_footer_rules", {})
+        self.adjustment_rules = doc_config.get("adjustment_rules", {})
 
     @staticmethod
     def load_yaml_file(input_dir: str, filename: str) -> dict:
@@ -32,7 +60,7 @@ class DocumentFormatterConfig:
             raise FileNotFoundError(f"File not found: {path}")
 
         with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YAML_LOADER)
 
     @classmethod
     def load_and_validate_yaml(
@@ -41,13 +69,335 @@ class DocumentFormatterConfig:
         """
         Load a styles YAML file and validate it against a JSON schema.
         Returns an instance of DocumentFormatterConfig if valid.
+
+        A snapshot written by compile_snapshot is used instead while the hashes of
+        the YAML files it was compiled from still match.
         """
-        style_config = cls.load_yaml_file(input_dir=input_dir, filename=style_filename)
-        style_schema = cls.load_yaml_file(input_dir=input_dir, filename=schema_filename)
+        style_config = read_config_snapshot(input_dir, style_filename, schema_filename)
+        if style_config is not None:
+            return cls(style_config)
 
-        try:
-            validate(instance=style_config, schema=style_schema)
-        except ValidationError as e:
-            raise ValueError(f"YAML validation error: {e.message}") from e
+        style_source = cls.read_config_source(
+            input_dir=input_dir, filename=style_filename
+        )
+        style_schema = _parse_yaml_source(
+            cls.read_config_source(input_dir=input_dir, filename=schema_filename)
+        )
+        return cls.from_yaml_source(style_source, style_schema, base_dir=input_dir)
+
+    @classmethod
+    def compile_snapshot(
+        cls, input_dir: str, style_filename: str, schema_filename: str
+    ) -> str:
+        """
+        Validate a styles YAML file and write the merged config, with the hashes of
+        the config, its extends parents and the schema, to a JSON snapshot next to
+        it ("style_config.snapshot"). Returns the snapshot path. Raises ValueError
+        for a config that JSON cannot represent unchanged.
+        """
+        style_source = cls.read_config_source(
+            input_dir=input_dir, filename=style_filename
+        )
+        schema_source = cls.read_config_source(
+            input_dir=input_dir, filename=schema_filename
+        )
+        schema_validator = get_schema_validator(_parse_yaml_source(schema_source))
+        _, style_config = _resolve_config_layer(
+            style_source, schema_validator, input_dir, input_dir, ()
+        )
+
+        source_hashes = {
+            style_filename: _hash_bytes(style_source),
+            schema_filename: _hash_bytes(schema_source),
+            **read_extends_chain(input_dir, style_source),
+        }
+
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "style_filename": style_filename,
+            "schema_filename": schema_filename,
+            "source_hashes": source_hashes,
+            "config": style_config,
+        }
+        snapshot_source = json.dumps(snapshot, ensure_ascii=False)
+        if json.loads(snapshot_source)["config"] != style_config:
+            raise ValueError(
+                f"{style_filename} cannot be snapshotted: it has values JSON "
+                "cannot represent"
+            )
+
+        snapshot_path = get_snapshot_path(input_dir, style_filename)
+        temp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(snapshot_source)
+        os.replace(temp_path, snapshot_path)
+        return snapshot_path
+
+    @staticmethod
+    def read_config_source(input_dir: str, filename: str) -> bytes:
+        """
+        Read the raw content of a config file.
+        """
+        path = os.path.join(input_dir, filename)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"File not found: {path}")
+
+        with open(path, "rb") as f:
+            return f.read()
+
+    @classmethod
+    def from_yaml_source(
+        cls, style_source: bytes, style_schema: dict, base_dir: str
+    ) -> "DocumentFormatterConfig":
+        """
+        Build a config from YAML content, resolving document_formatter_config.extends:
+        the parent file (relative to base_dir, then to the file extending it) is
+        deep-merged under the config, recursively. Parents must be inside base_dir;
+        ConfigExtendsError is raised for any other path, a cycle or an invalid
+        parent, without quoting the parent's content.
+
+        Every layer, merged with its parents, is validated once and cached by the
+        content hashes of its chain, so variants of one base parse and validate the
+        base once. Validation runs through the compiled schema validator.
+        """
+        schema_validator = get_schema_validator(style_schema)
+        _, style_config = _resolve_config_layer(
+            style_source, schema_validator, base_dir, base_dir, ()
+        )
+        return cls(copy.deepcopy(style_config))
+
+    @classmethod
+    def validate_config(
+        cls, style_config: dict, style_schema: dict
+    ) -> "DocumentFormatterConfig":
+        """
+        Validate a loaded style config against a JSON schema.
+        Returns an instance of DocumentFormatterConfig if valid.
+        """
+        get_schema_validator(style_schema).validate(style_config)
 
         return cls(style_config)
+
+
+def get_snapshot_path(input_dir: str, style_filename: str) -> str:
+    """Return the snapshot path of a styles YAML file."""
+    style_path = os.path.join(input_dir, style_filename)
+    return f"{os.path.splitext(style_path)[0]}{SNAPSHOT_SUFFIX}"
+
+
+def read_config_snapshot(
+    input_dir: str, style_filename: str, schema_filename: str
+) -> dict | None:
+    """
+    Return the config of a snapshot if it is current: same version, compiled from
+    the same config and schema files, and every file it was compiled from still
+    has the recorded content hash. Returns None otherwise, if there is none, or if
+    it cannot be read or does not have the snapshot structure.
+    """
+    try:
+        with open(get_snapshot_path(input_dir, style_filename), encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError, RecursionError):
+        return None
+
+    if not _is_snapshot(snapshot) or (
+        snapshot["version"],
+        snapshot["style_filename"],
+        snapshot["schema_filename"],
+    ) != (SNAPSHOT_VERSION, style_filename, schema_filename):
+        return None
+
+    for filename, content_hash in snapshot["source_hashes"].items():
+        try:
+            _get_parent_filename(input_dir, input_dir, filename)
+            source = DocumentFormatterConfig.read_config_source(
+                input_dir=input_dir, filename=filename
+            )
+        except (OSError, ConfigExtendsError):
+            return None
+        if _hash_bytes(source) != content_hash:
+            return None
+
+    return snapshot["config"]
+
+
+def _is_snapshot(snapshot: Any) -> bool:
+    """Check that loaded JSON has the structure compile_snapshot writes."""
+    return (
+        isinstance(snapshot, dict)
+        and isinstance(snapshot.get("version"), int)
+        and isinstance(snapshot.get("style_filename"), str)
+        and isinstance(snapshot.get("schema_filename"), str)
+        and isinstance(snapshot.get("source_hashes"), dict)
+        and all(
+            isinstance(filename, str) and isinstance(content_hash, str)
+            for filename, content_hash in snapshot["source_hashes"].items()
+        )
+        and isinstance(snapshot.get("config"), dict)
+    )
+
+
+def read_extends_chain(input_dir: str, source: bytes) -> dict[str, str]:
+    """
+    Return the content hashes of the files a config extends, directly or through
+    its parents, by their path relative to input_dir. Raises FileNotFoundError
+    for a missing parent and ConfigExtendsError for one outside input_dir.
+    """
+    chain_hashes: dict[str, str] = {}
+    base_dir = input_dir
+    while True:
+        layer = _parse_yaml_source(source)
+        doc_config = layer.get(CONFIG_ROOT_KEY) if isinstance(layer, dict) else None
+        parent_name = (
+            doc_config.get(EXTENDS_KEY) if isinstance(doc_config, dict) else None
+        )
+        if not parent_name or not isinstance(parent_name, str):
+            return chain_hashes
+
+        parent_filename = _get_parent_filename(input_dir, base_dir, parent_name)
+        if parent_filename in chain_hashes:
+            return chain_hashes
+
+        source = DocumentFormatterConfig.read_config_source(
+            input_dir=input_dir, filename=parent_filename
+        )
+        chain_hashes[parent_filename] = _hash_bytes(source)
+        base_dir = os.path.dirname(os.path.join(input_dir, parent_filename))
+
+
+def merge_config_layers(parent: dict, child: dict) -> dict:
+    """
+    Deep-merge a child config over its parent: nested mappings are merged key by
+    key, any other child value (including lists) replaces the parent's.
+    """
+    merged = dict(parent)
+    for key, value in child.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config_layers(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _resolve_config_layer(
+    source: bytes,
+    schema_validator: SchemaValidator,
+    root_dir: str,
+    base_dir: str,
+    extending: tuple[str, ...],
+) -> tuple[str, dict]:
+    """
+    Return the cache key and the merged, validated config of a YAML source and its
+    extends chain. Parents are resolved against base_dir and must be inside
+    root_dir; extending holds the content hashes of the configs extending it.
+    """
+    content_hash = _hash_bytes(source)
+
+    layer = _parse_yaml_source(source, content_hash)
+    doc_config = layer.get(CONFIG_ROOT_KEY) if isinstance(layer, dict) else None
+    if not isinstance(doc_config, dict):
+        # No extends to resolve: the schema reports the missing or malformed root
+        schema_validator.validate(layer)
+        doc_config = None
+
+    parent_name = doc_config.get(EXTENDS_KEY) if doc_config else None
+    if parent_name is not None and not isinstance(parent_name, str):
+        raise ValueError(
+            f"YAML validation error: {parent_name!r} is not of type 'string'"
+        )
+
+    parent_key, parent_config = "", {}
+    if parent_name:
+        parent_filename = _get_parent_filename(root_dir, base_dir, parent_name)
+        parent_source = DocumentFormatterConfig.read_config_source(
+            input_dir=root_dir, filename=parent_filename
+        )
+        if _hash_bytes(parent_source) in (*extending, content_hash):
+            raise ConfigExtendsError("YAML validation error: config extends itself")
+        try:
+            parent_key, parent_config = _resolve_config_layer(
+                parent_source,
+                schema_validator,
+                root_dir,
+                os.path.dirname(os.path.join(root_dir, parent_filename)),
+                (*extending, content_hash),
+            )
+        except ConfigExtendsError:
+            raise
+        except (ValueError, yaml.YAMLError):
+            # The parent is not the caller's to read: do not quote its content
+            raise ConfigExtendsError(
+                f"YAML validation error: {EXTENDS_KEY} {parent_name!r} is not a "
+                "valid config"
+            ) from None
+
+    layer_key = _hash_bytes(
+        f"{schema_validator.schema_key}:{parent_key}:{content_hash}".encode()
+    )
+    merged_config = _get_cached_layer(f"config:{layer_key}")
+    if merged_config is None:
+        merged_config = layer
+        if doc_config is not None:
+            own_config = {
+                **layer,
+                CONFIG_ROOT_KEY: {
+                    key: value
+                    for key, value in doc_config.items()
+                    if key != EXTENDS_KEY
+                },
+            }
+            merged_config = merge_config_layers(parent_config, own_config)
+        schema_validator.validate(merged_config)
+        _cache_layer(f"config:{layer_key}", merged_config)
+
+    return layer_key, merged_config
+
+
+def _get_parent_filename(root_dir: str, base_dir: str, parent_name: str) -> str:
+    """
+    Return the path of an extends parent relative to root_dir. Raises
+    ConfigExtendsError for an absolute path or one resolving outside root_dir.
+    """
+    root_path = os.path.realpath(root_dir)
+    parent_path = os.path.realpath(os.path.join(base_dir, parent_name))
+    if (
+        os.path.isabs(parent_name)
+        or os.path.commonpath([root_path, parent_path]) != root_path
+    ):
+        raise ConfigExtendsError(
+            f"YAML validation error: {EXTENDS_KEY} {parent_name!r} is outside the "
+            "config directory"
+        )
+    return os.path.relpath(parent_path, root_path)
+
+
+def _parse_yaml_source(source: bytes, content_hash: str | None = None) -> dict:
+    """Parse YAML content, cached by its hash. The result must not be changed."""
+    key = f"yaml:{content_hash or _hash_bytes(source)}"
+    parsed = _get_cached_layer(key)
+    if parsed is None:
+        parsed = yaml.load(source, Loader=YAML_LOADER) or {}
+        _cache_layer(key, parsed)
+    return parsed
+
+
+def _get_cached_layer(key: str) -> dict | None:
+    """Return a cached layer and mark it as most recently used."""
+    with _LAYER_CACHE_LOCK:
+        layer = _LAYER_CACHE.get(key)
+        if layer is not None:
+            _LAYER_CACHE.move_to_end(key)
+        return layer
+
+
+def _cache_layer(key: str, layer: dict) -> None:
+    """Cache a layer, evicting the least recently used ones over MAX_CACHED_LAYERS."""
+    with _LAYER_CACHE_LOCK:
+        _LAYER_CACHE[key] = layer
+        while len(_LAYER_CACHE) > MAX_CACHED_LAYERS:
+            _LAYER_CACHE.popitem(last=False)
+
+
+def _hash_bytes(data: bytes) -> str:
+    """Return the SHA-256 hex digest of data."""
+    return hashlib.sha256(data).hexdigest()
@@ -1,37 +1,398 @@
+from typing import Iterable
+
 from docx import Document
 
 import config as MAPPING_CONF
 from document_formatter_config import DocumentFormatterConfig
 from styling_utils import (
+    ParagraphView,
+    apply_adjustment_rules,
     apply_bullet_character_updates,
+    apply_caption_field_numbering,
+    apply_chapter_outline_level,
     apply_chapter_page_breaks,
     apply_chapter_section_numbering_format,
+    apply_cross_reference_updates,
+    apply_default_font,
     apply_docx_style_definitions,
+    apply_edit_plan,
     apply_empty_paragraph_removal,
+    apply_formula_rules,
     apply_header_footer_to_all_sections,
+    apply_heading_list_definition,
     apply_list_termination_characters,
+    apply_native_heading_numbering,
     apply_nested_styling_to_paragraphs,
+    apply_object_caption_styles,
+    apply_outline_numbering,
+    apply_page_setup,
     apply_paragraph_cleaning,
+    apply_run_coalescing,
     apply_section_numbering_order,
     apply_source_styles,
     apply_table_figure_styles,
+    apply_table_styles,
+    apply_xml_slimming,
+    build_edit_plan,
+    count_style_usage,
+    get_nested_styling_rules,
+    group_phase_stages,
+    has_table_style_rules,
+    import_reference_template,
+    load_reference_template,
+    run_phase_stages,
+    select_phases,
 )
 
+# Phases whose results the edit plan is built from
+PLAN_INPUT_PHASE_NAMES = ("slim_xml", "normalize_runs", "apply_adjustments")
+
 
 class DocumentFormattingAgent:
-    def __init__(self, doc: Document, config: DocumentFormatterConfig):
+    def __init__(
+        self, doc: Document, config: DocumentFormatterConfig, start_chapter: int = 0
+    ):
         self.doc = doc
         self.config = config
+        self.start_chapter = start_chapter
+        self.normalization_report: dict[str, int] = {}
+        self.label_map: dict[str, str] = {}
+
+    def apply_all_styles(self, max_workers: int = 1) -> list[str]:
+        """
+        Run the formatting phases that have work to do. Phases are skipped when their
+        config sections are empty or no paragraph uses the styles they work on; with
+        max_workers above 1, phases touching disjoint package parts run in threads;
+        body phases still run one after another (see run_phase_stages).
+        Caption and source styles are assigned around tables and figures first when
+        enabled, as they decide which styles are in use. Returns the names of the
+        phases run.
+        """
+        self.apply_object_captions()
+        return self.apply_phases(max_workers=max_workers)
+
+    def apply_phases(
+        self, phase_names: Iterable[str] | None = None, max_workers: int = 1
+    ) -> list[str]:
+        """
+        Run the given phases of describe_phases (all of them by default) that have
+        work to do, in their declared order. Every entry point runs its phases
+        through here, so a phase is selected and ordered the same way everywhere.
+        Returns the names of the phases run.
+        """
+        phases = self.describe_phases()
+        if phase_names is not None:
+            phase_names = set(phase_names)
+            phases = [phase for phase in phases if phase["name"] in phase_names]
+
+        style_usage = count_style_usage(self.doc, MAPPING_CONF.W_TAGS)
+        return run_phase_stages(
+            group_phase_stages(select_phases(phases, self.config, style_usage)),
+            run_phase=lambda phase: getattr(self, phase["name"])(),
+            max_workers=max_workers,
+            prepare_stage=self._prepare_phase_parts,
+        )
+
+    def describe_phases(self) -> list[dict]:
+        """
+        Declare the apply_all_styles phases in their sequential order: the config
+        sections and paragraph styles each phase depends on and the package parts
+        (body, styles, numbering, headers_footers) it reads and writes.
+        """
+        document_setup = self.config.document_setup
+        native_heading_numbering = document_setup.get("native_heading_numbering", False)
+        style_names_mapping = MAPPING_CONF.STYLE_NAMES_MAPPING
+        chapter_rules = self.config.chapter_and_section_rules
+        numbered_style_names = {
+            style_names_mapping.get(style_key, style_key)
+            for style_key in [
+                *chapter_rules,
+                *MAPPING_CONF.HEADING_LEVEL_STYLES,
+                *MAPPING_CONF.CAPTION_SEQUENCE_NAMES,
+            ]
+        }
+        refactor_section_numbering = document_setup.get(
+            "refactor_section_numbering", False
+        )
+        caption_field_numbering = document_setup.get("caption_field_numbering", False)
+        numbering_writes = (
+            ["body", "styles", "numbering"] if native_heading_numbering else ["body"]
+        )
+
+        def phase(name, reads, writes, config=None, styles=None, enabled=True):
+            return {
+                "name": name,
+                "enabled": enabled,
+                "config": config,
+                "styles": styles,
+                "reads": reads,
+                "writes": writes,
+            }
+
+        return [
+            phase(
+                "slim_xml",
+                ["body", "headers_footers"],
+                ["body", "headers_footers"],
+                enabled=document_setup.get("slim_xml", False),
+            ),
+            phase("normalize_runs", ["body"], ["body"]),
+            phase("clean_paragraphs", ["body"], ["body"]),
+            phase("apply_adjustments", ["body"], ["body"], config=["adjustment_rules"]),
+            phase(
+                "apply_reference_template",
+                ["styles", "numbering"],
+                ["styles", "numbering"],
+                enabled=bool(document_setup.get("reference_template")),
+            ),
+            phase(
+                "apply_document_setup",
+                ["body", "styles"],
+                ["body", "styles"],
+                enabled=any(
+                    document_setup.get(key)
+                    for key in ("page_size", "margins", "default_font")
+                ),
+            ),
+            phase(
+                "apply_paragraph_styles",
+                ["styles"],
+                ["styles"],
+                config=["paragraph_styles"],
+            ),
+            phase(
+                "apply_chapter_section_style_definitions",
+                ["styles"],
+                ["styles"],
+                config=["chapter_and_section_rules"],
+            ),
+            phase(
+                "apply_table_figure_style_definitions",
+                ["styles"],
+                ["styles"],
+                config=["chapter_and_section_rules"],
+            ),
+            phase(
+                "apply_table_styles",
+                ["body", "styles"],
+                ["body", "styles"],
+                enabled=has_table_style_rules(
+                    self.config.table_rules, MAPPING_CONF.STYLE_NAMES_MAPPING
+                ),
+            ),
+            phase(
+                "apply_numbering_definitions",
+                ["styles", "numbering"],
+                ["styles", "numbering"],
+                config=["chapter_and_section_rules"],
+                enabled=native_heading_numbering
+                or document_setup.get("caption_field_numbering", False),
+            ),
+            phase(
+                "apply_chapter_section_numbering",
+                ["body", "styles", "numbering"],
+                numbering_writes,
+                config=["chapter_and_section_rules"],
+                styles=None if native_heading_numbering else numbered_style_names,
+                enabled=native_heading_numbering or not refactor_section_numbering,
+            ),
+            phase(
+                "apply_caption_field_numbering",
+                ["body", "styles"],
+                ["body"],
+                config=["chapter_and_section_rules"],
+                styles=numbered_style_names,
+                enabled=caption_field_numbering,
+            ),
+            phase(
+                "apply_outline_numbering",
+                ["body", "styles"],
+                ["body"],
+                config=["chapter_and_section_rules"],
+                styles=numbered_style_names,
+                enabled=(refactor_section_numbering and not native_heading_numbering)
+                or not caption_field_numbering,
+            ),
+            phase(
+                "update_cross_references",
+                ["body", "styles"],
+                ["body"],
+                enabled=document_setup.get("update_cross_references", False),
+            ),
+            phase(
+                "apply_source_styles", ["styles"], ["styles"], config=["source_rules"]
+            ),
+            phase(
+                "apply_bullet_definitions",
+                ["numbering"],
+                ["numbering"],
+                config=["list_rules"],
+            ),
+            phase(
+                "apply_chapter_page_breaks",
+                ["body", "styles"],
+                ["body"],
+                styles=[style_names_mapping["chapter_titles"]],
+            ),
+            phase(
+                "apply_list_terminations",
+                ["body", "numbering"],
+                ["body"],
+                config=["list_rules"],
+            ),
+            phase(
+                "apply_formula_rules",
+                ["body", "styles"],
+                ["body"],
+                config=["formula_rules"],
+            ),
+            phase(
+                "apply_header_footer_styles",
+                ["body", "styles", "headers_footers"],
+                ["body", "headers_footers"],
+                config=["header_footer_rules"],
+            ),
+            phase(
+                "apply_nested_styling",
+                ["body", "styles"],
+                ["body"],
+                styles=list(self._get_nested_styling_rules()),
+            ),
+        ]
+
+    def _prepare_phase_parts(self, phases: list[dict]) -> None:
+        """Load the styles and numbering parts written by concurrent phases up front,
+        so that threads never add a part to the package at the same time."""
+        written_parts = {part for phase in phases for part in phase["writes"]}
+        if "styles" in written_parts:
+            _ = self.doc.styles
+        if "numbering" in written_parts:
+            _ = self.doc.part.numbering_part
+
+    def apply_planned_styles(self, plan: list[dict] | None = None) -> list[dict]:
+        """
+        Two-phase variant of apply_all_styles: the body paragraph phases are planned
+        first (or taken from a cached plan made for the same input) and executed in one
+        pass once the style and numbering definitions are written; the other phases
+        run through apply_phases around it, native and field numbering after it.
+        Returns the executed plan.
+        """
+        self.apply_object_captions()
+        self.apply_phases(PLAN_INPUT_PHASE_NAMES)
+        if plan is None:
+            plan = self.build_edit_plan()
+
+        skipped_phase_names = {
+            *PLAN_INPUT_PHASE_NAMES,
+            *self._get_planned_phase_names(),
+        }
+        phase_names = [
+            phase["name"]
+            for phase in self.describe_phases()
+            if phase["name"] not in skipped_phase_names
+        ]
+        plan_position = phase_names.index("apply_numbering_definitions") + 1
+        self.apply_phases(phase_names[:plan_position])
+        self.apply_edit_plan(plan)
+        self.apply_phases(phase_names[plan_position:])
+        return plan
+
+    def _get_planned_phase_names(self) -> set[str]:
+        """Return the phases whose edits build_edit_plan plans instead."""
+        planned_phase_names = {
+            "clean_paragraphs",
+            "apply_outline_numbering",
+            "apply_chapter_page_breaks",
+            "apply_list_terminations",
+            "apply_nested_styling",
+        }
+        if not self.config.document_setup.get("native_heading_numbering", False):
+            planned_phase_names.add("apply_chapter_section_numbering")
+        return planned_phase_names
+
+    def build_edit_plan(self) -> list[dict]:
+        """
+        Plan the body paragraph edits (cleaning, text numbering, chapter page breaks,
+        list terminations and nested styling) without modifying the document.
+        The plan is JSON-serializable.
+        """
+        return build_edit_plan(
+            doc=self.doc,
+            config=self.config,
+            style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+            style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+            chapter_section_numbering_regex=MAPPING_CONF.CHAPTER_SECTION_NUMBERING_REGEX,
+            renumbering_regex=MAPPING_CONF.RENUMBERING_REGEX,
+            heading_level_styles=MAPPING_CONF.HEADING_LEVEL_STYLES,
+            caption_sequence_names=MAPPING_CONF.CAPTION_SEQUENCE_NAMES,
+            openxml_formats=MAPPING_CONF.OPENXML_FORMATS,
+            w_tags=MAPPING_CONF.W_TAGS,
+            start_chapter=self.start_chapter,
+        )
+
+    def apply_edit_plan(self, plan: list[dict]) -> int:
+        """Execute an edit plan and collect its renumbered labels in label_map."""
+        return apply_edit_plan(
+            doc=self.doc,
+            plan=plan,
+            font_mapping=MAPPING_CONF.FONT_MAPPING,
+            w_tags=MAPPING_CONF.W_TAGS,
+            label_map=self.label_map,
+        )
+
+    def slim_xml(self) -> dict[str, int]:
+        """
+        Strip rsids, proofing marks and dead bookmarks from the document,
+        header and footer parts when enabled by document_setup.slim_xml.
+        Returns the size and element count report.
+        """
+        if not self.config.document_setup.get("slim_xml", False):
+            return {}
 
-    def apply_all_styles(self):
-        self.clean_paragraphs()
-        self.apply_paragraph_styles()
-        self.apply_chapter_section_styles()
-        self.apply_table_figure_styles()
-        self.apply_source_styles()
-        self.apply_list_styles()
-        self.apply_header_footer_styles()
-        self.apply_nested_styling()
+        slimming_report = apply_xml_slimming(
+            doc=self.doc,
+            w_tags=MAPPING_CONF.W_TAGS,
+            openxml_formats=MAPPING_CONF.OPENXML_FORMATS,
+        )
+        self.normalization_report.update(slimming_report)
+        return slimming_report
+
+    def normalize_runs(self) -> int:
+        """
+        Merge adjacent runs with identical formatting so later phases
+        operate on fewer elements. Returns the number of runs removed.
+        """
+        runs_removed = apply_run_coalescing(doc=self.doc, w_tags=MAPPING_CONF.W_TAGS)
+        self.normalization_report["runs_removed"] = runs_removed
+        return runs_removed
+
+    def apply_reference_template(self) -> dict[str, str]:
+        """
+        Merge the styles, numbering, theme and font table of the reference document
+        given by document_setup.reference_template. The template is read once per
+        file. Returns the template style ids mapped to the document's style ids.
+        """
+        template_path = self.config.document_setup.get("reference_template")
+        if not template_path:
+            return {}
+        return import_reference_template(
+            doc=self.doc, reference_template=load_reference_template(template_path)
+        )
+
+    def apply_document_setup(self) -> int:
+        """
+        Apply page_size, orientation and margins to every section and write
+        default_font into the document defaults. Returns the number of sections updated.
+        """
+        document_setup = self.config.document_setup
+        apply_default_font(
+            doc=self.doc, default_font=document_setup.get("default_font") or {}
+        )
+        return apply_page_setup(
+            doc=self.doc,
+            document_setup=document_setup,
+            page_sizes=MAPPING_CONF.PAGE_SIZES,
+        )
 
     def apply_paragraph_styles(self):
         """Apply paragraph styles from the configuration."""
@@ -43,8 +404,8 @@ class DocumentFormattingAgent:
             paragraph_format_mapping=MAPPING_CONF.PARAGRAPH_FORMAT_MAPPING,
         )
 
-    def apply_chapter_section_styles(self):
-        """Apply chapter and section styles from the configuration."""
+    def apply_chapter_section_style_definitions(self):
+        """Apply chapter and section style definitions to styles.xml."""
         apply_docx_style_definitions(
             doc=self.doc,
             style_definitions=self.config.chapter_and_section_rules,
@@ -53,11 +414,53 @@ class DocumentFormattingAgent:
             paragraph_format_mapping=MAPPING_CONF.PARAGRAPH_FORMAT_MAPPING,
         )
 
+    def apply_numbering_definitions(self) -> int | None:
+        """
+        Write the definitions the configured numbering relies on to styles.xml and
+        numbering.xml: the heading list of native_heading_numbering and the chapter
+        outline level read by caption_field_numbering's fields. Body phases then only
+        number paragraphs, so they can run on parts of the body.
+        Returns the numId of the heading list, if any.
+        """
+        document_setup = self.config.document_setup
+        if document_setup.get("caption_field_numbering", False):
+            apply_chapter_outline_level(
+                doc=self.doc, style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING
+            )
+        if not document_setup.get("native_heading_numbering", False):
+            return None
+
+        return apply_heading_list_definition(
+            doc=self.doc,
+            style_definitions=self.config.chapter_and_section_rules,
+            style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+            style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+            heading_level_styles=MAPPING_CONF.HEADING_LEVEL_STYLES,
+            word_number_formats=MAPPING_CONF.WORD_NUMBER_FORMATS,
+            separator_suffixes=MAPPING_CONF.NUMBERING_SEPARATOR_SUFFIXES,
+        )
+
+    def apply_chapter_section_numbering(self):
+        """Apply chapter and section numbering to title paragraphs."""
         refactor_section_numbering = self.config.document_setup.get(
             "refactor_section_numbering", False
         )
+        native_heading_numbering = self.config.document_setup.get(
+            "native_heading_numbering", False
+        )
 
-        if refactor_section_numbering:
+        if native_heading_numbering:
+            apply_native_heading_numbering(
+                doc=self.doc,
+                style_definitions=self.config.chapter_and_section_rules,
+                style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+                style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+                heading_level_styles=MAPPING_CONF.HEADING_LEVEL_STYLES,
+                word_number_formats=MAPPING_CONF.WORD_NUMBER_FORMATS,
+                separator_suffixes=MAPPING_CONF.NUMBERING_SEPARATOR_SUFFIXES,
+                renumbering_regex=MAPPING_CONF.RENUMBERING_REGEX,
+            )
+        elif refactor_section_numbering:
             apply_section_numbering_order(
                 doc=self.doc,
                 style_definitions=self.config.chapter_and_section_rules,
@@ -65,6 +468,9 @@ class DocumentFormattingAgent:
                 style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
                 chapter_section_numbering_regex=MAPPING_CONF.CHAPTER_SECTION_NUMBERING_REGEX,
                 renumbering_regex=MAPPING_CONF.RENUMBERING_REGEX,
+                start_chapter=self.start_chapter,
+                label_map=self.label_map,
+                heading_level_styles=MAPPING_CONF.HEADING_LEVEL_STYLES,
             )
         else:
             apply_chapter_section_numbering_format(
@@ -75,8 +481,43 @@ class DocumentFormattingAgent:
                 renumbering_regex=MAPPING_CONF.RENUMBERING_REGEX,
             )
 
-    def apply_table_figure_styles(self):
-        """Apply table and figure title styles from the configuration."""
+    def apply_outline_numbering(self):
+        """
+        Number chapter, section, table and figure titles with text. Heading and
+        caption numbers are computed in a single pass over the body paragraphs;
+        native heading numbering, numbering format conversion and caption fields
+        are the apply_chapter_section_numbering and apply_caption_field_numbering
+        phases.
+        """
+        document_setup = self.config.document_setup
+        native_heading_numbering = document_setup.get("native_heading_numbering", False)
+        refactor_section_numbering = document_setup.get(
+            "refactor_section_numbering", False
+        )
+        caption_field_numbering = document_setup.get("caption_field_numbering", False)
+
+        chapter_rules = self.config.chapter_and_section_rules
+        apply_outline_numbering(
+            doc=self.doc,
+            style_definitions=chapter_rules,
+            style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+            style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+            heading_level_styles=MAPPING_CONF.HEADING_LEVEL_STYLES,
+            caption_styles=[
+                style_key
+                for style_key in MAPPING_CONF.CAPTION_SEQUENCE_NAMES
+                if style_key in chapter_rules
+            ],
+            chapter_section_numbering_regex=MAPPING_CONF.CHAPTER_SECTION_NUMBERING_REGEX,
+            renumbering_regex=MAPPING_CONF.RENUMBERING_REGEX,
+            start_chapter=self.start_chapter,
+            label_map=self.label_map,
+            number_headings=refactor_section_numbering and not native_heading_numbering,
+            number_captions=not caption_field_numbering,
+        )
+
+    def apply_table_figure_style_definitions(self):
+        """Apply table and figure title style definitions without numbering."""
         apply_table_figure_styles(
             doc=self.doc,
             config=self.config,
@@ -86,6 +527,80 @@ class DocumentFormattingAgent:
             style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
             chapter_section_numbering_regex=MAPPING_CONF.CHAPTER_SECTION_NUMBERING_REGEX,
             renumbering_regex=MAPPING_CONF.RENUMBERING_REGEX,
+            apply_numbering=False,
+        )
+
+    def apply_object_captions(self) -> int:
+        """
+        Give the paragraphs directly around tables and figures their caption and
+        source styles when enabled by document_setup.detect_object_captions.
+        Returns the number of paragraphs restyled.
+        """
+        if not self.config.document_setup.get("detect_object_captions", False):
+            return 0
+
+        return apply_object_caption_styles(
+            doc=self.doc,
+            config=self.config,
+            style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+            style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+            caption_sequence_names=MAPPING_CONF.CAPTION_SEQUENCE_NAMES,
+            w_tags=MAPPING_CONF.W_TAGS,
+        )
+
+    def apply_table_styles(self) -> int:
+        """
+        Format tables through one table style generated from table_rules.
+        Returns the number of tables styled.
+        """
+        return apply_table_styles(
+            doc=self.doc,
+            table_rules=self.config.table_rules,
+            style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+            style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+            font_mapping=MAPPING_CONF.FONT_MAPPING,
+            paragraph_format_mapping=MAPPING_CONF.PARAGRAPH_FORMAT_MAPPING,
+            w_tags=MAPPING_CONF.W_TAGS,
+        )
+
+    def apply_caption_field_numbering(self):
+        """Number table and figure titles with Word SEQ fields."""
+        apply_caption_field_numbering(
+            doc=self.doc,
+            style_definitions=self.config.chapter_and_section_rules,
+            style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+            style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+            caption_sequence_names=MAPPING_CONF.CAPTION_SEQUENCE_NAMES,
+            field_number_formats=MAPPING_CONF.FIELD_NUMBER_FORMATS,
+            renumbering_regex=MAPPING_CONF.RENUMBERING_REGEX,
+            use_chapter_field=self.config.document_setup.get(
+                "native_heading_numbering", False
+            ),
+            start_chapter=self.start_chapter,
+            label_map=self.label_map,
+        )
+
+    def update_cross_references(self) -> int:
+        """
+        Rewrite body references to labels changed by the numbering passes when
+        enabled by document_setup.update_cross_references.
+        Returns the number of references rewritten.
+        """
+        if not self.config.document_setup.get("update_cross_references", False):
+            return 0
+
+        numbered_style_names = {
+            MAPPING_CONF.STYLE_NAMES_MAPPING[style_key]
+            for style_key in [
+                *MAPPING_CONF.HEADING_LEVEL_STYLES,
+                *MAPPING_CONF.CAPTION_SEQUENCE_NAMES,
+            ]
+        }
+        return apply_cross_reference_updates(
+            doc=self.doc,
+            label_map=self.label_map,
+            skip_style_names=numbered_style_names,
+            w_tags=MAPPING_CONF.W_TAGS,
         )
 
     def apply_source_styles(self):
@@ -98,8 +613,8 @@ class DocumentFormattingAgent:
             paragraph_format_mapping=MAPPING_CONF.PARAGRAPH_FORMAT_MAPPING,
         )
 
-    def apply_list_styles(self):
-        """Apply bullet list rules from the configuration."""
+    def apply_bullet_definitions(self):
+        """Apply bullet characters and indentation to numbering.xml."""
         apply_bullet_character_updates(
             doc=self.doc,
             list_config=self.config.list_rules,
@@ -108,13 +623,35 @@ class DocumentFormattingAgent:
             default_nested_config=MAPPING_CONF.DEFAULT_NESTED_LEVEL_CONFIG,
             default_indentation=MAPPING_CONF.DEFAULT_BULLET_LIST_INDENTATION,
         )
+
+    def apply_chapter_page_breaks(self):
+        """Start each block of chapter titles on a new page."""
         apply_chapter_page_breaks(
             doc=self.doc, style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING
         )
+
+    def apply_list_terminations(self):
+        """Apply list termination characters to list paragraphs."""
         apply_list_termination_characters(
             doc=self.doc, list_config=self.config.list_rules, w_tags=MAPPING_CONF.W_TAGS
         )
 
+    def apply_formula_rules(self) -> int:
+        """
+        Number display equations and style their description lists from formula_rules.
+        Returns the number of numbered equations.
+        """
+        return apply_formula_rules(
+            doc=self.doc,
+            formula_rules=self.config.formula_rules,
+            style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+            style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+            font_mapping=MAPPING_CONF.FONT_MAPPING,
+            paragraph_format_mapping=MAPPING_CONF.PARAGRAPH_FORMAT_MAPPING,
+            w_tags=MAPPING_CONF.W_TAGS,
+            start_chapter=self.start_chapter,
+        )
+
     def apply_header_footer_styles(self):
         """Apply header and footer styles from the configuration."""
         apply_header_footer_to_all_sections(
@@ -128,6 +665,17 @@ class DocumentFormattingAgent:
 
     def apply_nested_styling(self):
         """Apply nested styling to paragraphs with common_pattern_format font formatting."""
+        apply_nested_styling_to_paragraphs(
+            doc=self.doc,
+            style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+            font_mapping=MAPPING_CONF.FONT_MAPPING,
+            style_definitions=self._get_nested_style_definitions(),
+            style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+            w_tags=MAPPING_CONF.W_TAGS,
+        )
+
+    def _get_nested_style_definitions(self) -> dict:
+        """Collect the style definitions that can carry nested styling rules."""
         all_style_definitions = {}
         all_style_definitions.update(self.config.chapter_and_section_rules)
         all_style_definitions.update(self.config.source_rules)
@@ -138,11 +686,13 @@ class DocumentFormattingAgent:
         if hasattr(self.config, 'figure_rules') and self.config.figure_rules:
             all_style_definitions.update(self.config.figure_rules)
 
-        apply_nested_styling_to_paragraphs(
-            doc=self.doc,
+        return all_style_definitions
+
+    def _get_nested_styling_rules(self) -> dict:
+        """Return the nested styling rules per style name."""
+        return get_nested_styling_rules(
             style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
-            font_mapping=MAPPING_CONF.FONT_MAPPING,
-            style_definitions=all_style_definitions,
+            style_definitions=self._get_nested_style_definitions(),
             style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
         )
 
@@ -152,8 +702,22 @@ class DocumentFormattingAgent:
         trim spaces and remove empty paragraphs.
         """
         trim_spaces = self.config.document_setup.get("trim_spaces", True)
-        for paragraph in self.doc.paragraphs[:]:
-            apply_paragraph_cleaning(paragraph=paragraph, trim_spaces=trim_spaces)
+        for paragraph in self.doc.paragraphs:
+            view = ParagraphView(paragraph, MAPPING_CONF.W_TAGS)
+            apply_paragraph_cleaning(paragraph=view, trim_spaces=trim_spaces)
             apply_empty_paragraph_removal(
-                paragraph=paragraph, openxml_formats=MAPPING_CONF.OPENXML_FORMATS
+                paragraph=view, openxml_formats=MAPPING_CONF.OPENXML_FORMATS
             )
+
+    def apply_adjustments(self) -> int:
+        """
+        Apply the find-and-replace rules from adjustment_rules to the body text.
+        Returns the number of replacements made.
+        """
+        replacements_count = apply_adjustment_rules(
+            doc=self.doc,
+            adjustment_rules=self.config.adjustment_rules,
+            w_tags=MAPPING_CONF.W_TAGS,
+        )
+        self.normalization_report["adjustments_applied"] = replacements_count
+        return replacements_count
@@ -0,0 +1,257 @@
+import copy
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+import docx
+from docx.document import Document
+from docx.oxml.parser import parse_xml
+from lxml import etree
+
+import config as MAPPING_CONF
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+from styling_utils import build_outline_rules
+
+_WORKER_STATE: dict[str, object] = {}
+
+# Phases run once before the body is split: run cleanup and the styles, numbering,
+# header and footer parts
+PACKAGE_PHASE_NAMES = (
+    "slim_xml",
+    "normalize_runs",
+    "apply_reference_template",
+    "apply_document_setup",
+    "apply_paragraph_styles",
+    "apply_chapter_section_style_definitions",
+    "apply_table_figure_style_definitions",
+    "apply_numbering_definitions",
+    "apply_source_styles",
+    "apply_bullet_definitions",
+    "apply_header_footer_styles",
+)
+# Phases run per chapter shard
+SHARD_PHASE_NAMES = (
+    "clean_paragraphs",
+    "apply_adjustments",
+    "apply_chapter_section_numbering",
+    "apply_caption_field_numbering",
+    "apply_outline_numbering",
+    "apply_chapter_page_breaks",
+    "apply_list_terminations",
+    "apply_nested_styling",
+)
+# Phases run on the stitched body
+STITCHED_PHASE_NAMES = (
+    "update_cross_references",
+    "apply_formula_rules",
+    "apply_table_styles",
+)
+
+
+def format_document_by_chapters(
+    doc: Document,
+    config: DocumentFormatterConfig,
+    max_workers: int | None = None,
+) -> None:
+    """
+    Format a document in place, splitting its body into chapter shards that are
+    formatted in a process pool and stitched back in document order.
+
+    Phases that touch styles, numbering, header and footer parts run once in this
+    process before the body is split, so shards number their paragraphs against the
+    same list definitions; only body phases run per shard. Formula numbering runs on
+    the stitched body, as equation numbers can run through the whole document, and
+    so does the table style assignment, as it writes the table style to styles.xml.
+
+    Shards only know the number of chapters before them, so documents numbering
+    headings or captions through chapters (restart_level 0) are formatted
+    sequentially instead.
+    """
+    agent = DocumentFormattingAgent(doc, config)
+    if has_document_wide_numbering(config):
+        agent.apply_all_styles()
+        return
+
+    agent.apply_object_captions()
+    agent.apply_phases(PACKAGE_PHASE_NAMES)
+
+    shards = split_body_into_chapter_shards(
+        doc, MAPPING_CONF.STYLE_NAMES_MAPPING, MAPPING_CONF.W_TAGS
+    )
+
+    _WORKER_STATE["source_document"] = doc
+    fork_available = "fork" in multiprocessing.get_all_start_methods()
+    mp_context = multiprocessing.get_context("fork") if fork_available else None
+    source_blob = b"" if fork_available else _save_to_bytes(doc)
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_initialize_worker,
+            initargs=(source_blob,),
+        ) as executor:
+            futures = [
+                executor.submit(_format_body_shard, config, start, end, start_chapter)
+                for start, end, start_chapter in shards
+            ]
+            shard_results = [future.result() for future in futures]
+    finally:
+        _WORKER_STATE.clear()
+
+    _replace_body_children(doc, [shard_xml for shard_xml, _ in shard_results])
+    for _, shard_label_map in shard_results:
+        agent.label_map.update(shard_label_map)
+    agent.apply_phases(STITCHED_PHASE_NAMES)
+
+
+def has_document_wide_numbering(config: DocumentFormatterConfig) -> bool:
+    """
+    Return True if a heading below chapter level or a caption style is numbered
+    through the whole document, i.e. its counter does not restart at each chapter.
+    """
+    chapter_rules = config.chapter_and_section_rules
+    outline_rules = build_outline_rules(
+        chapter_rules,
+        MAPPING_CONF.STYLE_NAMES_MAPPING,
+        MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+        MAPPING_CONF.HEADING_LEVEL_STYLES,
+        [
+            style_key
+            for style_key in MAPPING_CONF.CAPTION_SEQUENCE_NAMES
+            if style_key in chapter_rules
+        ],
+    )
+    restart_levels = outline_rules["restart_levels"]
+    return any(
+        level > 1 and restart_levels[level - 1] == 0
+        for level in outline_rules["heading_levels"].values()
+    ) or any(
+        restart_level == 0
+        for _, restart_level in outline_rules["caption_styles"].values()
+    )
+
+
+def split_body_into_chapter_shards(
+    doc: Document, style_names_mapping: dict[str, str], w_tags: dict[str, str]
+) -> list[tuple[int, int, int]]:
+    """
+    Split the body children at the first paragraph of each 'chapter_titles' block.
+    Returns (start, end, start_chapter) tuples, where start_chapter is the number
+    of chapters preceding the shard.
+    """
+    chapter_style_ids = {
+        style.style_id
+        for style in doc.styles
+        if style.name == style_names_mapping["chapter_titles"]
+    }
+    body_children = _get_body_content_children(doc, w_tags)
+
+    shard_starts = [(0, 0)]
+    chapters_seen = 0
+    previous_is_chapter = False
+    for index, child in enumerate(body_children):
+        if child.tag != w_tags["p"]:
+            continue
+
+        is_chapter = _get_paragraph_style_id(child, w_tags) in chapter_style_ids
+        if is_chapter and not previous_is_chapter:
+            if index > 0:
+                shard_starts.append((index, chapters_seen))
+            chapters_seen += 1
+        previous_is_chapter = is_chapter
+
+    shard_ends = [start for start, _ in shard_starts[1:]] + [len(body_children)]
+
+    return [
+        (start, end, start_chapter)
+        for (start, start_chapter), end in zip(shard_starts, shard_ends)
+    ]
+
+
+def _get_paragraph_style_id(
+    p_element: etree._Element, w_tags: dict[str, str]
+) -> str | None:
+    """Read the paragraph style id directly from w:pPr/w:pStyle."""
+    p_pr = p_element.find(w_tags["pPr"])
+    if p_pr is None:
+        return None
+    p_style = p_pr.find(w_tags["pStyle"])
+    return p_style.get(w_tags["val"]) if p_style is not None else None
+
+
+def _get_body_content_children(
+    doc: Document, w_tags: dict[str, str]
+) -> list[etree._Element]:
+    """Return the body children except the trailing section properties."""
+    return [child for child in doc.element.body if child.tag != w_tags["sectPr"]]
+
+
+def _replace_body_children(doc: Document, formatted_shards: list[list[bytes]]) -> None:
+    """Replace the body content with the formatted shard elements in order."""
+    body = doc.element.body
+    for child in _get_body_content_children(doc, MAPPING_CONF.W_TAGS):
+        body.remove(child)
+
+    sect_pr = body.find(MAPPING_CONF.W_TAGS["sectPr"])
+    for shard in formatted_shards:
+        for element_xml in shard:
+            element = parse_xml(element_xml)
+            if sect_pr is not None:
+                sect_pr.addprevious(element)
+            else:
+                body.append(element)
+
+
+def _save_to_bytes(doc: Document) -> bytes:
+    """Serialize the document for workers that cannot inherit it via fork."""
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _initialize_worker(source_blob: bytes) -> None:
+    """
+    Detach the original body children once per worker, so each shard can be
+    formatted on a body that only holds its own elements.
+    """
+    if "source_document" not in _WORKER_STATE:
+        _WORKER_STATE["source_document"] = docx.Document(BytesIO(source_blob))
+
+    doc = _WORKER_STATE["source_document"]
+    body_children = _get_body_content_children(doc, MAPPING_CONF.W_TAGS)
+    for child in body_children:
+        doc.element.body.remove(child)
+    _WORKER_STATE["body_children"] = body_children
+
+
+def _format_body_shard(
+    config: DocumentFormatterConfig, start: int, end: int, start_chapter: int
+) -> tuple[list[bytes], dict[str, str]]:
+    """
+    Format body children [start, end) and return them serialized, together with
+    the labels changed by numbering so references can be rewritten document-wide.
+    """
+    doc = _WORKER_STATE["source_document"]
+    body = doc.element.body
+
+    for child in _get_body_content_children(doc, MAPPING_CONF.W_TAGS):
+        body.remove(child)
+
+    sect_pr = body.find(MAPPING_CONF.W_TAGS["sectPr"])
+    for child in _WORKER_STATE["body_children"][start:end]:
+        shard_child = copy.deepcopy(child)
+        if sect_pr is not None:
+            sect_pr.addprevious(shard_child)
+        else:
+            body.append(shard_child)
+
+    agent = DocumentFormattingAgent(doc, config, start_chapter=start_chapter)
+    agent.apply_phases(SHARD_PHASE_NAMES)
+
+    shard_xml = [
+        etree.tostring(child)
+        for child in _get_body_content_children(doc, MAPPING_CONF.W_TAGS)
+    ]
+    return shard_xml, agent.label_map
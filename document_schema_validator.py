@@ -0,0 +1,358 @@
+import hashlib
+import json
+import threading
+from typing import Any, Callable
+
+MAX_SCHEMA_OBJECTS = 64
+
+SUPPORTED_KEYWORDS = {
+    "$ref",
+    "type",
+    "allOf",
+    "enum",
+    "properties",
+    "additionalProperties",
+    "required",
+    "items",
+    "pattern",
+    "minLength",
+    "minimum",
+    "maximum",
+}
+
+# Keywords that do not constrain the instance
+ANNOTATION_KEYWORDS = {
+    "$schema",
+    "$id",
+    "$defs",
+    "$comment",
+    "title",
+    "description",
+    "default",
+    "examples",
+}
+
+TYPE_CHECKS = {
+    "object": "isinstance({0}, dict)",
+    "array": "isinstance({0}, list)",
+    "string": "isinstance({0}, str)",
+    "boolean": "isinstance({0}, bool)",
+    "null": "{0} is None",
+    # As in jsonschema, a float with no fractional part (1.0) is an integer
+    "integer": "((isinstance({0}, int) and not isinstance({0}, bool))"
+    " or (isinstance({0}, float) and {0}.is_integer()))",
+    "number": "(isinstance({0}, (int, float)) and not isinstance({0}, bool))",
+}
+
+_VALIDATORS: dict[str, "SchemaValidator"] = {}
+# Validators by id() of the schema dict they were last requested with, so a schema
+# loaded once is not re-hashed per config; the dict is kept to pin its id
+_VALIDATORS_BY_ID: dict[int, tuple[dict, "SchemaValidator"]] = {}
+_VALIDATORS_LOCK = threading.Lock()
+
+
+class UnsupportedSchemaError(ValueError):
+    """A schema uses a keyword the validator compiler does not generate code for."""
+
+
+class SchemaValidator:
+    """
+    Validator of one style config schema. The schema is compiled into a Python
+    function with every check of the instance spelled out and every $ref turned into
+    a call to the function generated for its target, so validating a config does not
+    interpret the schema.
+
+    The generated function only tells whether a config is valid; for an invalid
+    config the error is taken from jsonschema, so messages match validate().
+    Schemas using keywords the compiler does not support are validated by jsonschema.
+    """
+
+    def __init__(self, style_schema: dict, schema_key: str, source: str | None):
+        self.style_schema = style_schema
+        self.schema_key = schema_key
+        self.source = source
+        self._is_valid: Callable[[Any], bool] | None = None
+        if source is not None:
+            namespace: dict[str, Any] = {}
+            exec(
+                compile(source, f"<schema-validator-{schema_key[:12]}>", "exec"),
+                namespace,
+            )
+            self._is_valid = namespace["is_valid"]
+        self._jsonschema_validator = None
+
+    def validate(self, instance: Any) -> None:
+        """Raise ValueError("YAML validation error: ...") if instance is invalid."""
+        if self._is_valid is not None and self._is_valid(instance):
+            return
+
+        # jsonschema is only imported for invalid configs and unsupported schemas
+        from jsonschema.exceptions import best_match
+
+        error = best_match(self._get_jsonschema_validator().iter_errors(instance))
+        if error is not None:
+            raise ValueError(f"YAML validation error: {error.message}") from error
+
+    def _get_jsonschema_validator(self):
+        """Build the jsonschema validator on first use; valid configs never need it."""
+        if self._jsonschema_validator is None:
+            from jsonschema.validators import validator_for
+
+            validator_class = validator_for(self.style_schema)
+            self._jsonschema_validator = validator_class(self.style_schema)
+        return self._jsonschema_validator
+
+
+def get_schema_validator(style_schema: dict) -> SchemaValidator:
+    """
+    Return the validator of a schema, compiled once per process; a schema dict must
+    not be changed once validated against. The generated code only lives in
+    memory: nothing is written to or executed from disk.
+    """
+    with _VALIDATORS_LOCK:
+        schema, validator = _VALIDATORS_BY_ID.get(id(style_schema), (None, None))
+    if schema is style_schema:
+        return validator
+
+    schema_key = get_schema_key(style_schema)
+    with _VALIDATORS_LOCK:
+        validator = _VALIDATORS.get(schema_key)
+    if validator is not None:
+        return _remember_schema(style_schema, validator)
+
+    from jsonschema.validators import validator_for
+
+    # As validate() does, reject a schema that is not valid JSON Schema
+    validator_for(style_schema).check_schema(style_schema)
+    try:
+        source = compile_schema_validator(style_schema)
+    except UnsupportedSchemaError:
+        source = None
+
+    validator = SchemaValidator(style_schema, schema_key, source)
+    with _VALIDATORS_LOCK:
+        validator = _VALIDATORS.setdefault(schema_key, validator)
+    return _remember_schema(style_schema, validator)
+
+
+def get_schema_key(style_schema: dict) -> str:
+    """Return the hash of a schema."""
+    schema_json = json.dumps(style_schema, sort_keys=True, default=str)
+    return hashlib.sha256(schema_json.encode()).hexdigest()
+
+
+def compile_schema_validator(style_schema: dict) -> str:
+    """
+    Generate the Python source of is_valid(instance) -> bool for a schema.
+    Supports type, properties, additionalProperties, required, items, allOf, enum
+    (of strings), pattern, minLength, minimum, maximum and local $refs; raises
+    UnsupportedSchemaError for any other keyword.
+    """
+    return _ValidatorCompiler(style_schema).compile()
+
+
+class _ValidatorCompiler:
+    """Emits one function per $ref target and inlines every other subschema."""
+
+    def __init__(self, root_schema: dict):
+        self.root_schema = root_schema
+        self.function_names: dict[str, str] = {}
+        self.pending_refs: list[str] = []
+        self.constants: dict[str, str] = {}
+        self.variable_count = 0
+
+    def compile(self) -> str:
+        functions = [self._compile_function("_check_root", self.root_schema)]
+        while self.pending_refs:
+            ref = self.pending_refs.pop()
+            functions.append(
+                self._compile_function(self.function_names[ref], self._resolve(ref))
+            )
+
+        return "\n".join(
+            [
+                "# Generated by document_schema_validator from the style config schema",
+                "import re",
+                "",
+                *(
+                    f"{name} = {definition}"
+                    for definition, name in self.constants.items()
+                ),
+                "",
+                *functions,
+                "is_valid = _check_root",
+                "",
+            ]
+        )
+
+    def _compile_function(self, name: str, schema: dict | bool) -> str:
+        body = self._emit(schema, "value", 1)
+        return "\n".join([f"def {name}(value):", *body, "    return True", ""])
+
+    def _emit(self, schema: dict | bool, var: str, depth: int) -> list[str]:
+        """Return the lines checking var against schema, returning False on failure."""
+        indent = "    " * depth
+        if schema is True:
+            return []
+        if schema is False:
+            return [f"{indent}return False"]
+
+        unsupported = set(schema) - ANNOTATION_KEYWORDS - SUPPORTED_KEYWORDS
+        if unsupported:
+            raise UnsupportedSchemaError(f"Unsupported keywords: {sorted(unsupported)}")
+
+        lines: list[str] = []
+        ref = schema.get("$ref")
+        if ref is not None:
+            lines.append(f"{indent}if not {self._get_function_name(ref)}({var}):")
+            lines.append(f"{indent}    return False")
+
+        types = schema.get("type")
+        if types is not None:
+            types = [types] if isinstance(types, str) else types
+            checks = " or ".join(TYPE_CHECKS[type_].format(var) for type_ in types)
+            lines.append(f"{indent}if not ({checks}):")
+            lines.append(f"{indent}    return False")
+
+        for sub_schema in schema.get("allOf", []):
+            lines.extend(self._emit(sub_schema, var, depth))
+
+        if "enum" in schema:
+            if not all(isinstance(item, str) for item in schema["enum"]):
+                raise UnsupportedSchemaError("Only enums of strings are supported")
+            values = self._add_constant("frozenset", repr(sorted(schema["enum"])))
+            lines.append(
+                f"{indent}if not (isinstance({var}, str) and {var} in {values}):"
+            )
+            lines.append(f"{indent}    return False")
+
+        lines.extend(self._emit_guarded(types, "object", var, depth, schema))
+        lines.extend(self._emit_guarded(types, "array", var, depth, schema))
+        lines.extend(self._emit_guarded(types, "string", var, depth, schema))
+        lines.extend(self._emit_guarded(types, "number", var, depth, schema))
+        return lines
+
+    def _emit_guarded(
+        self, types: list[str] | None, type_: str, var: str, depth: int, schema: dict
+    ) -> list[str]:
+        """
+        Emit the keywords of one instance type, which jsonschema ignores for
+        instances of other types; the type test is skipped when "type" enforces it.
+        """
+        emit_keywords = {
+            "object": self._emit_object_keywords,
+            "array": self._emit_array_keywords,
+            "string": self._emit_string_keywords,
+            "number": self._emit_number_keywords,
+        }[type_]
+        if types == [type_] or (type_ == "number" and types == ["integer"]):
+            return emit_keywords(schema, var, depth)
+
+        body = emit_keywords(schema, var, depth + 1)
+        if not body:
+            return []
+        check = TYPE_CHECKS[type_].format(var)
+        return ["    " * depth + f"if {check}:", *body]
+
+    def _emit_object_keywords(self, schema: dict, var: str, depth: int) -> list[str]:
+        indent = "    " * depth
+        lines: list[str] = []
+        required = schema.get("required")
+        if required:
+            names = self._add_constant("frozenset", repr(sorted(required)))
+            lines.append(f"{indent}if not {names} <= {var}.keys():")
+            lines.append(f"{indent}    return False")
+
+        properties = schema.get("properties", {})
+        for name, sub_schema in properties.items():
+            item = self._new_variable()
+            body = self._emit(sub_schema, item, depth + 1)
+            if body:
+                lines.append(f"{indent}if {name!r} in {var}:")
+                lines.append(f"{indent}    {item} = {var}[{name!r}]")
+                lines.extend(body)
+
+        additional = schema.get("additionalProperties", True)
+        if additional is False:
+            names = self._add_constant("frozenset", repr(sorted(properties)))
+            lines.append(f"{indent}if not {var}.keys() <= {names}:")
+            lines.append(f"{indent}    return False")
+        elif additional is not True:
+            key, item = self._new_variable(), self._new_variable()
+            body = self._emit(additional, item, depth + 2)
+            if body:
+                names = self._add_constant("frozenset", repr(sorted(properties)))
+                lines.append(f"{indent}for {key}, {item} in {var}.items():")
+                lines.append(f"{indent}    if {key} not in {names}:")
+                lines.extend(body)
+        return lines
+
+    def _emit_array_keywords(self, schema: dict, var: str, depth: int) -> list[str]:
+        items = schema.get("items")
+        if items is None:
+            return []
+        item = self._new_variable()
+        body = self._emit(items, item, depth + 1)
+        return [f"{'    ' * depth}for {item} in {var}:", *body] if body else []
+
+    def _emit_string_keywords(self, schema: dict, var: str, depth: int) -> list[str]:
+        indent = "    " * depth
+        lines: list[str] = []
+        if "minLength" in schema:
+            lines.append(f"{indent}if len({var}) < {schema['minLength']!r}:")
+            lines.append(f"{indent}    return False")
+        if "pattern" in schema:
+            pattern = self._add_constant("re.compile", repr(schema["pattern"]))
+            lines.append(f"{indent}if not {pattern}.search({var}):")
+            lines.append(f"{indent}    return False")
+        return lines
+
+    def _emit_number_keywords(self, schema: dict, var: str, depth: int) -> list[str]:
+        indent = "    " * depth
+        lines: list[str] = []
+        if "minimum" in schema:
+            lines.append(f"{indent}if {var} < {schema['minimum']!r}:")
+            lines.append(f"{indent}    return False")
+        if "maximum" in schema:
+            lines.append(f"{indent}if {var} > {schema['maximum']!r}:")
+            lines.append(f"{indent}    return False")
+        return lines
+
+    def _get_function_name(self, ref: str) -> str:
+        """Return the function generated for a $ref target, queueing it if new."""
+        name = self.function_names.get(ref)
+        if name is None:
+            name = f"_check_{len(self.function_names)}"
+            self.function_names[ref] = name
+            self.pending_refs.append(ref)
+        return name
+
+    def _resolve(self, ref: str) -> dict | bool:
+        """Resolve a local JSON pointer $ref ("#/$defs/...") against the root."""
+        if not ref.startswith("#"):
+            raise UnsupportedSchemaError(f"Only local $refs are supported: {ref}")
+        target: Any = self.root_schema
+        for token in filter(None, ref[1:].split("/")):
+            target = target[token.replace("~1", "/").replace("~0", "~")]
+        return target
+
+    def _add_constant(self, constructor: str, value: str) -> str:
+        """Return the name of a module constant, shared by equal constants."""
+        definition = f"{constructor}({value})"
+        name = self.constants.get(definition)
+        if name is None:
+            name = self.constants[definition] = f"_CONSTANT_{len(self.constants)}"
+        return name
+
+    def _new_variable(self) -> str:
+        self.variable_count += 1
+        return f"value_{self.variable_count}"
+
+
+def _remember_schema(style_schema: dict, validator: SchemaValidator) -> SchemaValidator:
+    """Map a schema dict to its validator, bounded by the number of validators."""
+    with _VALIDATORS_LOCK:
+        if len(_VALIDATORS_BY_ID) >= MAX_SCHEMA_OBJECTS:
+            _VALIDATORS_BY_ID.clear()
+        _VALIDATORS_BY_ID[id(style_schema)] = (style_schema, validator)
+    return validator
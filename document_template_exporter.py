@@ -0,0 +1,128 @@
+import argparse
+import os
+import zipfile
+from io import BytesIO
+
+import docx
+from docx.document import Document
+from docx.opc.constants import NAMESPACE
+from lxml import etree
+
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+from paths import INPUT_DIR, OUTPUT_DIR, STYLE_CONFIG_FILENAME, STYLE_SCHEMA_FILENAME
+from styling_utils import add_missing_paragraph_styles
+
+TEMPLATE_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.template.main+xml"
+)
+CONTENT_TYPES_FILENAME = "[Content_Types].xml"
+
+# Phases writing the page setup and the styles and lists of the template
+TEMPLATE_PHASE_NAMES = (
+    "apply_document_setup",
+    "apply_paragraph_styles",
+    "apply_chapter_section_style_definitions",
+    "apply_table_figure_style_definitions",
+    "apply_source_styles",
+    "apply_table_styles",
+    "apply_numbering_definitions",
+)
+
+
+def export_reference_template(
+    config: DocumentFormatterConfig, output_path: str
+) -> None:
+    """
+    Compile a style config into a reference template: an empty document holding the
+    configured page setup, default font, paragraph, caption, source and table styles
+    and the heading list. Saved as a Word template when output_path ends in .dotx.
+
+    Documents can then take the house style with document_setup.reference_template
+    instead of applying the style definitions attribute by attribute.
+    """
+    doc = docx.Document()
+    add_missing_paragraph_styles(
+        doc,
+        [
+            *config.paragraph_styles,
+            *config.chapter_and_section_rules,
+            *config.source_rules,
+        ],
+    )
+
+    DocumentFormattingAgent(doc, config).apply_phases(TEMPLATE_PHASE_NAMES)
+
+    if output_path.lower().endswith(".dotx"):
+        save_as_template(doc, output_path)
+    else:
+        doc.save(output_path)
+
+
+def save_as_template(doc: Document, output_path: str) -> None:
+    """
+    Save a document as a Word template: the package is written as usual and the
+    content type of the main document part is then set to the template one in
+    [Content_Types].xml, the only difference between a .docx and a .dotx.
+    """
+    buffer = BytesIO()
+    doc.save(buffer)
+
+    with zipfile.ZipFile(buffer) as source:
+        items = [(item, source.read(item)) for item in source.infolist()]
+
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as target:
+        for item, data in items:
+            if item.filename == CONTENT_TYPES_FILENAME:
+                target.writestr(
+                    item,
+                    _set_part_content_type(
+                        data, doc.part.partname, TEMPLATE_CONTENT_TYPE
+                    ),
+                )
+            else:
+                target.writestr(item, data)
+
+
+def _set_part_content_type(
+    content_types_xml: bytes, partname: str, content_type: str
+) -> bytes:
+    """Set the content type override of a part in [Content_Types].xml."""
+    types = etree.fromstring(content_types_xml)
+    override_tag = f"{{{NAMESPACE.OPC_CONTENT_TYPES}}}Override"
+    for override in types.iter(override_tag):
+        if override.get("PartName") == partname:
+            override.set("ContentType", content_type)
+            break
+    else:
+        etree.SubElement(
+            types, override_tag, PartName=partname, ContentType=content_type
+        )
+    return etree.tostring(
+        types, xml_declaration=True, encoding="UTF-8", standalone=True
+    )
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Export a style config as a reference .dotx / .docx template."
+    )
+    parser.add_argument("--config", default=STYLE_CONFIG_FILENAME, help="Style config")
+    parser.add_argument("--config-dir", default=INPUT_DIR, help="Config directory")
+    parser.add_argument(
+        "--output",
+        default=os.path.join(OUTPUT_DIR, "reference_template.dotx"),
+        help="Output template path",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    formatter_config = DocumentFormatterConfig.load_and_validate_yaml(
+        input_dir=args.config_dir,
+        style_filename=args.config,
+        schema_filename=STYLE_SCHEMA_FILENAME,
+    )
+    export_reference_template(formatter_config, args.output)
+    print(args.output)
@@ -12,11 +12,42 @@ from .content.header_footer_styling_utils import (
     apply_header_footer_styles,
     apply_header_footer_to_all_sections,
 )
+from .core.conformance_utils import check_document_conformance
+from .core.edit_plan_utils import (
+    apply_edit_plan,
+    build_edit_plan,
+    build_paragraph_view,
+    plan_paragraph_edits,
+)
+from .core.paragraph_view_utils import (
+    ParagraphView,
+    as_paragraph_view,
+    get_paragraph_text,
+    read_numbering_properties,
+)
+from .core.phase_graph_utils import (
+    build_phase_graph,
+    group_phase_stages,
+    run_phase_stages,
+    select_phases,
+)
 from .core.style_appliers import (
     apply_docx_style_attributes,
     apply_docx_style_definitions,
     map_config_to_docx_attributes,
 )
+from .core.style_template_utils import (
+    add_missing_paragraph_styles,
+    import_reference_template,
+    load_reference_template,
+    read_reference_template,
+)
+from .formatting.adjustment_rules_utils import (
+    apply_adjustment_rules,
+    build_trie_regex,
+    compile_adjustment_rules,
+    extract_required_literal,
+)
 from .formatting.bullet_list_styling_utils import (
     analyze_list_structure,
     apply_bullet_character_updates,
@@ -31,33 +62,125 @@ from .formatting.chapter_section_styles_utils import (
     apply_chapter_section_numbering_format,
     apply_section_numbering_order,
 )
+from .formatting.cross_reference_utils import (
+    apply_cross_reference_updates,
+    compile_cross_reference_pattern,
+)
+from .formatting.formula_styling_utils import (
+    apply_formula_rules,
+    get_formula_number_template,
+    is_equation_paragraph,
+)
+from .formatting.page_setup_utils import (
+    apply_default_font,
+    apply_page_setup,
+    compile_page_setup,
+)
 from .formatting.paragraph_cleaning_utils import (
     apply_empty_paragraph_removal,
     apply_paragraph_cleaning,
     is_paragraph_empty,
 )
+from .formatting.run_coalescing_utils import (
+    apply_run_coalescing,
+    coalesce_paragraph_runs,
+)
 from .formatting.table_figure_titles_utils import (
+    apply_object_caption_styles,
     apply_source_styles,
+    apply_table_figure_numbering,
     apply_table_figure_styles,
 )
+from .formatting.table_styling_utils import (
+    apply_table_style_definition,
+    apply_table_styles,
+    compile_table_look,
+    has_table_style_rules,
+)
+from .formatting.xml_slimming_utils import (
+    apply_xml_slimming,
+    collect_referenced_bookmark_names,
+    slim_part_element,
+)
+from .numbering.caption_field_numbering_utils import (
+    apply_caption_field_numbering,
+    apply_chapter_outline_level,
+)
+from .numbering.document_index_utils import (
+    build_document_index,
+    build_object_index,
+    count_style_usage,
+    find_element_positions,
+    find_list_groups,
+    find_style_run_starts,
+)
+from .numbering.heading_list_numbering_utils import (
+    apply_heading_list_definition,
+    apply_native_heading_numbering,
+    build_heading_level_text,
+)
+from .numbering.number_formatters import (
+    compile_number_formatter,
+    format_number,
+    get_number_formatter,
+)
 from .numbering.numbering_utils import (
-    apply_chapter_based_numbering,
     apply_numbering_to_text,
+    number_caption_text,
     process_paragraph_text,
     remove_all_numbering,
     update_paragraph_numbering,
 )
-from .formatting.nested_styling_utils import apply_nested_styling_to_paragraphs
+from .numbering.outline_numbering_utils import (
+    advance_outline,
+    apply_chapter_based_numbering,
+    apply_outline_numbering,
+    build_outline_rules,
+    new_outline_state,
+)
+from .formatting.nested_styling_utils import (
+    apply_nested_styling_to_paragraphs,
+    build_pattern_text_parts,
+    get_nested_styling_rules,
+)
 
 __all__ = [
     # Core functionality
     "apply_docx_style_definitions",
     "apply_docx_style_attributes",
     "map_config_to_docx_attributes",
+    "check_document_conformance",
+    "apply_edit_plan",
+    "build_edit_plan",
+    "build_paragraph_view",
+    "get_paragraph_text",
+    "plan_paragraph_edits",
+    "ParagraphView",
+    "as_paragraph_view",
+    "read_numbering_properties",
+    "build_phase_graph",
+    "group_phase_stages",
+    "run_phase_stages",
+    "select_phases",
+    "load_reference_template",
+    "read_reference_template",
+    "import_reference_template",
+    "add_missing_paragraph_styles",
     # Formatting utilities
     "apply_paragraph_cleaning",
     "apply_empty_paragraph_removal",
     "is_paragraph_empty",
+    "apply_formula_rules",
+    "apply_page_setup",
+    "apply_default_font",
+    "compile_page_setup",
+    "get_formula_number_template",
+    "is_equation_paragraph",
+    "apply_run_coalescing",
+    "coalesce_paragraph_runs",
+    "apply_xml_slimming",
+    "collect_referenced_bookmark_names",
+    "slim_part_element",
     "apply_bullet_character_updates",
     "apply_list_termination_characters",
     "find_all_list_paragraphs",
@@ -66,14 +189,47 @@ __all__ = [
     "get_level_specific_config",
     "validate_bullet_list_config",
     "apply_table_figure_styles",
+    "apply_object_caption_styles",
     "apply_source_styles",
+    "apply_cross_reference_updates",
+    "compile_cross_reference_pattern",
+    "apply_adjustment_rules",
+    "build_trie_regex",
+    "compile_adjustment_rules",
+    "extract_required_literal",
+    "apply_table_figure_numbering",
+    "apply_table_styles",
+    "apply_table_style_definition",
+    "compile_table_look",
+    "has_table_style_rules",
     # Numbering utilities
     "remove_all_numbering",
     "apply_numbering_to_text",
     "process_paragraph_text",
     "update_paragraph_numbering",
     "apply_chapter_based_numbering",
+    "apply_chapter_outline_level",
+    "number_caption_text",
+    "apply_outline_numbering",
+    "build_outline_rules",
+    "new_outline_state",
+    "advance_outline",
+    "apply_caption_field_numbering",
+    "apply_heading_list_definition",
+    "apply_native_heading_numbering",
+    "build_heading_level_text",
+    "compile_number_formatter",
+    "format_number",
+    "get_number_formatter",
+    "build_document_index",
+    "count_style_usage",
+    "find_element_positions",
+    "build_object_index",
+    "find_list_groups",
+    "find_style_run_starts",
     "apply_nested_styling_to_paragraphs",
+    "build_pattern_text_parts",
+    "get_nested_styling_rules",
     "apply_chapter_page_breaks",
     "apply_chapter_section_numbering_format",
     "apply_section_numbering_order",
@@ -5,14 +5,56 @@ This module contains the fundamental style application functionality
 used throughout the document formatting system.
 """
 
+from .conformance_utils import check_document_conformance
+from .edit_plan_utils import (
+    apply_edit_plan,
+    build_edit_plan,
+    build_paragraph_view,
+    plan_paragraph_edits,
+)
+from .paragraph_view_utils import (
+    ParagraphView,
+    as_paragraph_view,
+    get_paragraph_text,
+    read_numbering_properties,
+)
+from .phase_graph_utils import (
+    build_phase_graph,
+    group_phase_stages,
+    run_phase_stages,
+    select_phases,
+)
 from .style_appliers import (
     apply_docx_style_attributes,
     apply_docx_style_definitions,
     map_config_to_docx_attributes,
 )
+from .style_template_utils import (
+    add_missing_paragraph_styles,
+    import_reference_template,
+    load_reference_template,
+    read_reference_template,
+)
 
 __all__ = [
+    "ParagraphView",
+    "add_missing_paragraph_styles",
     "apply_docx_style_attributes",
     "apply_docx_style_definitions",
+    "apply_edit_plan",
+    "as_paragraph_view",
+    "build_edit_plan",
+    "build_paragraph_view",
+    "build_phase_graph",
+    "check_document_conformance",
+    "get_paragraph_text",
+    "group_phase_stages",
+    "import_reference_template",
+    "load_reference_template",
     "map_config_to_docx_attributes",
+    "plan_paragraph_edits",
+    "read_numbering_properties",
+    "read_reference_template",
+    "run_phase_stages",
+    "select_phases",
 ]
@@ -0,0 +1,445 @@
+import posixpath
+import re
+import zipfile
+from typing import IO, Callable, Iterator
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import parse_xml
+from docx.shared import Length
+from docx.styles.style import BaseStyle
+from docx.styles.styles import Styles
+from lxml import etree
+
+from document_formatter_config import DocumentFormatterConfig
+
+from .edit_plan_utils import build_paragraph_view, plan_paragraph_edits
+
+DOCUMENT_PART = "word/document.xml"
+STYLES_PART = "word/styles.xml"
+DOCUMENT_RELS_PART = "word/_rels/document.xml.rels"
+LENGTH_TOLERANCE_EMU = 635  # one twip, the precision Word stores lengths with
+
+Violation = dict[str, str | int | None]
+
+
+def check_document_conformance(
+    docx_source: str | IO[bytes],
+    config: DocumentFormatterConfig,
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    paragraph_format_mapping: dict[str, tuple[str, Callable | None]],
+    chapter_section_numbering_regex: dict[str, str],
+    renumbering_regex: dict[str, str],
+    heading_level_styles: list[str],
+    caption_sequence_names: dict[str, str],
+    field_mappings: list[tuple[str, str]],
+    openxml_formats: dict[str, str],
+    w_tags: dict[str, str],
+) -> list[Violation]:
+    """
+    Check a .docx against the style config without modifying or saving it.
+
+    Reports style definitions that differ from paragraph_styles, chapter_and_section_rules
+    and source_rules, every body edit the formatter would plan (spacing, empty
+    paragraphs, heading and caption numbers, chapter page breaks, list termination
+    characters) and missing header/footer content.
+    document.xml is read in one streaming pass and processed paragraphs are freed; only
+    the styles, relationships and header/footer parts are parsed whole.
+    Each violation holds rule, part, paragraph (index in doc.paragraphs), style,
+    expected and actual.
+    """
+    with zipfile.ZipFile(docx_source) as package:
+        styles = Styles(parse_xml(package.read(STYLES_PART)))
+
+        style_definitions = {
+            **config.paragraph_styles,
+            **config.chapter_and_section_rules,
+            **config.source_rules,
+        }
+        violations = _check_style_definitions(
+            styles,
+            style_definitions,
+            style_attributes_names_mapping,
+            font_mapping,
+            paragraph_format_mapping,
+        )
+
+        with package.open(DOCUMENT_PART) as document_xml:
+            section_references = _check_body_paragraphs(
+                document_xml,
+                styles,
+                config,
+                style_names_mapping,
+                style_attributes_names_mapping,
+                chapter_section_numbering_regex,
+                renumbering_regex,
+                heading_level_styles,
+                caption_sequence_names,
+                openxml_formats,
+                w_tags,
+                violations,
+            )
+
+        violations.extend(
+            _check_header_footer_content(
+                package,
+                section_references,
+                config.header_footer_rules,
+                field_mappings,
+                w_tags,
+            )
+        )
+
+    return violations
+
+
+def _check_style_definitions(
+    styles: Styles,
+    style_definitions: dict[str, dict[str, str | dict[str, str]]],
+    style_attributes_names_mapping: dict[str, str],
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    paragraph_format_mapping: dict[str, tuple[str, Callable | None]],
+) -> list[Violation]:
+    """Compare style font and paragraph formats with the configured definitions."""
+    violations = []
+
+    for style_name, style_def in style_definitions.items():
+        if not isinstance(style_def, dict) or style_name not in styles:
+            continue
+        style_obj = styles[style_name]
+
+        based_on = style_def.get(style_attributes_names_mapping["based_on"])
+        if based_on and based_on in styles:
+            actual_base = style_obj.base_style.name if style_obj.base_style else None
+            if actual_base != based_on:
+                violations.append(
+                    _violation(
+                        "style_based_on",
+                        STYLES_PART,
+                        None,
+                        style_name,
+                        based_on,
+                        actual_base,
+                    )
+                )
+
+        for format_key, target_name, mapping in (
+            ("font_format", "font", font_mapping),
+            ("paragraph_format", "paragraph_format", paragraph_format_mapping),
+        ):
+            format_def = style_def.get(style_attributes_names_mapping[format_key], {})
+            for key, (attr, converter) in mapping.items():
+                if key not in format_def or format_def[key] is None:
+                    continue
+
+                target = getattr(style_obj, target_name)
+                expected = _convert_config_value(target, format_def[key], converter)
+                actual = _get_effective_style_value(style_obj, target_name, attr)
+                if not _values_match(expected, actual):
+                    violations.append(
+                        _violation(
+                            f"{format_key}.{key}",
+                            STYLES_PART,
+                            None,
+                            style_name,
+                            format_def[key],
+                            actual,
+                        )
+                    )
+
+    return violations
+
+
+def _check_body_paragraphs(
+    document_xml: IO[bytes],
+    styles: Styles,
+    config: DocumentFormatterConfig,
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    chapter_section_numbering_regex: dict[str, str],
+    renumbering_regex: dict[str, str],
+    heading_level_styles: list[str],
+    caption_sequence_names: dict[str, str],
+    openxml_formats: dict[str, str],
+    w_tags: dict[str, str],
+    violations: list[Violation],
+) -> list[dict[str, str]]:
+    """
+    Stream the body paragraphs into the edit planner and report every planned edit
+    except nested styling, which the formatter always reapplies.
+    Returns the default header/footer relationship ids of each section.
+    """
+    style_names = {style.style_id: style.name for style in styles}
+    default_style = styles.default(WD_STYLE_TYPE.PARAGRAPH)
+    default_style_name = default_style.name if default_style else None
+    paragraph_styles: list[str | None] = []
+    section_references: list[dict[str, str]] = []
+
+    def stream_paragraph_views() -> Iterator[dict[str, str | int | bool | None]]:
+        for _, element in etree.iterparse(
+            document_xml, events=("end",), tag=(w_tags["p"], w_tags["sectPr"])
+        ):
+            if element.tag == w_tags["sectPr"]:
+                section_references.append(_get_section_references(element, w_tags))
+                continue
+            if element.getparent().tag != w_tags["body"]:
+                continue
+
+            style_id_element = element.find(f"{w_tags['pPr']}/{w_tags['pStyle']}")
+            style_name = (
+                style_names.get(style_id_element.get(w_tags["val"]), default_style_name)
+                if style_id_element is not None
+                else default_style_name
+            )
+            paragraph_styles.append(style_name)
+            yield build_paragraph_view(element, style_name, openxml_formats, w_tags)
+
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    for op in plan_paragraph_edits(
+        stream_paragraph_views(),
+        config,
+        style_names_mapping,
+        style_attributes_names_mapping,
+        chapter_section_numbering_regex,
+        renumbering_regex,
+        heading_level_styles,
+        caption_sequence_names,
+    ):
+        if op["rule"] == "nested_styling":
+            continue
+
+        payload = op["payload"]
+        if op["op"] == "set_page_break_before":
+            expected, actual = payload["value"], not payload["value"]
+        else:
+            expected, actual = payload.get("text"), payload["previous"]
+
+        violations.append(
+            _violation(
+                op["rule"],
+                DOCUMENT_PART,
+                op["paragraph"],
+                paragraph_styles[op["paragraph"]],
+                expected,
+                actual,
+            )
+        )
+
+    return section_references
+
+
+def _check_header_footer_content(
+    package: zipfile.ZipFile,
+    section_references: list[dict[str, str]],
+    header_footer_config: dict[str, dict[str, str | dict[str, str]]],
+    field_mappings: list[tuple[str, str]],
+    w_tags: dict[str, str],
+) -> list[Violation]:
+    """
+    Check that every section's default header and footer contain the configured
+    left/center/right content, with dynamic placeholders matched against field codes.
+    """
+    relationships = {
+        relationship.get("Id"): posixpath.normpath(
+            posixpath.join("word", relationship.get("Target"))
+        )
+        for relationship in etree.fromstring(package.read(DOCUMENT_RELS_PART)).iter(
+            w_tags["Relationship"]
+        )
+    }
+    part_texts: dict[str, str] = {}
+    violations = []
+
+    for part_kind in ("header", "footer"):
+        content = header_footer_config.get(f"{part_kind}_content") or {}
+        expected_snippets = {
+            position: _replace_field_placeholders(text, field_mappings).strip()
+            for position, text in content.items()
+            if text and text.strip()
+        }
+        if not expected_snippets:
+            continue
+
+        part_name = None
+        for section_index, references in enumerate(section_references):
+            rel_id = references.get(part_kind)
+            if rel_id is not None:
+                part_name = relationships.get(rel_id)
+
+            if part_name is None:
+                violations.append(
+                    _violation(
+                        f"{part_kind}_content",
+                        DOCUMENT_PART,
+                        None,
+                        f"section {section_index + 1}",
+                        content,
+                        None,
+                    )
+                )
+                continue
+
+            if part_name not in part_texts:
+                part_texts[part_name] = _get_part_text_with_fields(
+                    etree.fromstring(package.read(part_name)), w_tags
+                )
+
+            for position, snippet in expected_snippets.items():
+                if snippet not in part_texts[part_name]:
+                    violations.append(
+                        _violation(
+                            f"{part_kind}_content.{position}",
+                            part_name,
+                            None,
+                            f"section {section_index + 1}",
+                            snippet,
+                            part_texts[part_name],
+                        )
+                    )
+
+    return violations
+
+
+def _get_section_references(
+    sect_pr: etree._Element, w_tags: dict[str, str]
+) -> dict[str, str]:
+    """Return the relationship ids of a section's default header and footer."""
+    references = {}
+    for part_kind in ("header", "footer"):
+        for reference in sect_pr.iterchildren(w_tags[f"{part_kind}Reference"]):
+            if reference.get(w_tags["type"], "default") == "default":
+                references[part_kind] = reference.get(w_tags["rel_id"])
+    return references
+
+
+def _get_part_text_with_fields(
+    part_element: etree._Element, w_tags: dict[str, str]
+) -> str:
+    """
+    Return the text of a header/footer part with fields written as {FIELD}, e.g.
+    "{PAGE} of {NUMPAGES}"; cached field results are left out.
+    """
+    text_parts = []
+    instruction_parts: list[str] = []
+    in_field_result = False
+
+    for element in part_element.iter(
+        w_tags["p"],
+        w_tags["t"],
+        w_tags["tab"],
+        w_tags["fldSimple"],
+        w_tags["fldChar"],
+        w_tags["instrText"],
+    ):
+        tag = element.tag
+        if tag == w_tags["p"]:
+            if text_parts:
+                text_parts.append("\n")
+        elif tag == w_tags["fldSimple"]:
+            text_parts.append(_field_marker(element.get(w_tags["instr"], "")))
+        elif tag == w_tags["instrText"]:
+            instruction_parts.append(element.text or "")
+        elif tag == w_tags["fldChar"]:
+            char_type = element.get(w_tags["fldCharType"])
+            if char_type == "begin":
+                instruction_parts = []
+            elif char_type == "separate":
+                text_parts.append(_field_marker("".join(instruction_parts)))
+                in_field_result = True
+            elif char_type == "end":
+                if not in_field_result:
+                    text_parts.append(_field_marker("".join(instruction_parts)))
+                in_field_result = False
+        elif in_field_result or _is_inside_simple_field(element, w_tags):
+            continue
+        elif tag == w_tags["tab"]:
+            text_parts.append("\t")
+        else:
+            text_parts.append(element.text or "")
+
+    return "".join(text_parts)
+
+
+def _is_inside_simple_field(element: etree._Element, w_tags: dict[str, str]) -> bool:
+    """Return True if the element is part of a w:fldSimple cached result."""
+    return any(
+        ancestor.tag == w_tags["fldSimple"] for ancestor in element.iterancestors()
+    )
+
+
+def _field_marker(instruction: str) -> str:
+    """Return the {FIELD} marker for a field instruction such as ' PAGE \\* Arabic '."""
+    field_name = instruction.split()[0].upper() if instruction.split() else ""
+    return f"{{{field_name}}}"
+
+
+def _replace_field_placeholders(
+    content_text: str, field_mappings: list[tuple[str, str]]
+) -> str:
+    """Replace dynamic placeholders such as {page} with their {FIELD} markers."""
+    for pattern, field_code in field_mappings:
+        content_text = re.sub(
+            pattern,
+            lambda _, code=field_code: _field_marker(code),
+            content_text,
+            flags=re.IGNORECASE,
+        )
+    return content_text
+
+
+def _convert_config_value(
+    target: object, value: str | int | float | bool, converter: Callable | None
+) -> object:
+    """Convert a config value the way map_config_to_docx_attributes does."""
+    if not converter:
+        return value
+    try:
+        return converter(target, value)
+    except TypeError:
+        return converter(value)
+
+
+def _get_effective_style_value(
+    style_obj: BaseStyle, target_name: str, attr: str
+) -> object:
+    """Read a font or paragraph format attribute, following the based_on chain."""
+    while style_obj is not None:
+        value = getattr(style_obj, target_name)
+        for part in attr.split("."):
+            value = getattr(value, part, None)
+            if value is None:
+                break
+        if value is not None:
+            return value
+        style_obj = style_obj.base_style
+    return None
+
+
+def _values_match(expected: object, actual: object) -> bool:
+    """Compare a configured value with the document value, allowing twip rounding."""
+    if isinstance(expected, Length) and isinstance(actual, int):
+        return abs(expected - actual) <= LENGTH_TOLERANCE_EMU
+    return expected == actual
+
+
+def _violation(
+    rule: str,
+    part: str,
+    paragraph: int | None,
+    style: str | None,
+    expected: object,
+    actual: object,
+) -> Violation:
+    """Build a violation record."""
+    return {
+        "rule": rule,
+        "part": part,
+        "paragraph": paragraph,
+        "style": style,
+        "expected": expected,
+        "actual": actual,
+    }
@@ -0,0 +1,446 @@
+from typing import Callable, Iterable
+
+from docx.document import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.text.paragraph import Paragraph
+from lxml import etree
+
+from document_formatter_config import DocumentFormatterConfig
+
+from ..formatting.nested_styling_utils import (
+    apply_nested_paragraph_styling,
+    build_pattern_text_parts,
+    get_nested_styling_rules,
+)
+from ..numbering.numbering_utils import (
+    get_common_pattern,
+    number_caption_text,
+    process_paragraph_text,
+    record_numbering_label,
+    update_paragraph_numbering,
+)
+from ..numbering.outline_numbering_utils import (
+    advance_outline,
+    build_outline_rules,
+    new_outline_state,
+)
+from .paragraph_view_utils import (
+    ParagraphView,
+    get_paragraph_text,
+    read_numbering_properties,
+)
+
+TRIM_CHARACTERS = "\n\r "
+LIST_TERMINATION_STRIP_CHARS = ".;,:"
+
+EditOp = dict[str, int | str | dict]
+
+
+def build_edit_plan(
+    doc: Document,
+    config: DocumentFormatterConfig,
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    chapter_section_numbering_regex: dict[str, str],
+    renumbering_regex: dict[str, str],
+    heading_level_styles: list[str],
+    caption_sequence_names: dict[str, str],
+    openxml_formats: dict[str, str],
+    w_tags: dict[str, str],
+    start_chapter: int = 0,
+) -> list[EditOp]:
+    """Plan the body paragraph edits for a document without modifying it."""
+    style_names = {style.style_id: style.name for style in doc.styles}
+    default_style_name = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH).name
+
+    paragraph_views = (
+        build_paragraph_view(
+            p_element,
+            style_names.get(p_element.style, default_style_name),
+            openxml_formats,
+            w_tags,
+        )
+        for p_element in doc.element.body.iterchildren(w_tags["p"])
+    )
+    return plan_paragraph_edits(
+        paragraph_views,
+        config,
+        style_names_mapping,
+        style_attributes_names_mapping,
+        chapter_section_numbering_regex,
+        renumbering_regex,
+        heading_level_styles,
+        caption_sequence_names,
+        start_chapter,
+    )
+
+
+def build_paragraph_view(
+    p_element: etree._Element,
+    style_name: str | None,
+    openxml_formats: dict[str, str],
+    w_tags: dict[str, str],
+) -> dict[str, str | int | bool | None]:
+    """Read the paragraph properties the planner needs from a w:p element."""
+    num_id, ilvl = read_numbering_properties(p_element, w_tags)
+
+    page_break_element = p_element.find(f"{w_tags['pPr']}/{w_tags['pageBreakBefore']}")
+    has_objects = next(
+        p_element.iter(
+            f"{{{openxml_formats['M']}}}oMath",
+            f"{{{openxml_formats['W']}}}drawing",
+            f"{{{openxml_formats['PIC']}}}pic",
+            f"{{{openxml_formats['V']}}}shape",
+        ),
+        None,
+    )
+
+    return {
+        "style": style_name,
+        "text": get_paragraph_text(p_element, w_tags),
+        "num_id": num_id,
+        "ilvl": ilvl,
+        "has_objects": has_objects is not None,
+        "page_break_before": page_break_element is not None
+        and page_break_element.get(w_tags["val"], "true") not in ("0", "false"),
+    }
+
+
+def plan_paragraph_edits(
+    paragraph_views: Iterable[dict[str, str | int | bool | None]],
+    config: DocumentFormatterConfig,
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    chapter_section_numbering_regex: dict[str, str],
+    renumbering_regex: dict[str, str],
+    heading_level_styles: list[str],
+    caption_sequence_names: dict[str, str],
+    start_chapter: int = 0,
+) -> list[EditOp]:
+    """
+    Plan the body phases of the formatter as a list of edit operations.
+
+    Covers paragraph cleaning, text-based heading and caption numbering, chapter page
+    breaks, list termination characters and nested styling, with the same rules and
+    state machines as the direct phases. Views are consumed one at a time, so they can
+    come from a streaming parser. Each op is {"paragraph", "op", "rule", "payload"},
+    with at most one text op (set_text, set_runs or remove_paragraph) per paragraph;
+    text ops carry the original text as payload["previous"] and renumbered labels
+    (e.g. "Table 2.3" -> "Table 3.1") as payload["labels"].
+    """
+    document_setup = config.document_setup
+    chapter_rules = config.chapter_and_section_rules
+    trim_spaces = document_setup.get("trim_spaces", True)
+    native_heading_numbering = document_setup.get("native_heading_numbering", False)
+    refactor_section_numbering = document_setup.get("refactor_section_numbering", False)
+
+    number_captions = not document_setup.get("caption_field_numbering", False)
+    outline_rules = build_outline_rules(
+        chapter_rules,
+        style_names_mapping,
+        style_attributes_names_mapping,
+        heading_level_styles,
+        [
+            style_key
+            for style_key in caption_sequence_names
+            if style_key in chapter_rules
+        ],
+    )
+    outline_state = new_outline_state(outline_rules, start_chapter)
+    caption_styles = outline_rules["caption_styles"]
+    chapter_style_name = style_names_mapping["chapter_titles"]
+    common_patterns = {
+        name: get_common_pattern(style_def, style_attributes_names_mapping)
+        for name, style_def in chapter_rules.items()
+    }
+    nested_rules = get_nested_styling_rules(
+        style_names_mapping,
+        {
+            **chapter_rules,
+            **config.source_rules,
+            **(config.table_rules or {}),
+            **(config.figure_rules or {}),
+        },
+        style_attributes_names_mapping,
+    )
+
+    text_ops: dict[int, EditOp] = {}
+    page_break_ops: dict[int, EditOp] = {}
+    list_items: list[tuple[int, str, int]] = []
+    final_texts: dict[int, str] = {}
+    nested_paragraphs: list[tuple[int, str]] = []
+
+    def set_text(
+        index: int,
+        rule: str,
+        previous: str,
+        text: str,
+        labels: dict[str, str] | None = None,
+    ) -> str:
+        if text == previous:
+            return text
+
+        payload = _merge_text_payload(text_ops.get(index), previous, labels)
+        if text == payload["previous"] and not payload.get("labels"):
+            # A later phase restored the original text (e.g. trimmed, then renumbered)
+            del text_ops[index]
+            return text
+
+        text_ops[index] = _edit_op(index, "set_text", rule, payload)
+        text_ops[index]["payload"]["text"] = text
+        return text
+
+    page_break_applied = False
+
+    for index, view in enumerate(paragraph_views):
+        style_name = view["style"]
+        text = view["text"]
+
+        if trim_spaces and text:
+            text = set_text(
+                index,
+                "trim_spaces",
+                text,
+                text.lstrip(TRIM_CHARACTERS).rstrip(TRIM_CHARACTERS),
+            )
+
+        if not text.strip() and not view["has_objects"]:
+            text_ops[index] = _edit_op(
+                index, "remove_paragraph", "empty_paragraph", {"previous": view["text"]}
+            )
+            continue
+
+        levels = advance_outline(outline_state, outline_rules, style_name)
+        is_caption = style_name in caption_styles
+        if native_heading_numbering:
+            pass
+        elif refactor_section_numbering:
+            if levels is not None and not is_caption:
+                new_text = update_paragraph_numbering(
+                    text,
+                    levels[0],
+                    style_definitions=chapter_rules,
+                    style_attributes_names_mapping=style_attributes_names_mapping,
+                    style_name=style_name,
+                    chapter_section_numbering_regex=chapter_section_numbering_regex,
+                    renumbering_regex=renumbering_regex,
+                    levels=levels,
+                )
+                labels = {}
+                record_numbering_label(
+                    labels,
+                    text,
+                    new_text,
+                    common_patterns.get(style_name, ""),
+                    renumbering_regex,
+                )
+                text = set_text(index, "heading_numbering", text, new_text, labels)
+        elif style_name in chapter_rules:
+            numbering_def = chapter_rules[style_name].get(
+                style_attributes_names_mapping["numbering_format"], {}
+            )
+            numbering_type = numbering_def.get("type")
+            numbering_side = numbering_def.get("side")
+            if numbering_type and numbering_side:
+                processed_text = process_paragraph_text(
+                    text.strip(),
+                    numbering_type.upper(),
+                    numbering_side.upper(),
+                    chapter_section_numbering_regex,
+                    numbering_def.get("separator", " "),
+                )
+                if processed_text != text:
+                    text = set_text(
+                        index,
+                        "heading_numbering_format",
+                        text,
+                        " ".join(processed_text.split()),
+                    )
+
+        if is_caption and levels is not None and number_captions:
+            caption_rules = chapter_rules[caption_styles[style_name][0]]
+            new_text = number_caption_text(
+                text,
+                levels,
+                caption_rules,
+                style_attributes_names_mapping,
+                chapter_section_numbering_regex,
+                renumbering_regex,
+            )
+            labels = {}
+            record_numbering_label(
+                labels,
+                text,
+                new_text,
+                get_common_pattern(caption_rules, style_attributes_names_mapping),
+                renumbering_regex,
+            )
+            text = set_text(index, "caption_numbering", text, new_text, labels)
+
+        if style_name == chapter_style_name:
+            if not page_break_applied:
+                if not view["page_break_before"]:
+                    page_break_ops[index] = _edit_op(
+                        index,
+                        "set_page_break_before",
+                        "chapter_page_break",
+                        {"value": True},
+                    )
+                page_break_applied = True
+        else:
+            page_break_applied = False
+
+        if view["num_id"] not in (None, "0"):
+            list_items.append((index, view["num_id"], view["ilvl"]))
+            final_texts[index] = text
+        if style_name in nested_rules:
+            nested_paragraphs.append((index, style_name))
+            final_texts[index] = text
+
+    termination_cfg = config.list_rules.get("list_item_termination", {})
+    for index, termination_char in _plan_list_terminations(
+        list_items,
+        termination_cfg.get("intermediate", ""),
+        termination_cfg.get("last_item", ""),
+    ):
+        text = final_texts[index].strip()
+        if not termination_char or not text:
+            continue
+        cleaned_text = text.rstrip(LIST_TERMINATION_STRIP_CHARS).strip()
+        if cleaned_text:
+            final_texts[index] = set_text(
+                index,
+                "list_item_termination",
+                final_texts[index],
+                f"{cleaned_text}{termination_char}",
+            )
+
+    for index, style_name in nested_paragraphs:
+        nested_rule = nested_rules[style_name]
+        text_parts = build_pattern_text_parts(
+            final_texts[index],
+            nested_rule["pattern"],
+            nested_rule["pattern_font_format"],
+            nested_rule["default_font_format"],
+            nested_rule["numbering_format"],
+        )
+        if not text_parts:
+            continue
+        payload = _merge_text_payload(text_ops.get(index), final_texts[index])
+        payload["runs"] = [
+            [part_text, font_format] for part_text, font_format in text_parts
+        ]
+        payload["default_font_format"] = nested_rule["default_font_format"]
+        text_ops[index] = _edit_op(index, "set_runs", "nested_styling", payload)
+
+    return [
+        op
+        for index in sorted(text_ops.keys() | page_break_ops.keys())
+        for op in (page_break_ops.get(index), text_ops.get(index))
+        if op is not None
+    ]
+
+
+def apply_edit_plan(
+    doc: Document,
+    plan: list[EditOp],
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    w_tags: dict[str, str],
+    label_map: dict[str, str] | None = None,
+) -> int:
+    """
+    Execute an edit plan in document order in a single pass over the body paragraphs.
+    Labels renumbered by the plan are recorded in label_map when it is given.
+    Raises ValueError if the plan was made for a different document, i.e. a paragraph
+    index is out of range or its text differs from payload["previous"].
+    Returns the number of operations applied.
+    """
+    p_elements = list(doc.element.body.iterchildren(w_tags["p"]))
+    removed_elements = []
+
+    for op in plan:
+        index = op["paragraph"]
+        payload = op["payload"]
+        if index >= len(p_elements):
+            raise ValueError(f"Edit plan refers to missing paragraph {index}")
+
+        view = ParagraphView(Paragraph(p_elements[index], doc._body), w_tags)
+        if "previous" in payload and view.text != payload["previous"]:
+            raise ValueError(f"Edit plan does not match the text of paragraph {index}")
+
+        if op["op"] == "set_text":
+            view.set_text(payload["text"])
+        elif op["op"] == "set_runs":
+            apply_nested_paragraph_styling(
+                paragraph=view,
+                text_parts=[tuple(part) for part in payload["runs"]],
+                font_mapping=font_mapping,
+                default_font_format=payload["default_font_format"],
+            )
+        elif op["op"] == "set_page_break_before":
+            view.paragraph.paragraph_format.page_break_before = payload["value"]
+        elif op["op"] == "remove_paragraph":
+            removed_elements.append(p_elements[index])
+        else:
+            raise ValueError(f"Unknown edit plan operation: {op['op']}")
+
+        if label_map is not None:
+            label_map.update(payload.get("labels", {}))
+
+    for p_element in removed_elements:
+        p_element.getparent().remove(p_element)
+
+    return len(plan)
+
+
+def _plan_list_terminations(
+    list_items: list[tuple[int, str, int]],
+    intermediate_char: str,
+    last_item_char: str,
+) -> list[tuple[int, str]]:
+    """
+    Group list paragraphs like find_list_groups (a group ends when
+    the numId changes or the list returns to level 0 from a nested level) and return
+    (paragraph index, termination character) pairs.
+    """
+    if not intermediate_char and not last_item_char:
+        return []
+
+    groups: list[list[tuple[int, str, int]]] = []
+    current_num_id = None
+    for item in list_items:
+        _, num_id, level = item
+        if num_id != current_num_id or (
+            groups and level == 0 and groups[-1][-1][2] > 0
+        ):
+            groups.append([item])
+            current_num_id = num_id
+        else:
+            groups[-1].append(item)
+
+    return [
+        (index, last_item_char if position == len(group) - 1 else intermediate_char)
+        for group in groups
+        for position, (index, _, _) in enumerate(group)
+    ]
+
+
+def _merge_text_payload(
+    existing_op: EditOp | None,
+    previous: str,
+    labels: dict[str, str] | None = None,
+) -> dict:
+    """Start a text op payload, keeping the original text and labels of an earlier op."""
+    if existing_op is not None:
+        previous = existing_op["payload"]["previous"]
+        labels = {**existing_op["payload"].get("labels", {}), **(labels or {})}
+
+    payload = {"previous": previous}
+    if labels:
+        payload["labels"] = labels
+    return payload
+
+
+def _edit_op(index: int, op: str, rule: str, payload: dict) -> EditOp:
+    """Build an edit plan operation."""
+    return {"paragraph": index, "op": op, "rule": rule, "payload": payload}
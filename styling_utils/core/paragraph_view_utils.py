@@ -0,0 +1,140 @@
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+from lxml import etree
+
+_UNSET = object()
+
+
+class ParagraphView:
+    """
+    Cached view of a body paragraph for the styling passes.
+
+    Text, style id, numbering properties and runs are read from the w:p element on
+    first access and then reused, so a pass that checks, strips and compares a
+    paragraph's text concatenates its w:t elements once. Edits made through set_text
+    keep the cache valid; helpers that change the paragraph's XML directly must call
+    invalidate() afterwards.
+    """
+
+    __slots__ = ("_numbering", "_runs", "_style_id", "_text", "_w_tags", "paragraph")
+
+    def __init__(self, paragraph: Paragraph, w_tags: dict[str, str] | None = None):
+        self.paragraph = paragraph
+        self._w_tags = w_tags
+        self.invalidate()
+
+    @property
+    def element(self) -> etree._Element:
+        """The w:p element."""
+        return self.paragraph._p
+
+    @property
+    def text(self) -> str:
+        """The paragraph text, as python-docx's Paragraph.text reads it."""
+        if self._text is _UNSET:
+            self._text = (
+                get_paragraph_text(self.paragraph._p, self._w_tags)
+                if self._w_tags
+                else self.paragraph.text
+            )
+        return self._text
+
+    @property
+    def style_id(self) -> str | None:
+        """The w:pStyle value, None for the default paragraph style."""
+        if self._style_id is _UNSET:
+            self._style_id = self.paragraph._p.style
+        return self._style_id
+
+    @property
+    def numbering(self) -> tuple[str | None, int]:
+        """(numId, ilvl) of the paragraph's numPr, (None, 0) if it is not in a list."""
+        if self._numbering is _UNSET:
+            self._numbering = (
+                read_numbering_properties(self.paragraph._p, self._w_tags)
+                if self._w_tags
+                else (None, 0)
+            )
+        return self._numbering
+
+    @property
+    def runs(self) -> list[Run]:
+        """The paragraph's runs."""
+        if self._runs is _UNSET:
+            self._runs = self.paragraph.runs
+        return self._runs
+
+    def set_text(self, text: str) -> None:
+        """Replace the paragraph content with a single run of text."""
+        self.paragraph.text = text
+        # python-docx writes "\r" as a line break, which reads back as "\n"
+        self._text = text.replace("\r", "\n")
+        self._runs = _UNSET
+
+    def invalidate(self) -> None:
+        """Drop all cached values after the w:p element was changed directly."""
+        self._text = _UNSET
+        self._style_id = _UNSET
+        self._numbering = _UNSET
+        self._runs = _UNSET
+
+
+def as_paragraph_view(
+    paragraph: Paragraph | ParagraphView, w_tags: dict[str, str] | None = None
+) -> ParagraphView:
+    """Return the paragraph's view, creating one for a plain python-docx Paragraph."""
+    if isinstance(paragraph, ParagraphView):
+        return paragraph
+    return ParagraphView(paragraph, w_tags)
+
+
+def get_paragraph_text(p_element: etree._Element, w_tags: dict[str, str]) -> str:
+    """Return the paragraph text the way python-docx's Paragraph.text reads it."""
+    text_parts = []
+
+    for child in p_element:
+        if child.tag == w_tags["r"]:
+            runs = (child,)
+        elif child.tag == w_tags["hyperlink"]:
+            runs = child.iterchildren(w_tags["r"])
+        else:
+            continue
+
+        for run in runs:
+            for item in run:
+                tag = item.tag
+                if tag == w_tags["t"]:
+                    text_parts.append(item.text or "")
+                elif tag in (w_tags["tab"], w_tags["ptab"]):
+                    text_parts.append("\t")
+                elif tag == w_tags["cr"] or (
+                    tag == w_tags["br"]
+                    and item.get(w_tags["type"], "textWrapping") == "textWrapping"
+                ):
+                    text_parts.append("\n")
+                elif tag == w_tags["noBreakHyphen"]:
+                    text_parts.append("-")
+
+    return "".join(text_parts)
+
+
+def read_numbering_properties(
+    p_element: etree._Element, w_tags: dict[str, str]
+) -> tuple[str | None, int]:
+    """Return (numId, ilvl) of a w:p element, (None, 0) when it has no numPr."""
+    num_pr = p_element.find(f".//{w_tags['numPr']}")
+    if num_pr is None:
+        return None, 0
+
+    num_id, level = None, 0
+
+    num_id_element = num_pr.find(f".//{w_tags['numId']}")
+    if num_id_element is not None:
+        num_id = num_id_element.get(w_tags["val"])
+
+    ilvl_element = num_pr.find(f".//{w_tags['ilvl']}")
+    if ilvl_element is not None:
+        ilvl_value = ilvl_element.get(w_tags["val"]) or ""
+        level = int(ilvl_value) if ilvl_value.isdigit() else 0
+
+    return num_id, level
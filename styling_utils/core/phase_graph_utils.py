@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable
+
+PACKAGE_PARTS = ("body", "styles", "numbering", "headers_footers")
+
+Phase = dict[str, str | bool | list[str] | set[str] | None]
+
+
+def select_phases(
+    phases: Iterable[Phase],
+    config: object,
+    style_usage: dict[str, int],
+) -> list[Phase]:
+    """
+    Return the phases that have work to do, in their declared order.
+
+    Each phase is {"name", "enabled", "config", "styles", "reads", "writes"}:
+    - "enabled": False when a document_setup flag turns the phase off
+    - "config": config sections the phase reads; it is skipped when all are empty
+    - "styles": paragraph style names it works on, or None when it does not depend
+      on style usage; it is skipped when no paragraph uses any of them
+    - "reads" / "writes": the package parts it reads and changes (PACKAGE_PARTS)
+
+    style_usage is the paragraph count per style name, see count_style_usage.
+    """
+    selected_phases = []
+    for phase in phases:
+        if not phase.get("enabled", True):
+            continue
+        config_sections = phase.get("config") or []
+        if config_sections and not any(
+            getattr(config, section, None) for section in config_sections
+        ):
+            continue
+        style_names = phase.get("styles")
+        if style_names is not None and not any(
+            style_usage.get(style_name) for style_name in style_names
+        ):
+            continue
+        selected_phases.append(phase)
+
+    return selected_phases
+
+
+def build_phase_graph(phases: list[Phase]) -> dict[str, set[str]]:
+    """
+    Return the dependencies of each phase: the earlier phases that write a part it
+    reads or writes, or read a part it writes. Phases without a path between them in
+    this graph touch disjoint parts and can run in any order.
+    """
+    dependencies: dict[str, set[str]] = {}
+    for position, phase in enumerate(phases):
+        reads, writes = set(phase["reads"]), set(phase["writes"])
+        dependencies[phase["name"]] = {
+            earlier_phase["name"]
+            for earlier_phase in phases[:position]
+            if set(earlier_phase["writes"]) & (reads | writes)
+            or set(earlier_phase["reads"]) & writes
+        }
+
+    return dependencies
+
+
+def group_phase_stages(phases: list[Phase]) -> list[list[Phase]]:
+    """
+    Group phases into stages: a phase runs one stage after the last of its
+    dependencies, so the phases of a stage are independent of each other.
+    Phases keep their declared order within a stage.
+    """
+    dependencies = build_phase_graph(phases)
+    stage_numbers: dict[str, int] = {}
+    stages: list[list[Phase]] = []
+
+    for phase in phases:
+        stage_number = max(
+            (stage_numbers[name] + 1 for name in dependencies[phase["name"]]),
+            default=0,
+        )
+        stage_numbers[phase["name"]] = stage_number
+        while len(stages) <= stage_number:
+            stages.append([])
+        stages[stage_number].append(phase)
+
+    return stages
+
+
+def run_phase_stages(
+    stages: list[list[Phase]],
+    run_phase: Callable[[Phase], None],
+    max_workers: int = 1,
+    prepare_stage: Callable[[list[Phase]], None] | None = None,
+) -> list[str]:
+    """
+    Run the stages in order. With max_workers above 1, the phases of a stage run
+    concurrently in threads; prepare_stage is called first, in this thread, e.g. to
+    create package parts the phases would otherwise add concurrently.
+
+    Phases writing the same part never share a stage, so the body phases always run
+    one after another, whatever max_workers is; only phases on separate parts
+    (styles.xml, numbering.xml, headers and footers) overlap. The phases are pure
+    Python, so the threads give little speedup; splitting the body into chapters
+    in processes (document_parallel_formatter) is what parallelizes body work.
+    Returns the names of the phases run.
+    """
+    phase_names = []
+    for stage in stages:
+        if max_workers > 1 and len(stage) > 1:
+            if prepare_stage is not None:
+                prepare_stage(stage)
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(stage))
+            ) as executor:
+                futures = [executor.submit(run_phase, phase) for phase in stage]
+                for future in futures:
+                    future.result()
+        else:
+            for phase in stage:
+                run_phase(phase)
+        phase_names.extend(phase["name"] for phase in stage)
+
+    return phase_names
@@ -0,0 +1,294 @@
+import copy
+import os
+import re
+from functools import lru_cache
+from typing import IO
+
+from docx.document import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part
+from docx.oxml.shared import qn
+from docx.package import Package
+from lxml import etree
+
+ReferenceTemplate = dict[str, etree._Element | dict | None]
+
+# Parts copied verbatim from the reference document
+REFERENCE_BLOB_PARTS = (RT.THEME, RT.FONT_TABLE)
+
+STYLE_REFERENCE_TAGS = ("w:basedOn", "w:next", "w:link")
+NUMBERING_STYLE_REFERENCE_TAGS = ("w:pStyle", "w:styleLink", "w:numStyleLink")
+
+
+def load_reference_template(path: str) -> ReferenceTemplate:
+    """
+    Read the house style parts of a reference .docx / .dotx, cached per file and
+    modification time, so a template shared by many documents is parsed once.
+    """
+    path = os.path.abspath(path)
+    return _load_reference_template(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_reference_template(path: str, mtime_ns: int) -> ReferenceTemplate:
+    """Cached read_reference_template; mtime_ns only keys the cache."""
+    return read_reference_template(path)
+
+
+def read_reference_template(source: str | IO[bytes]) -> ReferenceTemplate:
+    """
+    Read the styles, numbering, theme and font table parts of a reference document.
+    Templates (.dotx) are read through their package, as python-docx only opens
+    .docx main documents.
+
+    Returns {"styles": w:styles, "numbering": w:numbering or None,
+    "parts": {relationship type: (partname, content type, blob)}}. The elements are
+    shared between imports and must not be changed.
+    """
+    main_part = Package.open(source).main_document_part
+    related_parts = {
+        rel.reltype: rel.target_part
+        for rel in main_part.rels.values()
+        if not rel.is_external
+    }
+
+    styles_part = related_parts.get(RT.STYLES)
+    numbering_part = related_parts.get(RT.NUMBERING)
+    return {
+        "styles": styles_part.element if styles_part is not None else None,
+        "numbering": numbering_part.element if numbering_part is not None else None,
+        "parts": {
+            reltype: (
+                related_parts[reltype].partname,
+                related_parts[reltype].content_type,
+                related_parts[reltype].blob,
+            )
+            for reltype in REFERENCE_BLOB_PARTS
+            if reltype in related_parts
+        },
+    }
+
+
+def import_reference_template(
+    doc: Document, reference_template: ReferenceTemplate
+) -> dict[str, str]:
+    """
+    Merge a reference template into the document in one pass per part:
+
+    - styles.xml: the document defaults and every style of the reference replace
+      the style of the same name; styles the document lacks are added, under a new
+      style id when theirs is taken by another style
+    - numbering.xml: the lists used by the imported styles are added under new ids
+    - theme and font table are replaced by those of the reference
+
+    Paragraphs keep their style ids, as a replaced style keeps the document's id.
+    Returns the reference style ids mapped to the style ids in the document.
+    """
+    reference_styles = reference_template["styles"]
+    if reference_styles is None:
+        return {}
+
+    styles_element = doc.styles.element
+    _replace_document_defaults(styles_element, reference_styles)
+    style_id_map, imported_styles = _merge_styles(styles_element, reference_styles)
+
+    num_id_map = {}
+    num_ids = {
+        num_id.get(qn("w:val"))
+        for style_element in imported_styles
+        for num_id in style_element.iter(qn("w:numId"))
+    }
+    num_ids.discard("0")
+    if num_ids and reference_template["numbering"] is not None:
+        num_id_map = _import_numbering(
+            doc.part.numbering_part.element,
+            reference_template["numbering"],
+            num_ids,
+            style_id_map,
+        )
+
+    for style_element in imported_styles:
+        _remap_values(style_element, STYLE_REFERENCE_TAGS, style_id_map)
+        _remap_values(style_element, ("w:numId",), num_id_map)
+
+    for reltype, (partname, content_type, blob) in reference_template["parts"].items():
+        _replace_blob_part(doc, reltype, partname, content_type, blob)
+
+    return style_id_map
+
+
+def add_missing_paragraph_styles(doc: Document, style_names: list[str]) -> list[str]:
+    """
+    Add the paragraph styles the document lacks, e.g. to build a reference template
+    from a config whose style definitions only update existing styles.
+    Returns the names of the added styles.
+    """
+    added_style_names = []
+    for style_name in style_names:
+        if style_name in doc.styles:
+            continue
+        doc.styles.add_style(style_name, WD_STYLE_TYPE.PARAGRAPH)
+        added_style_names.append(style_name)
+
+    return added_style_names
+
+
+def _replace_document_defaults(
+    styles_element: etree._Element, reference_styles: etree._Element
+) -> None:
+    """Replace w:docDefaults with a copy of the reference's."""
+    reference_defaults = reference_styles.find(qn("w:docDefaults"))
+    if reference_defaults is None:
+        return
+
+    defaults = styles_element.find(qn("w:docDefaults"))
+    if defaults is not None:
+        styles_element.replace(defaults, copy.deepcopy(reference_defaults))
+    else:
+        styles_element.insert(0, copy.deepcopy(reference_defaults))
+
+
+def _merge_styles(
+    styles_element: etree._Element, reference_styles: etree._Element
+) -> tuple[dict[str, str], list[etree._Element]]:
+    """
+    Copy the reference styles over the document styles, matching them by name.
+    Returns the style id map and the copied style elements.
+    """
+    styles_by_name = {
+        style.name_val: style for style in styles_element.iterchildren(qn("w:style"))
+    }
+    style_ids = {style.styleId for style in styles_by_name.values()}
+
+    style_id_map: dict[str, str] = {}
+    imported_styles: list[etree._Element] = []
+    for reference_style in reference_styles.iterchildren(qn("w:style")):
+        imported_style = copy.deepcopy(reference_style)
+        reference_id = reference_style.styleId
+        style = styles_by_name.get(reference_style.name_val)
+
+        if style is not None and style.type == reference_style.type:
+            style_id = style.styleId
+            styles_element.replace(style, imported_style)
+        else:
+            style_id = reference_id
+            suffix = 1
+            while style_id in style_ids:
+                style_id = f"{reference_id}{suffix}"
+                suffix += 1
+            styles_element.append(imported_style)
+
+        if imported_style.default:
+            for other_style in styles_element.iterchildren(qn("w:style")):
+                if other_style is not imported_style and (
+                    other_style.type == imported_style.type and other_style.default
+                ):
+                    other_style.default = False
+
+        imported_style.styleId = style_id
+        style_ids.add(style_id)
+        style_id_map[reference_id] = style_id
+        styles_by_name[reference_style.name_val] = imported_style
+        imported_styles.append(imported_style)
+
+    return style_id_map, imported_styles
+
+
+def _import_numbering(
+    numbering_element: etree._Element,
+    reference_numbering: etree._Element,
+    num_ids: set[str],
+    style_id_map: dict[str, str],
+) -> dict[str, str]:
+    """
+    Copy the w:num of each numId with its w:abstractNum into the document
+    numbering under new ids. Returns the reference numIds mapped to the new ones.
+    """
+    nums = {
+        num.get(qn("w:numId")): num
+        for num in reference_numbering.iterchildren(qn("w:num"))
+    }
+    abstract_nums = {
+        abstract_num.get(qn("w:abstractNumId")): abstract_num
+        for abstract_num in reference_numbering.iterchildren(qn("w:abstractNum"))
+    }
+
+    next_num_id = 1 + max(
+        (
+            int(num.get(qn("w:numId")))
+            for num in numbering_element.iterchildren(qn("w:num"))
+        ),
+        default=0,
+    )
+    next_abstract_num_id = 1 + max(
+        (
+            int(abstract_num.get(qn("w:abstractNumId")))
+            for abstract_num in numbering_element.iterchildren(qn("w:abstractNum"))
+        ),
+        default=-1,
+    )
+    first_num = next(numbering_element.iterchildren(qn("w:num")), None)
+
+    num_id_map: dict[str, str] = {}
+    abstract_num_id_map: dict[str, str] = {}
+    for num_id in sorted(num_ids, key=int):
+        num = nums.get(num_id)
+        if num is None:
+            continue
+        abstract_num_id_element = num.find(qn("w:abstractNumId"))
+        reference_abstract_id = abstract_num_id_element.get(qn("w:val"))
+
+        if reference_abstract_id not in abstract_num_id_map:
+            abstract_num = copy.deepcopy(abstract_nums[reference_abstract_id])
+            abstract_num.set(qn("w:abstractNumId"), str(next_abstract_num_id))
+            _remap_values(abstract_num, NUMBERING_STYLE_REFERENCE_TAGS, style_id_map)
+            abstract_num_id_map[reference_abstract_id] = str(next_abstract_num_id)
+            next_abstract_num_id += 1
+            # every w:abstractNum precedes the w:num elements
+            if first_num is not None:
+                first_num.addprevious(abstract_num)
+            else:
+                numbering_element.append(abstract_num)
+
+        imported_num = copy.deepcopy(num)
+        imported_num.set(qn("w:numId"), str(next_num_id))
+        imported_num.find(qn("w:abstractNumId")).set(
+            qn("w:val"), abstract_num_id_map[reference_abstract_id]
+        )
+        numbering_element.append(imported_num)
+        num_id_map[num_id] = str(next_num_id)
+        next_num_id += 1
+
+    return num_id_map
+
+
+def _remap_values(
+    element: etree._Element, tags: tuple[str, ...], value_map: dict[str, str]
+) -> None:
+    """Rewrite the w:val of the given descendant tags through value_map."""
+    for child in element.iter(*(qn(tag) for tag in tags)):
+        value = child.get(qn("w:val"))
+        if value in value_map:
+            child.set(qn("w:val"), value_map[value])
+
+
+def _replace_blob_part(
+    doc: Document, reltype: str, partname: PackURI, content_type: str, blob: bytes
+) -> None:
+    """
+    Relate a new part holding the blob to the main document in place of the part it
+    relates to by reltype, if any. The new part takes the reference partname unless
+    another part still uses it.
+    """
+    main_part = doc.part
+    for r_id, rel in list(main_part.rels.items()):
+        if rel.reltype == reltype and not rel.is_external:
+            main_part.drop_rel(r_id)
+
+    package = main_part.package
+    if partname in {part.partname for part in package.iter_parts()}:
+        name = re.sub(r"\d*$", "", partname.filename[: -len(partname.ext) - 1])
+        partname = package.next_partname(f"{partname.baseURI}/{name}%d.{partname.ext}")
+    main_part.relate_to(Part(PackURI(partname), content_type, blob, package), reltype)
@@ -4,6 +4,12 @@ Formatting utilities.
 This module contains utilities for formatting paragraphs, lists, tables, and figures.
 """
 
+from .adjustment_rules_utils import (
+    apply_adjustment_rules,
+    build_trie_regex,
+    compile_adjustment_rules,
+    extract_required_literal,
+)
 from .bullet_list_styling_utils import (
     apply_bullet_character_updates,
     apply_list_termination_characters,
@@ -14,23 +20,77 @@ from .chapter_section_styles_utils import (
     apply_chapter_section_numbering_format,
     apply_section_numbering_order,
 )
+from .cross_reference_utils import (
+    apply_cross_reference_updates,
+    compile_cross_reference_pattern,
+)
+from .formula_styling_utils import (
+    apply_formula_rules,
+    get_formula_number_template,
+    is_equation_paragraph,
+)
+from .page_setup_utils import (
+    apply_default_font,
+    apply_page_setup,
+    compile_page_setup,
+)
 from .paragraph_cleaning_utils import (
     apply_empty_paragraph_removal,
     apply_paragraph_cleaning,
     is_paragraph_empty,
 )
-from .table_figure_titles_utils import apply_source_styles, apply_table_figure_styles
+from .run_coalescing_utils import apply_run_coalescing, coalesce_paragraph_runs
+from .table_figure_titles_utils import (
+    apply_object_caption_styles,
+    apply_source_styles,
+    apply_table_figure_numbering,
+    apply_table_figure_styles,
+)
+from .table_styling_utils import (
+    apply_table_style_definition,
+    apply_table_styles,
+    compile_table_look,
+    has_table_style_rules,
+)
+from .xml_slimming_utils import (
+    apply_xml_slimming,
+    collect_referenced_bookmark_names,
+    slim_part_element,
+)
 
 __all__ = [
+    "apply_adjustment_rules",
     "apply_bullet_character_updates",
     "apply_chapter_page_breaks",
     "apply_chapter_section_numbering_format",
+    "apply_cross_reference_updates",
+    "apply_default_font",
     "apply_empty_paragraph_removal",
+    "apply_formula_rules",
     "apply_list_termination_characters",
+    "apply_object_caption_styles",
+    "apply_page_setup",
     "apply_paragraph_cleaning",
+    "apply_run_coalescing",
     "apply_section_numbering_order",
     "apply_source_styles",
+    "apply_table_figure_numbering",
     "apply_table_figure_styles",
+    "apply_table_style_definition",
+    "apply_table_styles",
+    "apply_xml_slimming",
+    "build_trie_regex",
+    "coalesce_paragraph_runs",
+    "collect_referenced_bookmark_names",
+    "compile_adjustment_rules",
+    "compile_cross_reference_pattern",
+    "compile_page_setup",
+    "compile_table_look",
+    "extract_required_literal",
     "find_all_list_paragraphs",
+    "get_formula_number_template",
+    "has_table_style_rules",
+    "is_equation_paragraph",
     "is_paragraph_empty",
+    "slim_part_element",
 ]
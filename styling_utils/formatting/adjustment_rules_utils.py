@@ -0,0 +1,212 @@
+import re
+from typing import Callable, Pattern
+
+from docx.document import Document
+
+try:
+    import re._parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+TRIE_END = ""
+
+CompiledAdjustment = tuple[Pattern[str], Callable[[re.Match], str]]
+
+
+def compile_adjustment_rules(
+    rules: list[dict[str, str | bool]],
+) -> Callable[[str], tuple[str, int]]:
+    """
+    Compile find-and-replace rules into a function returning (new text, replacements).
+
+    Literal rules are grouped by (ignore_case, whole_word) and each group is compiled
+    from a character trie into one regex, so matching cost does not grow with the
+    number of literals. A group works as one dictionary: at each position the longest
+    term wins, and replaced text is not matched again by the group. Literal groups
+    run before the regex rules.
+
+    Regex rules run one after the other in config order, each on the output of the
+    previous ones. Rules with a required literal ("anchor") are prefiltered: one trie
+    scan finds the anchors present in the text and only those rules run; the text is
+    scanned again after a rule changed it.
+    """
+    literal_groups: dict[tuple[bool, bool], dict[str, str]] = {}
+    regex_rules: list[tuple[Pattern[str], str]] = []
+    anchored_indexes: set[int] = set()
+    rule_indexes_by_anchor: dict[str, list[int]] = {}
+
+    for rule in rules:
+        find = rule.get("find")
+        if not find:
+            continue
+
+        if rule.get("regex", False):
+            pattern = re.compile(find, re.IGNORECASE if rule.get("ignore_case") else 0)
+            anchor = extract_required_literal(pattern)
+            if anchor:
+                rule_indexes_by_anchor.setdefault(anchor.lower(), []).append(
+                    len(regex_rules)
+                )
+                anchored_indexes.add(len(regex_rules))
+            regex_rules.append((pattern, rule.get("replace", "")))
+            continue
+
+        ignore_case = rule.get("ignore_case", False)
+        whole_word = rule.get("whole_word", True)
+        key = find.lower() if ignore_case else find
+        literal_groups.setdefault((ignore_case, whole_word), {}).setdefault(
+            key, rule.get("replace", "")
+        )
+
+    literal_adjustments = [
+        _compile_literal_group(replacements, ignore_case, whole_word)
+        for (ignore_case, whole_word), replacements in literal_groups.items()
+    ]
+
+    anchor_pattern = None
+    if rule_indexes_by_anchor:
+        anchor_pattern = re.compile(
+            f"(?=({build_trie_regex(list(rule_indexes_by_anchor))}))"
+        )
+        rule_indexes_by_anchor = _include_prefix_anchor_rules(rule_indexes_by_anchor)
+
+    def find_triggered_rules(text: str) -> set[int]:
+        triggered_indexes = set()
+        for match in anchor_pattern.finditer(text.lower()):
+            triggered_indexes.update(rule_indexes_by_anchor[match.group(1)])
+        return triggered_indexes
+
+    def adjust_text(text: str) -> tuple[str, int]:
+        replacements_count = 0
+        for pattern, replace in literal_adjustments:
+            text, count = pattern.subn(replace, text)
+            replacements_count += count
+
+        if not regex_rules:
+            return text, replacements_count
+
+        triggered_indexes = find_triggered_rules(text) if anchor_pattern else set()
+        for index, (pattern, replace) in enumerate(regex_rules):
+            if index in anchored_indexes and index not in triggered_indexes:
+                continue
+
+            text, count = pattern.subn(replace, text)
+            if count:
+                replacements_count += count
+                if anchor_pattern is not None:
+                    triggered_indexes = find_triggered_rules(text)
+
+        return text, replacements_count
+
+    return adjust_text
+
+
+def apply_adjustment_rules(
+    doc: Document,
+    adjustment_rules: dict[str, list[dict[str, str | bool]]],
+    w_tags: dict[str, str],
+) -> int:
+    """
+    Apply find-and-replace adjustment rules to all body paragraphs in one pass.
+    Replacements are made inside each w:t element, so runs and their formatting stay
+    intact; matches spanning two runs are not replaced.
+    Returns the number of replacements made.
+    """
+    rules = adjustment_rules.get("rules", [])
+    if not rules:
+        return 0
+
+    adjust_text = compile_adjustment_rules(rules)
+    replacements_count = 0
+    for t_element in doc.element.body.iter(w_tags["t"]):
+        if not t_element.text:
+            continue
+
+        text, count = adjust_text(t_element.text)
+        if count:
+            t_element.text = text
+            replacements_count += count
+
+    return replacements_count
+
+
+def extract_required_literal(pattern: Pattern[str]) -> str:
+    """
+    Return the longest run of literal characters every match of the pattern must
+    contain, or "" if the pattern has none at its top level.
+    """
+    longest = current = ""
+    for op, value in sre_parse.parse(pattern.pattern, pattern.flags):
+        if op is sre_parse.LITERAL:
+            current += chr(value)
+            continue
+        if op is not sre_parse.AT:
+            longest = max(longest, current, key=len)
+            current = ""
+    return max(longest, current, key=len)
+
+
+def build_trie_regex(words: list[str]) -> str:
+    """Build a regex alternation from a character trie of the given words."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[TRIE_END] = {}
+
+    return _trie_node_to_regex(trie)
+
+
+def _trie_node_to_regex(node: dict) -> str:
+    """Convert a trie node into a regex fragment matching all its suffixes."""
+    is_word_end = TRIE_END in node
+    alternatives = [
+        re.escape(char) + _trie_node_to_regex(child)
+        for char, child in sorted(node.items())
+        if char != TRIE_END
+    ]
+
+    if not alternatives:
+        return ""
+
+    if len(alternatives) == 1:
+        fragment = alternatives[0]
+        if is_word_end:
+            return f"(?:{fragment})?"
+        return fragment
+
+    fragment = f"(?:{'|'.join(alternatives)})"
+    return f"{fragment}?" if is_word_end else fragment
+
+
+def _include_prefix_anchor_rules(
+    rule_indexes_by_anchor: dict[str, list[int]],
+) -> dict[str, list[int]]:
+    """
+    Extend each anchor's rules with the rules of anchors that are its prefixes, since
+    the anchor scan reports only the longest anchor starting at each position.
+    """
+    return {
+        anchor: [
+            index
+            for end in range(1, len(anchor) + 1)
+            for index in rule_indexes_by_anchor.get(anchor[:end], [])
+        ]
+        for anchor in rule_indexes_by_anchor
+    }
+
+
+def _compile_literal_group(
+    replacements: dict[str, str], ignore_case: bool, whole_word: bool
+) -> CompiledAdjustment:
+    """Compile a group of literal rules sharing the same flags into one trie regex."""
+    pattern = build_trie_regex(list(replacements))
+    if whole_word:
+        pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+
+    compiled = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+    if ignore_case:
+        return compiled, lambda match: replacements[match.group(0).lower()]
+    return compiled, lambda match: replacements[match.group(0)]
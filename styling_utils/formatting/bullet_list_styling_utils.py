@@ -3,6 +3,13 @@ from xml.etree.ElementTree import Element
 from docx.document import Document
 from docx.text.paragraph import Paragraph
 
+from ..core.paragraph_view_utils import ParagraphView
+from ..numbering.document_index_utils import (
+    DocumentIndex,
+    build_document_index,
+    find_list_groups,
+)
+
 
 def ensure_child(parent: Element, tag: str) -> Element:
     """Create or find a child element with the given tag."""
@@ -57,7 +64,10 @@ def apply_bullet_character_updates(
 
 
 def apply_list_termination_characters(
-    doc: Document, list_config: dict[str, str | dict[str, str]], w_tags: dict[str, str]
+    doc: Document,
+    list_config: dict[str, str | dict[str, str]],
+    w_tags: dict[str, str],
+    document_index: DocumentIndex | None = None,
 ) -> None:
     """
     Apply termination characters to list items based on the configuration.
@@ -72,53 +82,20 @@ def apply_list_termination_characters(
     if not intermediate_char and not last_item_char:
         return
 
-    list_paragraphs_info = find_all_list_paragraphs(doc, w_tags)
-    if not list_paragraphs_info:
-        return
-
-    _apply_termination_to_list_groups(
-        list_paragraphs_info, intermediate_char, last_item_char
-    )
-
-
-def _apply_termination_to_list_groups(
-    list_paragraphs_info: list[tuple[Paragraph, str, int]],
-    intermediate_char: str,
-    last_item_char: str,
-) -> None:
-    """
-    Apply termination characters to grouped list paragraphs.
-    """
-    if not list_paragraphs_info:
-        return
-
-    current_group = []
-    current_num_id = None
-
-    for para_info in list_paragraphs_info:
-        _, num_id, level = para_info
-
-        if num_id != current_num_id or (
-            current_group and level == 0 and current_group[-1][2] > 0
-        ):
-            if current_group:
-                _apply_termination_to_single_group(
-                    current_group, intermediate_char, last_item_char
-                )
-
-            current_group = [para_info]
-            current_num_id = num_id
-        else:
-            current_group.append(para_info)
+    if document_index is None:
+        document_index = build_document_index(doc, w_tags)
 
-    if current_group:
+    views = document_index["views"]
+    for group in find_list_groups(document_index):
         _apply_termination_to_single_group(
-            current_group, intermediate_char, last_item_char
+            [views[position] for position in group],
+            intermediate_char,
+            last_item_char,
         )
 
 
 def _apply_termination_to_single_group(
-    group_paragraphs: list[tuple[Paragraph, str, int]],
+    group_paragraphs: list[ParagraphView],
     intermediate_char: str,
     last_item_char: str,
 ) -> None:
@@ -129,15 +106,16 @@ def _apply_termination_to_single_group(
         return
 
     if intermediate_char:
-        for paragraph, _, _ in group_paragraphs[:-1]:
+        for paragraph in group_paragraphs[:-1]:
             _apply_termination_character(paragraph, intermediate_char)
 
     if last_item_char and group_paragraphs:
-        last_paragraph, _, _ = group_paragraphs[-1]
-        _apply_termination_character(last_paragraph, last_item_char)
+        _apply_termination_character(group_paragraphs[-1], last_item_char)
 
 
-def _apply_termination_character(paragraph: Paragraph, termination_char: str) -> None:
+def _apply_termination_character(
+    paragraph: ParagraphView, termination_char: str
+) -> None:
     """
     Apply a termination character to a single paragraph if needed.
     """
@@ -151,7 +129,7 @@ def _apply_termination_character(paragraph: Paragraph, termination_char: str) ->
     cleaned_text = text.rstrip(".;,:").strip()
 
     if cleaned_text:
-        paragraph.text = f"{cleaned_text}{termination_char}"
+        paragraph.set_text(f"{cleaned_text}{termination_char}")
 
 
 def _get_numbering_info(
@@ -186,13 +164,14 @@ def find_all_list_paragraphs(
 ) -> list[tuple[Paragraph, str, int]]:
     """
     Find all paragraphs that are part of lists (bulleted or numbered) in the document.
+    numId 0 removes a paragraph from its list, so such paragraphs are skipped.
     Returns a list of tuples (paragraph, num_id, level).
     """
     list_paragraphs = []
 
     for paragraph in doc.paragraphs:
         num_id, level = _get_numbering_info(paragraph, w_tags)
-        if num_id is not None:
+        if num_id not in (None, "0"):
             list_paragraphs.append((paragraph, num_id, level))
 
     return list_paragraphs
@@ -232,10 +211,14 @@ def _apply_bullet_configuration_with_inheritance(
     Apply bullet configuration with inheritance from parent levels.
     If a level doesn't have a bullet_char specified, it inherits from the parent level.
     If indentation is not specified, uses default indentation values.
+    Lists linked to paragraph styles (e.g. native heading numbering) are skipped.
     """
     for abstract_num in abstract_nums:
         levels = abstract_num.findall(f'.//{w_tags["lvl"]}')
 
+        if any(level.find(w_tags["pStyle"]) is not None for level in levels):
+            continue
+
         for level in levels:
             level_num = _get_level_number(level, w_tags)
 
@@ -1,26 +1,36 @@
 from docx.document import Document
 
-from ..numbering.numbering_utils import (
-    process_paragraph_text,
-    update_paragraph_numbering,
+from ..numbering.document_index_utils import (
+    DocumentIndex,
+    build_document_index,
+    find_style_run_starts,
+)
+from ..numbering.numbering_utils import process_paragraph_text
+from ..numbering.outline_numbering_utils import apply_outline_numbering
+
+DEFAULT_HEADING_LEVEL_STYLES = (
+    "chapter_titles",
+    "subchapter_titles_level_2",
+    "subchapter_titles_level_3",
 )
 
 
 def apply_chapter_page_breaks(
-    doc: Document, style_names_mapping: dict[str, str]
+    doc: Document,
+    style_names_mapping: dict[str, str],
+    document_index: DocumentIndex | None = None,
 ) -> None:
     """
     Ensure only the first paragraph of each 'chapter_titles' block starts on a new page.
     """
-    page_break_applied = False
+    if document_index is None:
+        document_index = build_document_index(doc)
 
-    for paragraph in doc.paragraphs:
-        if paragraph.style.name == style_names_mapping["chapter_titles"]:
-            if not page_break_applied:
-                paragraph.paragraph_format.page_break_before = True
-                page_break_applied = True
-        else:
-            page_break_applied = False
+    views = document_index["views"]
+    for position in find_style_run_starts(
+        document_index, style_names_mapping["chapter_titles"]
+    ):
+        views[position].paragraph.paragraph_format.page_break_before = True
 
 
 def apply_chapter_section_numbering_format(
@@ -29,15 +39,19 @@ def apply_chapter_section_numbering_format(
     style_attributes_names_mapping: dict[str, str],
     chapter_section_numbering_regex: dict[str, str],
     renumbering_regex: dict[str, str] | None = None,
+    document_index: DocumentIndex | None = None,
 ) -> None:
     """
     Adjust numbering in chapter/section titles based on YAML config.
     - numbering_format: { type: ROMAN|ARABIC, side: LEFT|RIGHT, separator: " " }
     """
+    if document_index is None:
+        document_index = build_document_index(doc)
 
-    for paragraph in doc.paragraphs:
-        style_name = paragraph.style.name
-        style_def = style_definitions.get(style_name)
+    style_names = document_index["style_names"]
+    views = document_index["views"]
+    for position, style_code in enumerate(document_index["style_codes"]):
+        style_def = style_definitions.get(style_names[style_code])
 
         if not style_def:
             continue
@@ -52,16 +66,17 @@ def apply_chapter_section_numbering_format(
         if not numbering_type or not numbering_side:
             continue
 
+        view = views[position]
         processed_text = process_paragraph_text(
-            paragraph.text.strip(),
+            view.text.strip(),
             numbering_type.upper(),
             numbering_side.upper(),
             chapter_section_numbering_regex,
             separator,
         )
 
-        if processed_text != paragraph.text:
-            paragraph.text = " ".join(processed_text.split())
+        if processed_text != view.text:
+            view.set_text(" ".join(processed_text.split()))
 
 
 def apply_section_numbering_order(
@@ -71,6 +86,10 @@ def apply_section_numbering_order(
     style_attributes_names_mapping: dict[str, str] | None = None,
     chapter_section_numbering_regex: dict[str, str] | None = None,
     renumbering_regex: dict[str, str] | None = None,
+    start_chapter: int = 0,
+    label_map: dict[str, str] | None = None,
+    document_index: DocumentIndex | None = None,
+    heading_level_styles: list[str] | None = None,
 ) -> None:
     """
     Adjust section numbering based on hierarchy:
@@ -80,69 +99,22 @@ def apply_section_numbering_order(
     3. Find all subchapter_titles_level_3 until next subchapter_titles_level_2 and assign them
        current_chapter = current_chapter, subchapter_titles_level_2 = subchapter_titles_level_2,
        and subchapter_titles_level_3 grows by one
-    """
 
-    current_chapter = 0
-    current_subchapter_level_2 = 0
-    current_subchapter_level_3 = 0
-
-    in_chapter = False
-    chapter_numbering_applied = False
-
-    for paragraph in doc.paragraphs:
-        style_name = paragraph.style.name
-
-        if style_name == style_names_mapping["chapter_titles"]:
-            if not chapter_numbering_applied:
-                current_chapter += 1
-                current_subchapter_level_2 = 0
-                current_subchapter_level_3 = 0
-                in_chapter = True
-                chapter_numbering_applied = True
-
-                paragraph.text = update_paragraph_numbering(
-                    paragraph.text,
-                    current_chapter,
-                    None,
-                    None,
-                    style_definitions,
-                    style_attributes_names_mapping,
-                    style_name,
-                    chapter_section_numbering_regex,
-                    renumbering_regex=renumbering_regex,
-                )
-
-        elif style_name == style_names_mapping["subchapter_titles_level_2"]:
-            if in_chapter:
-                current_subchapter_level_2 += 1
-                current_subchapter_level_3 = 0
-
-                paragraph.text = update_paragraph_numbering(
-                    paragraph.text,
-                    current_chapter,
-                    current_subchapter_level_2,
-                    None,
-                    style_definitions,
-                    style_attributes_names_mapping,
-                    style_name,
-                    chapter_section_numbering_regex,
-                    renumbering_regex=renumbering_regex,
-                )
-
-        elif style_name == style_names_mapping["subchapter_titles_level_3"]:
-            if in_chapter and current_subchapter_level_2 > 0:
-                current_subchapter_level_3 += 1
-
-                paragraph.text = update_paragraph_numbering(
-                    paragraph.text,
-                    current_chapter,
-                    current_subchapter_level_2,
-                    current_subchapter_level_3,
-                    style_definitions,
-                    style_attributes_names_mapping,
-                    style_name,
-                    chapter_section_numbering_regex,
-                    renumbering_regex=renumbering_regex,
-                )
-        else:
-            chapter_numbering_applied = False
+    start_chapter is the number of chapters preceding the document part being numbered.
+    Changed labels (e.g. "Chapter III" -> "Chapter 2") are recorded in label_map.
+    heading_level_styles lists the heading style keys by level; styles can also set
+    numbering_format.outline_level, for outlines of up to nine levels.
+    """
+    apply_outline_numbering(
+        doc=doc,
+        style_definitions=style_definitions or {},
+        style_names_mapping=style_names_mapping,
+        style_attributes_names_mapping=style_attributes_names_mapping,
+        heading_level_styles=heading_level_styles or list(DEFAULT_HEADING_LEVEL_STYLES),
+        caption_styles=[],
+        chapter_section_numbering_regex=chapter_section_numbering_regex,
+        renumbering_regex=renumbering_regex,
+        start_chapter=start_chapter,
+        label_map=label_map,
+        document_index=document_index,
+    )
@@ -0,0 +1,73 @@
+import re
+from typing import Pattern
+
+from docx.document import Document
+
+
+def compile_cross_reference_pattern(
+    label_map: dict[str, str],
+) -> tuple[Pattern[str], dict[str, tuple[str, str]]] | None:
+    """
+    Compile all old labels into one alternation regex.
+    Returns the pattern and a lookup of normalized old label -> (old number, new number),
+    or None if there is nothing to rewrite.
+    """
+    if not label_map:
+        return None
+
+    replacements = {}
+    alternatives = []
+    for old_label, new_label in sorted(
+        label_map.items(), key=lambda item: len(item[0]), reverse=True
+    ):
+        old_word, _, old_number = old_label.rpartition(" ")
+        _, _, new_number = new_label.rpartition(" ")
+        if not old_word or not old_number:
+            continue
+        replacements[old_label.casefold()] = (old_number, new_number)
+        alternatives.append(rf"{re.escape(old_word)}\s+{re.escape(old_number)}")
+
+    if not alternatives:
+        return None
+
+    pattern = re.compile(rf"\b(?:{'|'.join(alternatives)})(?![\w]|\.\w)", re.IGNORECASE)
+    return pattern, replacements
+
+
+def apply_cross_reference_updates(
+    doc: Document,
+    label_map: dict[str, str],
+    skip_style_names: set[str],
+    w_tags: dict[str, str],
+) -> int:
+    """
+    Rewrite references to renumbered labels ("see Table 2.3" -> "see Table 3.1") in
+    body paragraphs with a single combined regex, one sweep over the text elements.
+    Paragraphs with styles in skip_style_names (the renumbered titles) are left alone.
+    Returns the number of references rewritten.
+    """
+    compiled = compile_cross_reference_pattern(label_map)
+    if compiled is None:
+        return 0
+    pattern, replacements = compiled
+
+    skip_style_ids = {
+        style.style_id for style in doc.styles if style.name in skip_style_names
+    }
+    rewritten = 0
+
+    def replace_reference(match: re.Match) -> str:
+        nonlocal rewritten
+        matched_text = match.group(0)
+        old_number, new_number = replacements[" ".join(matched_text.split()).casefold()]
+        rewritten += 1
+        return matched_text[: len(matched_text) - len(old_number)] + new_number
+
+    for p_element in doc.element.body.iter(w_tags["p"]):
+        if p_element.style in skip_style_ids:
+            continue
+        for t_element in p_element.iter(w_tags["t"]):
+            if t_element.text:
+                t_element.text = pattern.sub(replace_reference, t_element.text)
+
+    return rewritten
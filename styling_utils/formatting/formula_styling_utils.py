@@ -0,0 +1,322 @@
+import re
+from typing import Callable
+
+from docx.document import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_TAB_ALIGNMENT
+from docx.oxml import OxmlElement
+from docx.text.run import Run
+from lxml import etree
+
+from ..core.paragraph_view_utils import ParagraphView
+from ..core.style_appliers import map_config_to_docx_attributes
+from ..numbering.document_index_utils import (
+    DocumentIndex,
+    build_document_index,
+    find_element_positions,
+    find_style_run_starts,
+)
+from ..numbering.number_formatters import compile_number_formatter
+
+SEQUENTIAL_GLOBAL = "Sequential_Global"
+SEQUENTIAL_CHAPTER = "Sequential_Chapter"
+
+FORMULA_LABEL_REGEX = re.compile(r"^\s*(?:[\[(]\s*[\w.\-]+\s*[\])])?\s*$")
+NUMBER_SAMPLE_REGEX = re.compile(r"\d+")
+
+
+def get_formula_number_template(number_format: str, levels: int) -> str:
+    """
+    Turn a number_format sample like "[1], [2], ..." or "(1.1), (1.2), ..." into a
+    number template ("[{1}]", "({1}.{2})") for the given number of levels.
+    The brackets come from the first label of the sample, the level separator from
+    its first two numbers (default ".").
+    """
+    sample = (number_format or "").split(",")[0].strip()
+    numbers = list(NUMBER_SAMPLE_REGEX.finditer(sample))
+    if not numbers:
+        sample, numbers = "(1)", list(NUMBER_SAMPLE_REGEX.finditer("(1)"))
+
+    separator = (
+        sample[numbers[0].end() : numbers[1].start()] if len(numbers) > 1 else "."
+    )
+    placeholders = separator.join(f"{{{level}}}" for level in range(1, levels + 1))
+    return sample[: numbers[0].start()] + placeholders + sample[numbers[-1].end() :]
+
+
+def is_equation_paragraph(p_element: etree._Element, w_tags: dict[str, str]) -> bool:
+    """
+    A display equation: the paragraph holds an m:oMath or m:oMathPara of its own and
+    its runs hold no text besides an equation number like "(3)" or "[2.1]" (and no
+    other content, such as drawings).
+    """
+    has_equation = any(
+        child.tag in (w_tags["oMath"], w_tags["oMathPara"]) for child in p_element
+    )
+    if not has_equation:
+        return False
+
+    run_text = []
+    for run in p_element.iterchildren(w_tags["r"]):
+        for item in run:
+            if item.tag == w_tags["t"]:
+                run_text.append(item.text or "")
+            elif item.tag not in (w_tags["rPr"], w_tags["tab"]):
+                return False
+    return FORMULA_LABEL_REGEX.match("".join(run_text)) is not None
+
+
+def apply_formula_rules(
+    doc: Document,
+    formula_rules: dict[str, str | dict],
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    paragraph_format_mapping: dict[str, tuple[str, Callable | None]],
+    w_tags: dict[str, str],
+    start_chapter: int = 0,
+    document_index: DocumentIndex | None = None,
+) -> int:
+    """
+    Number and lay out the display equations and style their description lists.
+
+    - numbering: Sequential_Global (1, 2, ... through the document) or
+      Sequential_Chapter (2.1, 2.2, ... restarting in every chapter); number_format
+      gives a sample of the labels, e.g. "[1], [2], ..." or "(1.1), (1.2), ..."
+    - numbered equations are laid out as center tab, equation, right tab, number at
+      the text width of the first section
+    - paragraph_format applies to the equation paragraphs, font_format to the numbers
+    - description_list styles the paragraph starting with keyword (e.g. "where")
+      right after an equation with keyword_style, and the following paragraphs up to
+      the first empty one with list_style
+
+    Equations are found through one pass over the body XML. Returns the number of
+    numbered equations.
+    """
+    if not formula_rules:
+        return 0
+
+    if document_index is None:
+        document_index = build_document_index(doc, w_tags)
+
+    views = document_index["views"]
+    equation_positions = [
+        position
+        for position in find_element_positions(
+            doc, document_index, [w_tags["oMath"], w_tags["oMathPara"]]
+        )
+        if is_equation_paragraph(views[position].element, w_tags)
+    ]
+    if not equation_positions:
+        return 0
+
+    numbering = formula_rules.get("numbering")
+    number_label = _compile_formula_number_label(
+        numbering, formula_rules.get("number_format", "")
+    )
+    chapter_starts = find_style_run_starts(
+        document_index, style_names_mapping.get("chapter_titles")
+    )
+    tab_positions = _get_number_tab_positions(doc)
+
+    paragraph_def = formula_rules.get(
+        style_attributes_names_mapping["paragraph_format"], {}
+    )
+    font_def = formula_rules.get(style_attributes_names_mapping["font_format"], {})
+
+    numbered_count = 0
+    equation_count = 0
+    chapter_index = 0
+    chapter_number = start_chapter
+    for position in equation_positions:
+        while (
+            chapter_index < len(chapter_starts)
+            and chapter_starts[chapter_index] < position
+        ):
+            chapter_index += 1
+            chapter_number += 1
+            if numbering == SEQUENTIAL_CHAPTER:
+                equation_count = 0
+
+        view = views[position]
+        if paragraph_def:
+            map_config_to_docx_attributes(
+                target=view.paragraph.paragraph_format,
+                config_data=paragraph_def,
+                mapping=paragraph_format_mapping,
+            )
+
+        if number_label is None:
+            continue
+        if numbering == SEQUENTIAL_CHAPTER and chapter_index == 0:
+            continue
+
+        equation_count += 1
+        levels = (
+            (chapter_number, equation_count)
+            if numbering == SEQUENTIAL_CHAPTER
+            else (equation_count,)
+        )
+        _set_equation_number(
+            view, number_label(levels), tab_positions, font_def, font_mapping, w_tags
+        )
+        numbered_count += 1
+
+    description_def = formula_rules.get("description_list") or {}
+    if description_def.get("keyword"):
+        _apply_description_list_styles(
+            document_index,
+            equation_positions,
+            description_def,
+            style_attributes_names_mapping,
+            font_mapping,
+            paragraph_format_mapping,
+        )
+
+    return numbered_count
+
+
+def _compile_formula_number_label(
+    numbering: str | None, number_format: str
+) -> Callable | None:
+    """Return the label formatter of a numbering mode, None when not numbering."""
+    if numbering == SEQUENTIAL_GLOBAL:
+        return compile_number_formatter(
+            "ARABIC", get_formula_number_template(number_format, 1)
+        )
+    if numbering == SEQUENTIAL_CHAPTER:
+        return compile_number_formatter(
+            "ARABIC", get_formula_number_template(number_format, 2)
+        )
+    return None
+
+
+def _get_number_tab_positions(doc: Document) -> tuple[int, int] | None:
+    """Return the center and right tab positions for the text width, if known."""
+    section = doc.sections[0] if len(doc.sections) else None
+    if section is None or None in (
+        section.page_width,
+        section.left_margin,
+        section.right_margin,
+    ):
+        return None
+
+    text_width = section.page_width - section.left_margin - section.right_margin
+    return text_width // 2, text_width
+
+
+def _set_equation_number(
+    view: ParagraphView,
+    label: str,
+    tab_positions: tuple[int, int] | None,
+    font_def: dict[str, str | int | bool],
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    w_tags: dict[str, str],
+) -> None:
+    """
+    Replace the equation number of a display equation and lay it out as center tab,
+    equation, right tab, number. A single-line m:oMathPara is unwrapped into an
+    inline m:oMath so the equation and its number share a line.
+    """
+    p_element = view.element
+    for run_element in list(p_element.iterchildren(w_tags["r"])):
+        p_element.remove(run_element)
+
+    for math_para in list(p_element.iterchildren(w_tags["oMathPara"])):
+        equations = list(math_para.iterchildren(w_tags["oMath"]))
+        if len(equations) == 1:
+            math_para.addprevious(equations[0])
+            p_element.remove(math_para)
+
+    first_equation = next(
+        p_element.iterchildren(w_tags["oMath"], w_tags["oMathPara"]), None
+    )
+    if tab_positions is not None:
+        leading_run = OxmlElement("w:r")
+        leading_run.append(OxmlElement("w:tab"))
+        first_equation.addprevious(leading_run)
+
+        paragraph_format = view.paragraph.paragraph_format
+        paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        paragraph_format.tab_stops.clear_all()
+        paragraph_format.tab_stops.add_tab_stop(
+            tab_positions[0], WD_TAB_ALIGNMENT.CENTER
+        )
+        paragraph_format.tab_stops.add_tab_stop(
+            tab_positions[1], WD_TAB_ALIGNMENT.RIGHT
+        )
+
+    number_run = Run(OxmlElement("w:r"), view.paragraph)
+    number_run.add_tab()
+    number_run.add_text(label)
+    p_element.append(number_run._r)
+    if font_def:
+        map_config_to_docx_attributes(
+            target=number_run.font, config_data=font_def, mapping=font_mapping
+        )
+
+    view.invalidate()
+
+
+def _apply_description_list_styles(
+    document_index: DocumentIndex,
+    equation_positions: list[int],
+    description_def: dict[str, str | dict],
+    style_attributes_names_mapping: dict[str, str],
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    paragraph_format_mapping: dict[str, tuple[str, Callable | None]],
+) -> None:
+    """
+    Collect the keyword paragraphs and list items after the equations, then apply
+    keyword_style and list_style to each group in one loop.
+    """
+    views = document_index["views"]
+    style_codes = document_index["style_codes"]
+    keyword = description_def["keyword"].strip().lower()
+    equation_position_set = set(equation_positions)
+
+    keyword_positions = []
+    item_positions = []
+    for equation_position in equation_positions:
+        keyword_position = equation_position + 1
+        if keyword_position >= len(views):
+            continue
+        keyword_text = views[keyword_position].text.strip().lower()
+        if (
+            not keyword_text.startswith(keyword)
+            or keyword_text[len(keyword) : len(keyword) + 1].isalnum()
+        ):
+            continue
+
+        keyword_positions.append(keyword_position)
+        position = keyword_position + 1
+        while (
+            position < len(views)
+            and position not in equation_position_set
+            and style_codes[position] == style_codes[keyword_position]
+            and views[position].text.strip()
+        ):
+            item_positions.append(position)
+            position += 1
+
+    for positions, style_key in (
+        (keyword_positions, "keyword_style"),
+        (item_positions, "list_style"),
+    ):
+        style_def = description_def.get(style_key) or {}
+        paragraph_def = style_def.get(
+            style_attributes_names_mapping["paragraph_format"], {}
+        )
+        font_def = style_def.get(style_attributes_names_mapping["font_format"], {})
+        for position in positions:
+            paragraph = views[position].paragraph
+            if paragraph_def:
+                map_config_to_docx_attributes(
+                    target=paragraph.paragraph_format,
+                    config_data=paragraph_def,
+                    mapping=paragraph_format_mapping,
+                )
+            if font_def:
+                for run in views[position].runs:
+                    map_config_to_docx_attributes(
+                        target=run.font, config_data=font_def, mapping=font_mapping
+                    )
@@ -4,17 +4,25 @@ from typing import Callable, Optional
 from docx.document import Document
 from docx.text.paragraph import Paragraph
 
-from styling_utils.core.style_appliers import map_config_to_docx_attributes
-from styling_utils.numbering.numbering_utils import expand_common_pattern
+from ..core.paragraph_view_utils import ParagraphView, as_paragraph_view
+from ..core.style_appliers import map_config_to_docx_attributes
+from ..numbering.document_index_utils import (
+    DocumentIndex,
+    build_document_index,
+)
+from ..numbering.numbering_utils import expand_common_pattern
 
 
 def apply_nested_paragraph_styling(
-    paragraph: Paragraph,
+    paragraph: Paragraph | ParagraphView,
     text_parts: list[tuple[str, Optional[dict]]],
     font_mapping: dict[str, tuple[str, Callable | None]],
     default_font_format: Optional[dict],
 ) -> None:
-    """Apply different font styles to different parts of a paragraph text."""
+    """Apply different font styles to different parts of a paragraph text.
+    A paragraph view is invalidated, as its runs are replaced."""
+    view = as_paragraph_view(paragraph)
+    paragraph = view.paragraph
     paragraph.clear()
     
     for text, font_format in text_parts:
@@ -36,6 +44,8 @@ def apply_nested_paragraph_styling(
                 mapping=font_mapping
             )
 
+    view.invalidate()
+
 
 def create_numbered_text_parts(
     text: str,
@@ -120,42 +130,33 @@ def apply_nested_numbering_to_paragraph(
     )
 
 
-def apply_pattern_styling_to_paragraph(
-    paragraph: Paragraph,
+def build_pattern_text_parts(
+    text: str,
     pattern: str,
-    font_mapping: dict[str, tuple[str, Callable | None]],
     pattern_font_format: Optional[dict],
     default_font_format: Optional[dict],
     numbering_format: str = "ARABIC",
-) -> None:
+) -> list[tuple[str, Optional[dict]]]:
     """
-    Apply styling to a specific pattern within a paragraph text.
-    
-    This function looks for a specific pattern (like "Source" or "number.number.number") 
-    in the paragraph text and applies different font formatting to that pattern vs. the rest of the text.
+    Split paragraph text into (text, font_format) parts so that the first match of
+    pattern gets pattern_font_format and the rest of the text default_font_format.
+    Returns an empty list when there is no text or no pattern.
     """
-    text = paragraph.text
     if not text or not pattern:
-        return
+        return []
 
     if "number" in pattern:
         expanded_pattern = expand_common_pattern(pattern, numbering_format)
         pattern_match = re.search(expanded_pattern, text, re.IGNORECASE)
     else:
         pattern_match = re.search(re.escape(pattern), text, re.IGNORECASE)
-    
+
     if not pattern_match:
-        apply_nested_paragraph_styling(
-            paragraph=paragraph,
-            text_parts=[(text, default_font_format)],
-            font_mapping=font_mapping,
-            default_font_format=default_font_format,
-        )
-        return
+        return [(text, default_font_format)]
 
     start_pos = pattern_match.start()
     end_pos = pattern_match.end()
-    
+
     text_parts = []
 
     if start_pos > 0:
@@ -168,7 +169,34 @@ def apply_pattern_styling_to_paragraph(
     if end_pos < len(text):
         after_text = text[end_pos:]
         text_parts.append((after_text, default_font_format))
+
+    return text_parts
+
+
+def apply_pattern_styling_to_paragraph(
+    paragraph: Paragraph | ParagraphView,
+    pattern: str,
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    pattern_font_format: Optional[dict],
+    default_font_format: Optional[dict],
+    numbering_format: str = "ARABIC",
+) -> None:
+    """
+    Apply styling to a specific pattern within a paragraph text.
     
+    This function looks for a specific pattern (like "Source" or "number.number.number") 
+    in the paragraph text and applies different font formatting to that pattern vs. the rest of the text.
+    """
+    text_parts = build_pattern_text_parts(
+        text=paragraph.text,
+        pattern=pattern,
+        pattern_font_format=pattern_font_format,
+        default_font_format=default_font_format,
+        numbering_format=numbering_format,
+    )
+    if not text_parts:
+        return
+
     apply_nested_paragraph_styling(
         paragraph=paragraph,
         text_parts=text_parts,
@@ -177,45 +205,36 @@ def apply_pattern_styling_to_paragraph(
     )
 
 
-def apply_nested_styling_to_paragraphs(
-    doc: Document,
+def get_nested_styling_rules(
     style_names_mapping: dict[str, str],
-    font_mapping: dict[str, tuple[str, Callable | None]],
     style_definitions: dict[str, dict[str, str | dict[str, str]]] | None,
     style_attributes_names_mapping: dict[str, str] | None,
-) -> None:
+) -> dict[str, dict[str, str | dict | None]]:
     """
-    Apply nested styling to paragraphs that have common_pattern_format with font_format.
-    
-    This function processes paragraphs and applies different font styles to common patterns
-    vs. the rest of the text when common_pattern_format includes font_format configuration.
-    
-    It automatically processes all styles that have the required properties.
+    Collect the nested styling rules per document style name: pattern,
+    pattern_font_format, default_font_format and numbering_format, for the styles
+    whose common_pattern_format has a font_format.
     """
+    if not style_definitions or not style_attributes_names_mapping:
+        return {}
 
     eligible_styles = set()
-    if style_definitions and style_attributes_names_mapping:
-        for style_key, style_def in style_definitions.items():
-            common_pattern_def = style_def.get(
-                style_attributes_names_mapping.get("common_pattern_format", "common_pattern_format"),
-                {},
-            )
-            if common_pattern_def.get("font_format"):
-                eligible_styles.add(style_names_mapping.get(style_key, style_key))
-    
-    for paragraph in doc.paragraphs:
-        style_name = paragraph.style.name
+    for style_key, style_def in style_definitions.items():
+        common_pattern_def = style_def.get(
+            style_attributes_names_mapping.get("common_pattern_format", "common_pattern_format"),
+            {},
+        )
+        if common_pattern_def.get("font_format"):
+            eligible_styles.add(style_names_mapping.get(style_key, style_key))
 
-        if style_name not in eligible_styles:
+    nested_rules = {}
+    seen_style_names = set()
+    for style_key, style_name in style_names_mapping.items():
+        if style_name not in eligible_styles or style_name in seen_style_names:
             continue
+        seen_style_names.add(style_name)
 
-        style_def = None
-        if style_definitions and style_attributes_names_mapping:
-            for style_key, mapped_name in style_names_mapping.items():
-                if mapped_name == style_name:
-                    style_def = style_definitions.get(style_key)
-                    break
-        
+        style_def = style_definitions.get(style_key)
         if not style_def:
             continue
 
@@ -223,30 +242,64 @@ def apply_nested_styling_to_paragraphs(
             style_attributes_names_mapping.get("common_pattern_format", "common_pattern_format"),
             {},
         )
-
         if not common_pattern_def.get("font_format"):
             continue
 
-        common_pattern = common_pattern_def.get("pattern", "")
-        common_pattern_font_format = common_pattern_def.get("font_format")
-
-        default_font_format = style_def.get(
-            style_attributes_names_mapping.get("font_format", "font_format"),
-            {},
-        )
-
-        # Get numbering format for pattern expansion
         numbering_def = style_def.get(
             style_attributes_names_mapping.get("numbering_format", "numbering_format"),
             {},
         )
-        numbering_format = numbering_def.get("type", "ARABIC")
-        
+        nested_rules[style_name] = {
+            "pattern": common_pattern_def.get("pattern", ""),
+            "pattern_font_format": common_pattern_def.get("font_format"),
+            "default_font_format": style_def.get(
+                style_attributes_names_mapping.get("font_format", "font_format"),
+                {},
+            ),
+            "numbering_format": numbering_def.get("type", "ARABIC"),
+        }
+
+    return nested_rules
+
+
+def apply_nested_styling_to_paragraphs(
+    doc: Document,
+    style_names_mapping: dict[str, str],
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    style_definitions: dict[str, dict[str, str | dict[str, str]]] | None,
+    style_attributes_names_mapping: dict[str, str] | None,
+    w_tags: dict[str, str] | None = None,
+    document_index: DocumentIndex | None = None,
+) -> None:
+    """
+    Apply nested styling to paragraphs that have common_pattern_format with font_format.
+    
+    This function processes paragraphs and applies different font styles to common patterns
+    vs. the rest of the text when common_pattern_format includes font_format configuration.
+    
+    It automatically processes all styles that have the required properties.
+    """
+    nested_rules = get_nested_styling_rules(
+        style_names_mapping, style_definitions, style_attributes_names_mapping
+    )
+    if not nested_rules:
+        return
+
+    if document_index is None:
+        document_index = build_document_index(doc, w_tags)
+
+    style_names = document_index["style_names"]
+    views = document_index["views"]
+    for position, style_code in enumerate(document_index["style_codes"]):
+        nested_rule = nested_rules.get(style_names[style_code])
+        if nested_rule is None:
+            continue
+
         apply_pattern_styling_to_paragraph(
-            paragraph=paragraph,
-            pattern=common_pattern,
+            paragraph=views[position],
+            pattern=nested_rule["pattern"],
             font_mapping=font_mapping,
-            pattern_font_format=common_pattern_font_format,
-            default_font_format=default_font_format,
-            numbering_format=numbering_format,
+            pattern_font_format=nested_rule["pattern_font_format"],
+            default_font_format=nested_rule["default_font_format"],
+            numbering_format=nested_rule["numbering_format"],
         )
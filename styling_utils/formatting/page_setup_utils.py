@@ -0,0 +1,130 @@
+from docx.document import Document
+from docx.oxml import OxmlElement
+from docx.oxml.shared import qn
+from docx.shared import Cm, Pt
+
+PORTRAIT = "PORTRAIT"
+LANDSCAPE = "LANDSCAPE"
+
+THEME_FONT_ATTRIBUTES = ("w:asciiTheme", "w:hAnsiTheme", "w:cstheme")
+# w:pgMar attributes (twips) of python-docx's default template, all required by the schema
+DEFAULT_PAGE_MARGINS = {
+    "w:top": "1440",
+    "w:right": "1800",
+    "w:bottom": "1440",
+    "w:left": "1800",
+    "w:header": "720",
+    "w:footer": "720",
+    "w:gutter": "0",
+}
+
+
+def compile_page_setup(
+    document_setup: dict[str, str | dict[str, float]],
+    page_sizes: dict[str, tuple[int, int]],
+) -> dict[str, dict[str, str]]:
+    """
+    Compile page_size, orientation and margins (in cm) into the w:pgSz and w:pgMar
+    attributes every section gets: {"pgSz": {...}, "pgMar": {...}}.
+    Raises ValueError for a page_size missing from page_sizes.
+    """
+    page_setup: dict[str, dict[str, str]] = {}
+
+    page_size = document_setup.get("page_size")
+    if page_size:
+        try:
+            width, height = page_sizes[page_size.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown page_size: {page_size}") from None
+
+        orientation = (document_setup.get("orientation") or PORTRAIT).upper()
+        if orientation == LANDSCAPE:
+            width, height = height, width
+        page_setup["pgSz"] = {qn("w:w"): str(width), qn("w:h"): str(height)}
+        if orientation == LANDSCAPE:
+            page_setup["pgSz"][qn("w:orient")] = "landscape"
+
+    margins = document_setup.get("margins") or {}
+    if margins:
+        page_setup["pgMar"] = {
+            qn(f"w:{side}"): str(Cm(margins[side]).twips)
+            for side in ("top", "bottom", "left", "right")
+            if margins.get(side) is not None
+        }
+
+    return page_setup
+
+
+def apply_page_setup(
+    doc: Document,
+    document_setup: dict[str, str | dict[str, float]],
+    page_sizes: dict[str, tuple[int, int]],
+) -> int:
+    """
+    Apply page_size, orientation and margins to every section in one sweep over the
+    section properties; header, footer and gutter margins are kept. A section
+    without w:pgMar gets the margins of the previous section (or python-docx's
+    defaults) for the attributes not configured.
+    Returns the number of sections updated.
+    """
+    page_setup = compile_page_setup(document_setup, page_sizes)
+    if not page_setup:
+        return 0
+
+    page_size_attributes = page_setup.get("pgSz")
+    margin_attributes = page_setup.get("pgMar")
+    previous_margins = {qn(name): value for name, value in DEFAULT_PAGE_MARGINS.items()}
+    section_count = 0
+    for section in doc.sections:
+        sect_pr = section._sectPr
+        if page_size_attributes:
+            page_size_element = sect_pr.get_or_add_pgSz()
+            page_size_element.attrib.pop(qn("w:orient"), None)
+            page_size_element.attrib.update(page_size_attributes)
+        if margin_attributes:
+            margin_element = sect_pr.pgMar
+            if margin_element is None:
+                margin_element = sect_pr.get_or_add_pgMar()
+                margin_element.attrib.update(previous_margins)
+            margin_element.attrib.update(margin_attributes)
+            previous_margins = dict(margin_element.attrib)
+        section_count += 1
+
+    return section_count
+
+
+def apply_default_font(doc: Document, default_font: dict[str, str | float]) -> None:
+    """
+    Write default_font (name, size in pt) into w:docDefaults of styles.xml, so runs
+    and styles without their own font inherit it.
+    """
+    if not default_font:
+        return
+
+    styles_element = doc.styles.element
+    doc_defaults = styles_element.find(qn("w:docDefaults"))
+    if doc_defaults is None:
+        doc_defaults = OxmlElement("w:docDefaults")
+        styles_element.insert(0, doc_defaults)
+
+    r_pr_default = doc_defaults.find(qn("w:rPrDefault"))
+    if r_pr_default is None:
+        r_pr_default = OxmlElement("w:rPrDefault")
+        doc_defaults.insert(0, r_pr_default)
+
+    r_pr = r_pr_default.find(qn("w:rPr"))
+    if r_pr is None:
+        r_pr = OxmlElement("w:rPr")
+        r_pr_default.append(r_pr)
+
+    font_name = default_font.get("name")
+    if font_name:
+        r_fonts = r_pr.get_or_add_rFonts()
+        for attribute in THEME_FONT_ATTRIBUTES:
+            r_fonts.attrib.pop(qn(attribute), None)
+        for attribute in ("w:ascii", "w:hAnsi", "w:cs"):
+            r_fonts.set(qn(attribute), font_name)
+
+    font_size = default_font.get("size")
+    if font_size:
+        r_pr.sz_val = Pt(font_size)
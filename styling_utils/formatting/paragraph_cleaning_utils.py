@@ -1,34 +1,47 @@
 from docx.text.paragraph import Paragraph
 
+from ..core.paragraph_view_utils import ParagraphView, as_paragraph_view
 
-def apply_paragraph_cleaning(paragraph: Paragraph, trim_spaces: bool = True) -> None:
+
+def apply_paragraph_cleaning(
+    paragraph: Paragraph | ParagraphView, trim_spaces: bool = True
+) -> None:
     """
     Trim leading/trailing whitespace/newlines from paragraph text,
     without touching inline objects like images or equations.
     """
-    if trim_spaces and paragraph.text:
-        paragraph.text = paragraph.text.lstrip("\n\r ").rstrip("\n\r ")
+    view = as_paragraph_view(paragraph)
+    if not trim_spaces or not view.text:
+        return
+
+    trimmed_text = view.text.lstrip("\n\r ").rstrip("\n\r ")
+    if trimmed_text != view.text:
+        view.set_text(trimmed_text)
 
 
 def apply_empty_paragraph_removal(
-    paragraph: Paragraph, openxml_formats: dict[str, str]
+    paragraph: Paragraph | ParagraphView, openxml_formats: dict[str, str]
 ) -> None:
     """
     Remove a paragraph only if it is truly empty (no text, no runs, no images/equations).
     """
-    if is_paragraph_empty(paragraph, openxml_formats):
-        p_element = paragraph._element
+    view = as_paragraph_view(paragraph)
+    if is_paragraph_empty(view, openxml_formats):
+        p_element = view.element
         p_element.getparent().remove(p_element)
 
 
-def is_paragraph_empty(paragraph: Paragraph, openxml_formats: dict[str, str]) -> bool:
+def is_paragraph_empty(
+    paragraph: Paragraph | ParagraphView, openxml_formats: dict[str, str]
+) -> bool:
     """
     Determine if a paragraph is truly empty (no text, no runs, no inline shapes, pictures, or math).
     """
-    if paragraph.text.strip():
+    view = as_paragraph_view(paragraph)
+    if view.text.strip():
         return False
 
-    p_elem = paragraph._element
+    p_elem = view.element
     if (
         p_elem.findall(f".//{{{openxml_formats['M']}}}oMath")
         or p_elem.findall(f".//{{{openxml_formats['W']}}}drawing")
@@ -37,4 +50,4 @@ def is_paragraph_empty(paragraph: Paragraph, openxml_formats: dict[str, str]) ->
     ):
         return False
 
-    return all(not run.text.strip() for run in paragraph.runs)
+    return all(not run.text.strip() for run in view.runs)
@@ -0,0 +1,92 @@
+from docx.document import Document
+from lxml import etree
+
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+
+def apply_run_coalescing(doc: Document, w_tags: dict[str, str]) -> int:
+    """
+    Merge adjacent text runs with identical run properties in all body paragraphs.
+    Spell-check markers between mergeable runs are dropped.
+    Returns the number of runs removed.
+    """
+    removed_runs = 0
+
+    for p_element in doc.element.body.iter(w_tags["p"]):
+        removed_runs += coalesce_paragraph_runs(p_element, w_tags)
+
+    return removed_runs
+
+
+def coalesce_paragraph_runs(p_element: etree._Element, w_tags: dict[str, str]) -> int:
+    """
+    Merge adjacent text runs of a single paragraph element.
+    Returns the number of runs removed.
+    """
+    removed_runs = 0
+    previous_run = None
+    previous_key = None
+    pending_markers = []
+
+    for child in list(p_element):
+        if child.tag == w_tags["proofErr"]:
+            pending_markers.append(child)
+            continue
+
+        run_key = _get_run_merge_key(child, w_tags)
+        if run_key is None:
+            previous_run, previous_key = None, None
+            pending_markers = []
+            continue
+
+        if previous_run is not None and run_key == previous_key:
+            _append_run_text(previous_run, child, w_tags)
+            p_element.remove(child)
+            for marker in pending_markers:
+                p_element.remove(marker)
+            removed_runs += 1
+        else:
+            previous_run, previous_key = child, run_key
+
+        pending_markers = []
+
+    return removed_runs
+
+
+def _get_run_merge_key(element: etree._Element, w_tags: dict[str, str]) -> bytes | None:
+    """
+    Return a comparison key for a plain text run (only rPr and w:t children),
+    or None if the element cannot take part in merging.
+    """
+    if element.tag != w_tags["r"]:
+        return None
+
+    run_properties = b""
+    has_text = False
+    for child in element:
+        if child.tag == w_tags["rPr"]:
+            run_properties = etree.tostring(child)
+        elif child.tag == w_tags["t"]:
+            has_text = True
+        else:
+            return None
+
+    return run_properties if has_text else None
+
+
+def _append_run_text(
+    target_run: etree._Element, source_run: etree._Element, w_tags: dict[str, str]
+) -> None:
+    """Append the text of source_run to target_run, keeping a single w:t element."""
+    text_elements = target_run.findall(w_tags["t"])
+    target_t = text_elements[0]
+
+    merged_text = "".join(
+        t.text or "" for t in text_elements + source_run.findall(w_tags["t"])
+    )
+    for text_element in text_elements[1:]:
+        target_run.remove(text_element)
+    target_t.text = merged_text
+
+    if merged_text != merged_text.strip():
+        target_t.set(XML_SPACE, "preserve")
@@ -1,10 +1,27 @@
+import re
 from typing import Callable
 
 from docx.document import Document
 
 from document_formatter_config import DocumentFormatterConfig
-from styling_utils.core.style_appliers import apply_docx_style_definitions
-from styling_utils.numbering.numbering_utils import apply_chapter_based_numbering
+
+from ..core.style_appliers import apply_docx_style_definitions
+from ..numbering.document_index_utils import (
+    FIGURE_OBJECT,
+    NO_POSITION,
+    TABLE_OBJECT,
+    build_document_index,
+    build_object_index,
+)
+from ..numbering.numbering_utils import get_common_pattern
+from ..numbering.outline_numbering_utils import (
+    apply_chapter_based_numbering,
+)
+
+OBJECT_CAPTION_STYLE_KEYS = {
+    TABLE_OBJECT: "table_titles",
+    FIGURE_OBJECT: "figure_titles",
+}
 
 
 def apply_table_figure_styles(
@@ -16,8 +33,12 @@ def apply_table_figure_styles(
     style_names_mapping: dict[str, str],
     chapter_section_numbering_regex: dict[str, str],
     renumbering_regex: dict[str, str],
+    start_chapter: int = 0,
+    apply_numbering: bool = True,
+    label_map: dict[str, str] | None = None,
 ) -> None:
-    """Apply table and figure title styles from the configuration."""
+    """Apply table and figure title styles from the configuration.
+    Text-based caption numbering is skipped when apply_numbering is False."""
     table_figure_styles = {}
     if "table_titles" in config.chapter_and_section_rules:
         table_figure_styles["table_titles"] = config.chapter_and_section_rules[
@@ -37,6 +58,9 @@ def apply_table_figure_styles(
             paragraph_format_mapping=paragraph_format_mapping,
         )
 
+        if not apply_numbering:
+            return
+
         apply_table_figure_numbering(
             doc,
             config,
@@ -44,6 +68,8 @@ def apply_table_figure_styles(
             style_attributes_names_mapping,
             chapter_section_numbering_regex,
             renumbering_regex,
+            start_chapter,
+            label_map,
         )
 
 
@@ -72,6 +98,8 @@ def apply_table_figure_numbering(
     style_attributes_names_mapping: dict[str, str],
     chapter_section_numbering_regex: dict[str, str],
     renumbering_regex: dict[str, str],
+    start_chapter: int = 0,
+    label_map: dict[str, str] | None = None,
 ) -> None:
     """Apply chapter-based numbering for table and figure titles using reusable utilities."""
     target_styles = []
@@ -95,6 +123,128 @@ def apply_table_figure_numbering(
             style_attributes_names_mapping=style_attributes_names_mapping,
             chapter_section_numbering_regex=chapter_section_numbering_regex,
             target_styles=target_styles,
-            use_common_pattern=True,
             renumbering_regex=renumbering_regex,
+            start_chapter=start_chapter,
+            label_map=label_map,
         )
+
+
+def apply_object_caption_styles(
+    doc: Document,
+    config: DocumentFormatterConfig,
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    caption_sequence_names: dict[str, str],
+    w_tags: dict[str, str],
+) -> int:
+    """
+    Give the paragraphs around tables and figures their caption and source styles.
+
+    The paragraph directly before or after an object whose text starts with the
+    common pattern of table_titles / figure_titles (by default the caption sequence
+    name, e.g. "Table") followed by a number or label ("Table 2.1", "Figure IV",
+    "Table A") gets that style; the first paragraph below the object, or below its
+    caption, starting with the common pattern of source_text gets source_text.
+    Neighbours come from the object index, so only the paragraphs around objects
+    are read.
+    Returns the number of paragraphs restyled.
+    """
+    caption_patterns = {}
+    for kind, style_key in OBJECT_CAPTION_STYLE_KEYS.items():
+        style_def = config.chapter_and_section_rules.get(style_key)
+        if style_def is None:
+            continue
+        pattern = get_common_pattern(
+            style_def, style_attributes_names_mapping
+        ) or caption_sequence_names.get(style_key)
+        if pattern:
+            caption_patterns[kind] = (
+                _compile_caption_label_pattern(pattern),
+                style_names_mapping[style_key],
+            )
+
+    source_style_name = style_names_mapping["source_text"]
+    source_pattern = get_common_pattern(
+        (config.source_rules or {}).get(source_style_name),
+        style_attributes_names_mapping,
+    )
+    source_regex = (
+        _compile_leading_word_pattern(source_pattern) if source_pattern else None
+    )
+
+    if not caption_patterns and source_regex is None:
+        return 0
+
+    document_index = build_document_index(doc, w_tags)
+    object_index = build_object_index(doc, document_index, w_tags)
+    views = document_index["views"]
+    style_names = document_index["style_names"]
+    style_codes = document_index["style_codes"]
+    styles_by_name = {}
+
+    restyled_count = 0
+    for kind, before, after in zip(
+        object_index["kinds"], object_index["before"], object_index["after"]
+    ):
+        caption_regex, caption_style_name = caption_patterns.get(kind, (None, None))
+        matches = []
+        if _matches_at(caption_regex, views, before):
+            matches.append((before, caption_style_name))
+        source_position = after
+        if _matches_at(caption_regex, views, after):
+            matches.append((after, caption_style_name))
+            source_position = _get_next_position(views, after)
+        if _matches_at(source_regex, views, source_position):
+            matches.append((source_position, source_style_name))
+
+        for position, style_name in matches:
+            if style_names[style_codes[position]] == style_name:
+                continue
+            if style_name not in styles_by_name:
+                try:
+                    styles_by_name[style_name] = doc.styles[style_name]
+                except KeyError:
+                    styles_by_name[style_name] = None
+            if styles_by_name[style_name] is None:
+                continue
+
+            views[position].paragraph.style = styles_by_name[style_name]
+            views[position].invalidate()
+            restyled_count += 1
+
+    return restyled_count
+
+
+def _matches_at(regex: re.Pattern | None, views: list, position: int) -> bool:
+    """Return whether the paragraph at a position exists and matches the regex."""
+    return (
+        regex is not None
+        and position != NO_POSITION
+        and regex.match(views[position].text) is not None
+    )
+
+
+def _get_next_position(views: list, position: int) -> int:
+    """Return the position of the paragraph directly after, if it is the next block."""
+    next_position = position + 1
+    if (
+        next_position < len(views)
+        and views[position].element.getnext() is views[next_position].element
+    ):
+        return next_position
+    return NO_POSITION
+
+
+def _compile_caption_label_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile a match for text starting with the pattern word (in any case) followed
+    by a caption number or label, so that sentences such as "Table shows ..." or
+    "Tables 1 and 2 ..." are not taken for captions.
+    """
+    label = r"(?:\d+|[IVXLCDM]+|[A-Z])"
+    return re.compile(rf"^\s*(?i:{re.escape(pattern)})\s+{label}(?:[.\-]{label})*\b")
+
+
+def _compile_leading_word_pattern(pattern: str) -> re.Pattern:
+    """Compile a case-insensitive match for text starting with the pattern word."""
+    return re.compile(rf"^\s*{re.escape(pattern)}\b", re.IGNORECASE)
@@ -0,0 +1,295 @@
+import contextlib
+from typing import Callable
+
+from docx.document import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.shared import qn
+from docx.styles.style import _TableStyle
+from docx.text.font import Font
+from docx.text.paragraph import ParagraphFormat
+
+from ..core.style_appliers import (
+    apply_docx_style_attributes,
+    map_config_to_docx_attributes,
+)
+
+DEFAULT_TABLE_STYLE = "Normal Table"
+BORDER_SIDES = ("top", "left", "bottom", "right", "insideH", "insideV")
+
+# w:tblLook flags and the bits of its legacy hexadecimal w:val
+TABLE_LOOK_FLAGS = {
+    "firstRow": 0x0020,
+    "lastRow": 0x0040,
+    "firstColumn": 0x0080,
+    "lastColumn": 0x0100,
+    "noHBand": 0x0200,
+    "noVBand": 0x0400,
+}
+
+
+def apply_table_styles(
+    doc: Document,
+    table_rules: dict[str, dict],
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    paragraph_format_mapping: dict[str, tuple[str, Callable | None]],
+    w_tags: dict[str, str],
+) -> int:
+    """
+    Format every table through one generated table style instead of per-cell
+    formatting:
+
+    - table_style: font_format, paragraph_format and borders of the whole table
+    - header_row_style: font_format, paragraph_format and shading of the first row;
+      repeat_header marks the first row of each table as a repeated header row
+    - banded_rows: shading of every other row
+
+    The table style is written once to styles.xml; each table then only gets its
+    w:tblStyle and w:tblLook set. Returns the number of tables styled.
+    """
+    if not has_table_style_rules(table_rules, style_names_mapping):
+        return 0
+
+    style_id = apply_table_style_definition(
+        doc,
+        table_rules,
+        style_names_mapping,
+        style_attributes_names_mapping,
+        font_mapping,
+        paragraph_format_mapping,
+    )
+
+    header_def = table_rules.get(style_names_mapping["header_row_style"]) or {}
+    table_look = compile_table_look(
+        header_row=bool(header_def), banded_rows=bool(table_rules.get("banded_rows"))
+    )
+    repeat_header = header_def.get("repeat_header", False)
+
+    table_count = 0
+    for table_element in doc.element.body.iter(w_tags["tbl"]):
+        table_properties = table_element.tblPr
+        table_properties.style = style_id
+        _set_table_look(table_properties, table_look)
+        if repeat_header:
+            first_row = next(table_element.iterchildren(w_tags["tr"]), None)
+            if first_row is not None:
+                _set_repeat_header(first_row)
+        table_count += 1
+
+    return table_count
+
+
+def has_table_style_rules(
+    table_rules: dict[str, dict] | None, style_names_mapping: dict[str, str]
+) -> bool:
+    """Whether table_rules define any of table_style, header_row_style, banded_rows."""
+    return any(
+        (table_rules or {}).get(key)
+        for key in (
+            style_names_mapping["table_style"],
+            style_names_mapping["header_row_style"],
+            "banded_rows",
+        )
+    )
+
+
+def apply_table_style_definition(
+    doc: Document,
+    table_rules: dict[str, dict],
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    paragraph_format_mapping: dict[str, tuple[str, Callable | None]],
+) -> str:
+    """
+    Create or update the table style of table_rules in styles.xml, with w:tblStylePr
+    conditional formatting for the header row (firstRow) and banding (band1Horz).
+    Returns the style id.
+    """
+    style_name = style_names_mapping["table_style"]
+    table_def = table_rules.get(style_name) or {}
+    header_def = table_rules.get(style_names_mapping["header_row_style"]) or {}
+    banding_def = table_rules.get("banded_rows") or {}
+
+    try:
+        style_obj = doc.styles[style_name]
+    except KeyError:
+        style_obj = doc.styles.add_style(style_name, WD_STYLE_TYPE.TABLE)
+        style_obj.base_style = _get_default_table_style(doc)
+
+    if style_obj.type != WD_STYLE_TYPE.TABLE:
+        raise ValueError(f"Style {style_name} exists and is not a table style")
+
+    based_on = table_def.get(style_attributes_names_mapping["based_on"])
+    if based_on:
+        with contextlib.suppress(KeyError):
+            style_obj.base_style = doc.styles[based_on]
+
+    apply_docx_style_attributes(
+        style_obj=style_obj,
+        style_def=table_def,
+        style_attributes_names_mapping=style_attributes_names_mapping,
+        font_mapping=font_mapping,
+        paragraph_format_mapping=paragraph_format_mapping,
+    )
+
+    style_element = style_obj.element
+    for child in style_element.findall(qn("w:tblPr")) + style_element.findall(
+        qn("w:tblStylePr")
+    ):
+        style_element.remove(child)
+
+    table_properties = _build_table_properties(
+        borders=table_def.get("borders"), banded_rows=bool(banding_def)
+    )
+    if len(table_properties):
+        style_element.insert_element_before(
+            table_properties, "w:trPr", "w:tcPr", "w:tblStylePr"
+        )
+
+    if header_def:
+        style_element.append(
+            _build_conditional_formatting(
+                "firstRow",
+                header_def,
+                style_attributes_names_mapping,
+                font_mapping,
+                paragraph_format_mapping,
+            )
+        )
+    if banding_def:
+        style_element.append(
+            _build_conditional_formatting(
+                "band1Horz",
+                banding_def,
+                style_attributes_names_mapping,
+                font_mapping,
+                paragraph_format_mapping,
+            )
+        )
+
+    return style_obj.style_id
+
+
+def compile_table_look(header_row: bool, banded_rows: bool) -> dict[str, str]:
+    """Compile the w:tblLook attributes that switch on the header row and banding."""
+    flags = {
+        "firstRow": header_row,
+        "lastRow": False,
+        "firstColumn": False,
+        "lastColumn": False,
+        "noHBand": not banded_rows,
+        "noVBand": True,
+    }
+    legacy_value = sum(TABLE_LOOK_FLAGS[flag] for flag, value in flags.items() if value)
+    table_look = {qn(f"w:{flag}"): str(int(value)) for flag, value in flags.items()}
+    table_look[qn("w:val")] = f"{legacy_value:04X}"
+    return table_look
+
+
+def _get_default_table_style(doc: Document) -> _TableStyle | None:
+    """Return the default table style ("Normal Table"), if the document has one."""
+    try:
+        return doc.styles[DEFAULT_TABLE_STYLE]
+    except KeyError:
+        return None
+
+
+def _build_table_properties(
+    borders: dict[str, str | float] | None, banded_rows: bool
+) -> OxmlElement:
+    """Build the w:tblPr of the table style: banding size and borders."""
+    table_properties = OxmlElement("w:tblPr")
+    if banded_rows:
+        band_size = OxmlElement("w:tblStyleRowBandSize")
+        band_size.set(qn("w:val"), "1")
+        table_properties.append(band_size)
+
+    if borders:
+        border_attributes = {
+            qn("w:val"): borders.get("style") or "single",
+            qn("w:sz"): str(round(borders.get("size", 0.5) * 8)),
+            qn("w:space"): "0",
+            qn("w:color"): (borders.get("color") or "auto").lstrip("#"),
+        }
+        table_borders = OxmlElement("w:tblBorders")
+        for side in BORDER_SIDES:
+            border = OxmlElement(f"w:{side}")
+            border.attrib.update(border_attributes)
+            table_borders.append(border)
+        table_properties.append(table_borders)
+
+    return table_properties
+
+
+def _build_conditional_formatting(
+    condition: str,
+    style_def: dict[str, str | dict],
+    style_attributes_names_mapping: dict[str, str],
+    font_mapping: dict[str, tuple[str, Callable | None]],
+    paragraph_format_mapping: dict[str, tuple[str, Callable | None]],
+) -> OxmlElement:
+    """
+    Build a w:tblStylePr of the given condition type from a style definition with
+    an optional cell shading. Font and paragraph formatting are mapped onto a
+    scratch w:style element and its w:pPr / w:rPr moved over.
+    """
+    conditional_formatting = OxmlElement("w:tblStylePr")
+    conditional_formatting.set(qn("w:type"), condition)
+
+    scratch_style = OxmlElement("w:style")
+    paragraph_def = style_def.get(style_attributes_names_mapping["paragraph_format"])
+    font_def = style_def.get(style_attributes_names_mapping["font_format"])
+    if paragraph_def:
+        map_config_to_docx_attributes(
+            target=ParagraphFormat(scratch_style),
+            config_data=paragraph_def,
+            mapping=paragraph_format_mapping,
+        )
+    if font_def:
+        map_config_to_docx_attributes(
+            target=Font(scratch_style), config_data=font_def, mapping=font_mapping
+        )
+    for properties in (scratch_style.pPr, scratch_style.rPr):
+        if properties is not None:
+            conditional_formatting.append(properties)
+
+    shading = style_def.get("shading")
+    if shading:
+        cell_properties = OxmlElement("w:tcPr")
+        cell_shading = OxmlElement("w:shd")
+        cell_shading.set(qn("w:val"), "clear")
+        cell_shading.set(qn("w:color"), "auto")
+        cell_shading.set(qn("w:fill"), shading.lstrip("#"))
+        cell_properties.append(cell_shading)
+        conditional_formatting.append(cell_properties)
+
+    return conditional_formatting
+
+
+def _set_table_look(table_properties: OxmlElement, table_look: dict[str, str]) -> None:
+    """Set the w:tblLook of a table's w:tblPr."""
+    look = table_properties.find(qn("w:tblLook"))
+    if look is None:
+        look = OxmlElement("w:tblLook")
+        table_properties.insert_element_before(
+            look, "w:tblCaption", "w:tblDescription", "w:tblPrChange"
+        )
+    look.attrib.update(table_look)
+
+
+def _set_repeat_header(row_element: OxmlElement) -> None:
+    """Mark a table row as a header row repeated on every page."""
+    row_properties = row_element.get_or_add_trPr()
+    if row_properties.find(qn("w:tblHeader")) is None:
+        row_properties.insert_element_before(
+            OxmlElement("w:tblHeader"),
+            "w:tblCellSpacing",
+            "w:jc",
+            "w:hidden",
+            "w:ins",
+            "w:del",
+            "w:trPrChange",
+        )
@@ -0,0 +1,160 @@
+import re
+
+from docx.document import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from lxml import etree
+
+DEAD_BOOKMARK_NAMES = {"_GoBack"}
+HIDDEN_BOOKMARK_PREFIX = "_"
+
+# Separators of the arguments of a field instruction
+FIELD_ARGUMENT_SEPARATORS = re.compile(r'[\s"\\]+')
+
+
+def apply_xml_slimming(
+    doc: Document, w_tags: dict[str, str], openxml_formats: dict[str, str]
+) -> dict[str, int]:
+    """
+    Strip editing noise (rsid attributes, proofing marks, rendered page breaks,
+    noProof flags and empty or dead bookmarks) from the document, header and footer parts.
+    Bookmarks named in a field instruction or hyperlink anchor anywhere in the
+    package are kept. Returns a report with byte sizes and element counts before
+    and after slimming.
+    """
+    report = {
+        "bytes_before": 0,
+        "bytes_after": 0,
+        "elements_before": 0,
+        "elements_after": 0,
+    }
+
+    referenced_names = collect_referenced_bookmark_names(
+        [
+            part.element
+            for part in doc.part.package.iter_parts()
+            if getattr(part, "element", None) is not None
+        ],
+        w_tags,
+    )
+    for part_element in _get_slimmable_part_elements(doc):
+        report["bytes_before"] += len(etree.tostring(part_element))
+        report["elements_before"] += _count_elements(part_element)
+
+        slim_part_element(part_element, w_tags, openxml_formats, referenced_names)
+
+        report["bytes_after"] += len(etree.tostring(part_element))
+        report["elements_after"] += _count_elements(part_element)
+
+    return report
+
+
+def slim_part_element(
+    part_element: etree._Element,
+    w_tags: dict[str, str],
+    openxml_formats: dict[str, str],
+    referenced_names: set[str] | None = None,
+) -> None:
+    """
+    Remove editing noise from a single part element in one iter() sweep.
+
+    Bookmarks in DEAD_BOOKMARK_NAMES are removed; a collapsed bookmark (its end
+    directly after its start) only if it is hidden ("_Ref...", "_Toc...") and not in
+    referenced_names, the bookmarks targeted by fields and hyperlinks. Without
+    referenced_names, the references within part_element are used.
+    """
+    if referenced_names is None:
+        referenced_names = collect_referenced_bookmark_names([part_element], w_tags)
+
+    removable_tags = {
+        w_tags["proofErr"],
+        w_tags["lastRenderedPageBreak"],
+        w_tags["noProof"],
+    }
+    rsid_prefix = f"{{{openxml_formats['W']}}}rsid"
+
+    removable_elements = []
+    bookmark_starts = {}
+    bookmark_ends = {}
+
+    for element in part_element.iter():
+        if not isinstance(element.tag, str):
+            continue
+
+        for attr_name in [a for a in element.attrib if a.startswith(rsid_prefix)]:
+            del element.attrib[attr_name]
+
+        if element.tag in removable_tags:
+            removable_elements.append(element)
+        elif element.tag == w_tags["bookmarkStart"]:
+            bookmark_starts[element.get(w_tags["id"])] = element
+        elif element.tag == w_tags["bookmarkEnd"]:
+            bookmark_ends[element.get(w_tags["id"])] = element
+
+    for bookmark_id, start in bookmark_starts.items():
+        end = bookmark_ends.get(bookmark_id)
+        if end is None:
+            continue
+        name = start.get(w_tags["name"]) or ""
+        if name in DEAD_BOOKMARK_NAMES or (
+            start.getnext() is end
+            and name.startswith(HIDDEN_BOOKMARK_PREFIX)
+            and name not in referenced_names
+        ):
+            removable_elements.extend((start, end))
+
+    for element in removable_elements:
+        parent = element.getparent()
+        if parent is None:
+            continue
+        parent.remove(element)
+        if parent.tag == w_tags["rPr"] and len(parent) == 0 and not parent.attrib:
+            parent.getparent().remove(parent)
+
+
+def collect_referenced_bookmark_names(
+    part_elements: list[etree._Element], w_tags: dict[str, str]
+) -> set[str]:
+    """
+    Return the bookmark names that fields (REF, PAGEREF, HYPERLINK \\l, ...) and
+    hyperlink anchors of the parts may point to. Every argument of a field
+    instruction counts as a name; instruction text split over several runs is
+    joined first.
+    """
+    names: set[str] = set()
+    instruction_parts: list[str] = []
+    for part_element in part_elements:
+        for element in part_element.iter(
+            w_tags["instrText"],
+            w_tags["fldChar"],
+            w_tags["fldSimple"],
+            w_tags["hyperlink"],
+        ):
+            if element.tag == w_tags["instrText"]:
+                instruction_parts.append(element.text or "")
+            elif element.tag == w_tags["fldSimple"]:
+                instruction_parts.extend((" ", element.get(w_tags["instr"]) or "", " "))
+            elif element.tag == w_tags["hyperlink"]:
+                names.add(element.get(w_tags["anchor"]) or "")
+            else:
+                instruction_parts.append(" ")
+
+    names.update(FIELD_ARGUMENT_SEPARATORS.split("".join(instruction_parts)))
+    names.discard("")
+    return names
+
+
+def _get_slimmable_part_elements(doc: Document) -> list[etree._Element]:
+    """Return the root elements of the main document, header and footer parts."""
+    part_elements = [doc.element]
+
+    for rel in doc.part.rels.values():
+        if rel.is_external or rel.reltype not in (RT.HEADER, RT.FOOTER):
+            continue
+        part_elements.append(rel.target_part.element)
+
+    return part_elements
+
+
+def _count_elements(part_element: etree._Element) -> int:
+    """Count all elements in a part element tree."""
+    return sum(1 for _ in part_element.iter())
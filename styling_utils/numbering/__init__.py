@@ -4,18 +4,70 @@ Numbering utilities.
 This module contains utilities for managing numbering, chapters, and sections.
 """
 
+from .caption_field_numbering_utils import (
+    apply_caption_field_numbering,
+    apply_chapter_outline_level,
+)
+from .document_index_utils import (
+    build_document_index,
+    build_object_index,
+    count_style_usage,
+    find_element_positions,
+    find_list_groups,
+    find_style_run_starts,
+)
+from .heading_list_numbering_utils import (
+    apply_heading_list_definition,
+    apply_native_heading_numbering,
+    build_heading_level_text,
+)
+from .number_formatters import (
+    compile_number_formatter,
+    format_number,
+    get_number_formatter,
+)
 from .numbering_utils import (
-    apply_chapter_based_numbering,
     apply_numbering_to_text,
+    get_common_pattern,
+    number_caption_text,
     process_paragraph_text,
+    record_numbering_label,
     remove_all_numbering,
     update_paragraph_numbering,
 )
+from .outline_numbering_utils import (
+    advance_outline,
+    apply_chapter_based_numbering,
+    apply_outline_numbering,
+    build_outline_rules,
+    new_outline_state,
+)
 
 __all__ = [
+    "advance_outline",
+    "apply_caption_field_numbering",
     "apply_chapter_based_numbering",
+    "apply_chapter_outline_level",
+    "apply_heading_list_definition",
+    "apply_native_heading_numbering",
     "apply_numbering_to_text",
+    "apply_outline_numbering",
+    "build_document_index",
+    "build_heading_level_text",
+    "build_object_index",
+    "build_outline_rules",
+    "compile_number_formatter",
+    "count_style_usage",
+    "find_element_positions",
+    "find_list_groups",
+    "find_style_run_starts",
+    "format_number",
+    "get_common_pattern",
+    "get_number_formatter",
+    "new_outline_state",
+    "number_caption_text",
     "process_paragraph_text",
+    "record_numbering_label",
     "remove_all_numbering",
     "update_paragraph_numbering",
 ]
@@ -0,0 +1,244 @@
+from docx.document import Document
+from docx.oxml import OxmlElement
+from docx.oxml.shared import qn
+from docx.oxml.text.paragraph import CT_P
+
+from .number_formatters import format_number
+from .numbering_utils import record_numbering_label, remove_all_numbering
+
+
+def apply_caption_field_numbering(
+    doc: Document,
+    style_definitions: dict[str, dict[str, str | dict[str, str]]],
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    caption_sequence_names: dict[str, str],
+    field_number_formats: dict[str, str],
+    renumbering_regex: dict[str, str],
+    use_chapter_field: bool = False,
+    start_chapter: int = 0,
+    label_map: dict[str, str] | None = None,
+) -> dict[str, int]:
+    """
+    Number table and figure captions with Word SEQ fields (e.g. "SEQ Table \\s 1")
+    instead of static text, so numbering stays correct when the document is edited.
+
+    Chapter and caption paragraphs are found by their pStyle id in one pass over the
+    body. The chapter part of the label is a STYLEREF field when headings use native
+    list numbering, and static text otherwise. Field results are pre-filled with the
+    current values. start_chapter is the number of chapters preceding the document
+    part being numbered. Changed labels are recorded in label_map when it is given.
+    Captions already holding a SEQ field (from an earlier run) are counted and
+    their field results refreshed, but not rebuilt. The chapter style needs an
+    outline level for the fields, see apply_chapter_outline_level.
+    Returns the caption counts per style for the last chapter.
+    """
+    style_ids = {style.name: style.style_id for style in doc.styles}
+    chapter_style_id = style_ids.get(style_names_mapping["chapter_titles"])
+    caption_style_keys = {
+        style_ids[style_names_mapping[style_key]]: style_key
+        for style_key in caption_sequence_names
+        if style_key in style_definitions
+        and style_names_mapping.get(style_key) in style_ids
+    }
+    if not caption_style_keys:
+        return {}
+
+    current_chapter = start_chapter
+    in_chapter = False
+    counters = dict.fromkeys(caption_style_keys.values(), 0)
+    chapter_numbering_applied = False
+
+    for p_element in doc.element.body.iterchildren(qn("w:p")):
+        style_id = p_element.style
+
+        if style_id == chapter_style_id:
+            if not chapter_numbering_applied:
+                current_chapter += 1
+                counters = dict.fromkeys(counters, 0)
+                in_chapter = True
+                chapter_numbering_applied = True
+            continue
+        chapter_numbering_applied = False
+
+        style_key = caption_style_keys.get(style_id)
+        if style_key is None or not in_chapter:
+            continue
+
+        counters[style_key] += 1
+        sequence_fields = _find_sequence_fields(
+            p_element, caption_sequence_names[style_key]
+        )
+        if sequence_fields:
+            _refresh_sequence_fields(
+                sequence_fields,
+                style_definitions[style_key],
+                style_attributes_names_mapping,
+                counters[style_key],
+            )
+            continue
+
+        _rebuild_caption_paragraph(
+            p_element,
+            style_definitions[style_key],
+            style_attributes_names_mapping,
+            caption_sequence_names[style_key],
+            field_number_formats,
+            renumbering_regex,
+            current_chapter,
+            counters[style_key],
+            use_chapter_field,
+            label_map,
+        )
+
+    return counters
+
+
+def apply_chapter_outline_level(
+    doc: Document, style_names_mapping: dict[str, str]
+) -> None:
+    """
+    Give the chapter style outline level 1 in styles.xml, so the "STYLEREF 1" and
+    "SEQ ... \\s 1" caption fields find the chapter paragraphs.
+    """
+    chapter_style_name = style_names_mapping["chapter_titles"]
+    if chapter_style_name not in doc.styles:
+        return
+
+    chapter_style = doc.styles[chapter_style_name]
+    chapter_style.element.get_or_add_pPr().get_or_add_outlineLvl().val = 0
+
+
+def _find_sequence_fields(p_element: CT_P, sequence_name: str) -> list[OxmlElement]:
+    """
+    Return the w:fldSimple SEQ fields of a caption sequence in a paragraph; a
+    complex SEQ field (w:instrText) is returned as its instruction element.
+    """
+    sequence_fields = []
+    for element in p_element.iter(qn("w:fldSimple"), qn("w:instrText")):
+        instruction = (
+            element.get(qn("w:instr"))
+            if element.tag == qn("w:fldSimple")
+            else element.text
+        )
+        tokens = (instruction or "").split()
+        if tokens[:2] == ["SEQ", sequence_name]:
+            sequence_fields.append(element)
+    return sequence_fields
+
+
+def _refresh_sequence_fields(
+    sequence_fields: list[OxmlElement],
+    style_def: dict[str, str | dict[str, str]],
+    style_attributes_names_mapping: dict[str, str],
+    caption_num: int,
+) -> None:
+    """Set the pre-filled result of existing w:fldSimple SEQ fields to caption_num."""
+    numbering_def = style_def.get(
+        style_attributes_names_mapping["numbering_format"], {}
+    )
+    result_text = format_number(
+        caption_num, (numbering_def.get("type") or "ARABIC").upper()
+    )
+    for field in sequence_fields:
+        if field.tag != qn("w:fldSimple"):
+            continue
+        t_elements = list(field.iter(qn("w:t")))
+        if t_elements:
+            t_elements[0].text = result_text
+            for t_element in t_elements[1:]:
+                t_element.text = ""
+
+
+def _rebuild_caption_paragraph(
+    p_element: CT_P,
+    style_def: dict[str, str | dict[str, str]],
+    style_attributes_names_mapping: dict[str, str],
+    sequence_name: str,
+    field_number_formats: dict[str, str],
+    renumbering_regex: dict[str, str],
+    chapter_num: int,
+    caption_num: int,
+    use_chapter_field: bool,
+    label_map: dict[str, str] | None,
+) -> None:
+    """Replace the caption content with pattern, chapter number, SEQ field and title."""
+    numbering_def = style_def.get(
+        style_attributes_names_mapping["numbering_format"], {}
+    )
+    common_pattern_def = style_def.get(
+        style_attributes_names_mapping["common_pattern_format"], {}
+    )
+    numbering_type = (numbering_def.get("type") or "ARABIC").upper()
+    numbering_side = (numbering_def.get("side") or "LEFT").upper()
+    separator = numbering_def.get("separator") or " "
+    common_pattern = common_pattern_def.get("pattern") or sequence_name
+    common_pattern_separator = common_pattern_def.get("separator") or " "
+    common_pattern_left = (common_pattern_def.get("side") or "LEFT").upper() == "LEFT"
+
+    old_text = p_element.text
+    title = remove_all_numbering(
+        old_text, common_pattern, numbering_type, renumbering_regex
+    )
+    field_format = field_number_formats.get(numbering_type, "ARABIC")
+    chapter_text = format_number(chapter_num, numbering_type)
+
+    label_parts = []
+    if common_pattern_left:
+        label_parts.append(f"{common_pattern}{common_pattern_separator}")
+    if use_chapter_field:
+        label_parts.append((f"STYLEREF 1 \\s \\* {field_format}", chapter_text))
+        label_parts.append(".")
+    else:
+        label_parts.append(f"{chapter_text}.")
+    label_parts.append(
+        (
+            f"SEQ {sequence_name} \\* {field_format} \\s 1",
+            format_number(caption_num, numbering_type),
+        )
+    )
+    if not common_pattern_left:
+        label_parts.append(f"{common_pattern_separator}{common_pattern}")
+
+    if numbering_side == "LEFT":
+        parts = [*label_parts, f"{separator}{title}"]
+    else:
+        parts = [f"{title}{separator}", *label_parts]
+
+    record_numbering_label(
+        label_map,
+        old_text,
+        "".join(part[1] if isinstance(part, tuple) else part for part in parts),
+        common_pattern,
+        renumbering_regex,
+    )
+
+    for child in list(p_element):
+        if child.tag != qn("w:pPr"):
+            p_element.remove(child)
+
+    for part in parts:
+        if isinstance(part, tuple):
+            instruction, result_text = part
+            p_element.append(_create_simple_field(instruction, result_text))
+        elif part:
+            p_element.append(_create_text_run(part))
+
+
+def _create_text_run(text: str) -> OxmlElement:
+    """Create a w:r element holding a single w:t."""
+    run = OxmlElement("w:r")
+    t_element = OxmlElement("w:t")
+    if text != text.strip():
+        t_element.set(qn("xml:space"), "preserve")
+    t_element.text = text
+    run.append(t_element)
+    return run
+
+
+def _create_simple_field(instruction: str, result_text: str) -> OxmlElement:
+    """Create a paragraph-level w:fldSimple with a pre-filled field result."""
+    fld_simple = OxmlElement("w:fldSimple")
+    fld_simple.set(qn("w:instr"), f" {instruction} ")
+    fld_simple.append(_create_text_run(result_text))
+    return fld_simple
@@ -0,0 +1,220 @@
+from array import array
+
+from docx.document import Document
+from docx.enum.style import WD_STYLE_TYPE
+
+from ..core.paragraph_view_utils import ParagraphView
+
+NO_NUM_ID = -1
+NO_POSITION = -1
+
+TABLE_OBJECT = "table"
+FIGURE_OBJECT = "figure"
+
+DocumentIndex = dict[str, list | array]
+ObjectIndex = dict[str, list | array]
+
+
+def build_document_index(
+    doc: Document, w_tags: dict[str, str] | None = None
+) -> DocumentIndex:
+    """
+    Build a columnar index of the body paragraphs in one pass over the XML.
+
+    Columns (one entry per paragraph, in document order):
+    - "views": a ParagraphView per paragraph, shared by the passes using the index
+    - "style_codes": code of the paragraph style name in "style_names"
+    - "num_ids" / "ilvls": list numId (NO_NUM_ID when not in a list) and level
+    - "run_starts": 1 for the first paragraph of a run of paragraphs with the same style
+
+    The list columns are only read when w_tags is given; style-based passes do not
+    need them. Style names are resolved from one style id map instead of a styles.xml
+    lookup per paragraph. Numbering and grouping passes compute their state from these
+    columns and only read or change the affected paragraphs.
+    """
+    style_names_by_id, default_style_name = _get_paragraph_style_names(doc)
+
+    style_names: list[str] = []
+    style_code_by_name: dict[str, int] = {}
+    style_codes = array("l")
+    num_ids = array("l")
+    ilvls = array("l")
+    run_starts = array("b")
+
+    views = [ParagraphView(paragraph, w_tags) for paragraph in doc.paragraphs]
+    for view in views:
+        style_name = style_names_by_id.get(view.style_id, default_style_name)
+        style_code = style_code_by_name.get(style_name)
+        if style_code is None:
+            style_code = style_code_by_name[style_name] = len(style_names)
+            style_names.append(style_name)
+
+        run_starts.append(not style_codes or style_codes[-1] != style_code)
+        style_codes.append(style_code)
+
+        num_id, level = view.numbering
+        num_ids.append(int(num_id) if num_id and num_id.isdigit() else NO_NUM_ID)
+        ilvls.append(level)
+
+    return {
+        "views": views,
+        "style_names": style_names,
+        "style_codes": style_codes,
+        "num_ids": num_ids,
+        "ilvls": ilvls,
+        "run_starts": run_starts,
+    }
+
+
+def count_style_usage(doc: Document, w_tags: dict[str, str]) -> dict[str, int]:
+    """
+    Return the number of body paragraphs per paragraph style name. Reads only the
+    w:pStyle values, so it is cheap enough to decide which passes have work to do.
+    """
+    style_names_by_id, default_style_name = _get_paragraph_style_names(doc)
+    style_counts_by_id: dict[str | None, int] = {}
+    for p_element in doc.element.body.iterchildren(w_tags["p"]):
+        style_id = p_element.style
+        style_counts_by_id[style_id] = style_counts_by_id.get(style_id, 0) + 1
+
+    style_usage: dict[str, int] = {}
+    for style_id, count in style_counts_by_id.items():
+        style_name = style_names_by_id.get(style_id, default_style_name)
+        style_usage[style_name] = style_usage.get(style_name, 0) + count
+
+    return style_usage
+
+
+def find_element_positions(
+    doc: Document, document_index: DocumentIndex, tags: list[str]
+) -> list[int]:
+    """
+    Return the positions of the body paragraphs containing an element with one of the
+    given tags (e.g. m:oMath), from one pass over the body XML instead of a search per
+    paragraph. Elements in tables and other non-paragraph blocks are ignored.
+    """
+    body = doc.element.body
+    positions_by_element = {
+        view.element: position for position, view in enumerate(document_index["views"])
+    }
+
+    positions = set()
+    for element in body.iter(*tags):
+        block = element
+        while block is not None and block.getparent() is not body:
+            block = block.getparent()
+        position = positions_by_element.get(block)
+        if position is not None:
+            positions.add(position)
+
+    return sorted(positions)
+
+
+def build_object_index(
+    doc: Document, document_index: DocumentIndex, w_tags: dict[str, str]
+) -> ObjectIndex:
+    """
+    Build a block-order index of the tables and figures of the body and the
+    paragraphs around them, in one pass over the body blocks.
+
+    Columns (one entry per object, in document order):
+    - "kinds": TABLE_OBJECT for a w:tbl, FIGURE_OBJECT for a paragraph with a
+      w:drawing or w:pict
+    - "elements": the w:tbl or w:p element
+    - "before" / "after": position in document_index of the paragraph directly
+      before / after the object, NO_POSITION when that block is not a paragraph
+
+    Caption and source passes look up an object's neighbours here instead of
+    scanning the paragraphs around it.
+    """
+    figure_positions = set(
+        find_element_positions(doc, document_index, [w_tags["drawing"], w_tags["pict"]])
+    )
+
+    kinds: list[str] = []
+    elements: list = []
+    before = array("l")
+    after = array("l")
+
+    previous_position = NO_POSITION
+    position = NO_POSITION
+    pending_after: list[int] = []
+    for block in doc.element.body.iterchildren():
+        if block.tag == w_tags["p"]:
+            position += 1
+            for object_number in pending_after:
+                after[object_number] = position
+            pending_after = []
+            if position not in figure_positions:
+                previous_position = position
+                continue
+            kind = FIGURE_OBJECT
+        elif block.tag == w_tags["tbl"]:
+            pending_after = []
+            kind = TABLE_OBJECT
+        else:
+            continue
+
+        kinds.append(kind)
+        elements.append(block)
+        before.append(previous_position)
+        after.append(NO_POSITION)
+        pending_after.append(len(kinds) - 1)
+        previous_position = position if kind == FIGURE_OBJECT else NO_POSITION
+
+    return {"kinds": kinds, "elements": elements, "before": before, "after": after}
+
+
+def get_style_code(document_index: DocumentIndex, style_name: str | None) -> int:
+    """Return the code of a style name, or -1 if no paragraph uses it."""
+    try:
+        return document_index["style_names"].index(style_name)
+    except ValueError:
+        return -1
+
+
+def find_style_run_starts(
+    document_index: DocumentIndex, style_name: str | None
+) -> list[int]:
+    """Return the positions of the paragraphs that start a run of the given style."""
+    style_code = get_style_code(document_index, style_name)
+    style_codes = document_index["style_codes"]
+    return [
+        position
+        for position, run_start in enumerate(document_index["run_starts"])
+        if run_start and style_codes[position] == style_code
+    ]
+
+
+def find_list_groups(document_index: DocumentIndex) -> list[list[int]]:
+    """
+    Return the positions of list paragraphs grouped into lists. numId 0 removes a
+    paragraph from its list, so such paragraphs are skipped. A group ends when the
+    numId changes or the list returns to level 0 from a nested level.
+    """
+    num_ids = document_index["num_ids"]
+    ilvls = document_index["ilvls"]
+    positions = [position for position, num_id in enumerate(num_ids) if num_id > 0]
+
+    groups: list[list[int]] = []
+    for previous, position in zip([None, *positions], positions):
+        if (
+            previous is None
+            or num_ids[position] != num_ids[previous]
+            or (ilvls[position] == 0 and ilvls[previous] > 0)
+        ):
+            groups.append([position])
+        else:
+            groups[-1].append(position)
+
+    return groups
+
+
+def _get_paragraph_style_names(doc: Document) -> tuple[dict[str, str], str]:
+    """Return the paragraph style names by style id and the default style name."""
+    style_names_by_id = {
+        style.style_id: style.name
+        for style in doc.styles
+        if style.type == WD_STYLE_TYPE.PARAGRAPH
+    }
+    return style_names_by_id, doc.styles.default(WD_STYLE_TYPE.PARAGRAPH).name
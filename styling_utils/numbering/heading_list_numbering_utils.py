@@ -0,0 +1,383 @@
+import re
+
+from docx.document import Document
+from docx.oxml import OxmlElement
+from docx.oxml.shared import qn
+from docx.text.paragraph import Paragraph
+
+from .document_index_utils import build_document_index
+from .numbering_utils import remove_all_numbering
+from .outline_numbering_utils import (
+    OutlineRules,
+    advance_outline,
+    build_outline_rules,
+    new_outline_state,
+)
+
+TEMPLATE_PLACEHOLDER_REGEX = re.compile(r"\{(\d+)\}")
+
+
+def apply_native_heading_numbering(
+    doc: Document,
+    style_definitions: dict[str, dict[str, str | dict[str, str]]],
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    heading_level_styles: list[str],
+    word_number_formats: dict[str, str],
+    separator_suffixes: dict[str, str],
+    renumbering_regex: dict[str, str],
+) -> int | None:
+    """
+    Number headings with one Word multilevel list instead of rewriting their text.
+
+    The list is defined by apply_heading_list_definition (reused if it already
+    exists), existing textual numbers are stripped once, and heading paragraphs
+    that the text-based numbering would skip get numId 0, decided by the same
+    outline rules over the document index.
+    Returns the numId of the list, or None if no heading style is configured.
+    """
+    num_id = apply_heading_list_definition(
+        doc,
+        style_definitions,
+        style_names_mapping,
+        style_attributes_names_mapping,
+        heading_level_styles,
+        word_number_formats,
+        separator_suffixes,
+    )
+    if num_id is None:
+        return None
+
+    _strip_heading_text_numbering(
+        doc,
+        build_outline_rules(
+            style_definitions,
+            style_names_mapping,
+            style_attributes_names_mapping,
+            heading_level_styles,
+            [],
+        ),
+        style_definitions,
+        style_attributes_names_mapping,
+        renumbering_regex,
+    )
+
+    return num_id
+
+
+def apply_heading_list_definition(
+    doc: Document,
+    style_definitions: dict[str, dict[str, str | dict[str, str]]],
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    heading_level_styles: list[str],
+    word_number_formats: dict[str, str],
+    separator_suffixes: dict[str, str],
+) -> int | None:
+    """
+    Write the heading list to numbering.xml and link the heading styles to it via
+    numPr in styles.xml; only touches those two parts, so it can run once before
+    the body is numbered in parts. Heading levels and their restarts come from the
+    outline rules, so numbering_format.outline_level and restart_level apply as in
+    the text-based numbering. A list with the same levels that the heading styles
+    already link to is reused instead of adding another one.
+    Returns the numId of the list, or None if no heading style is configured.
+    """
+    outline_rules = build_outline_rules(
+        style_definitions,
+        style_names_mapping,
+        style_attributes_names_mapping,
+        heading_level_styles,
+        [],
+    )
+    level_style_keys = _get_level_style_keys(
+        doc, outline_rules, style_definitions, style_names_mapping
+    )
+    if not any(level_style_keys):
+        return None
+
+    numbering = doc.part.numbering_part.element
+    abstract_num = _build_heading_abstract_num(
+        doc,
+        level_style_keys,
+        outline_rules["restart_levels"],
+        style_definitions,
+        style_names_mapping,
+        style_attributes_names_mapping,
+        word_number_formats,
+        separator_suffixes,
+    )
+    first_style_key = next(
+        style_keys[0] for style_keys in level_style_keys if style_keys
+    )
+    num_id = _find_heading_list(
+        doc,
+        numbering,
+        style_names_mapping.get(first_style_key, first_style_key),
+        abstract_num,
+    )
+    if num_id is None:
+        num_id = numbering.add_num(_insert_abstract_num(numbering, abstract_num)).numId
+
+    for ilvl, style_keys in enumerate(level_style_keys):
+        for style_key in style_keys:
+            style = doc.styles[style_names_mapping.get(style_key, style_key)]
+            num_pr = style.element.get_or_add_pPr().get_or_add_numPr()
+            num_pr.get_or_add_numId().val = num_id
+            if ilvl > 0:
+                num_pr.get_or_add_ilvl().val = ilvl
+
+    return num_id
+
+
+def build_heading_level_text(
+    ilvl: int,
+    style_def: dict[str, str | dict[str, str]],
+    style_attributes_names_mapping: dict[str, str],
+) -> str:
+    """Build the w:lvlText value (e.g. "CHAPTER %1", "%1.%2") for a heading level."""
+    numbering_def = style_def.get(
+        style_attributes_names_mapping["numbering_format"], {}
+    )
+    common_pattern_def = style_def.get(
+        style_attributes_names_mapping["common_pattern_format"], {}
+    )
+
+    template = numbering_def.get("template")
+    if template:
+        return TEMPLATE_PLACEHOLDER_REGEX.sub(r"%\1", template)
+
+    level_text = ".".join(f"%{level}" for level in range(1, ilvl + 2))
+
+    common_pattern = common_pattern_def.get("pattern") or ""
+    if not common_pattern or "number" in common_pattern:
+        return level_text
+
+    separator = common_pattern_def.get("separator") or " "
+    if (common_pattern_def.get("side") or "LEFT").upper() == "LEFT":
+        return f"{common_pattern}{separator}{level_text}"
+    return f"{level_text}{separator}{common_pattern}"
+
+
+def _get_level_style_keys(
+    doc: Document,
+    outline_rules: OutlineRules,
+    style_definitions: dict[str, dict[str, str | dict[str, str]]],
+    style_names_mapping: dict[str, str],
+) -> list[list[str]]:
+    """
+    Return the configured heading style keys whose styles exist per list level
+    (outline level 1 is list level 0), up to the deepest level in use.
+    """
+    style_keys_by_name = {
+        style_names_mapping.get(style_key, style_key): style_key
+        for style_key in style_definitions
+    }
+    level_style_keys: list[list[str]] = []
+    for style_name, level in outline_rules["heading_levels"].items():
+        style_key = style_keys_by_name.get(style_name)
+        if style_key is None or style_name not in doc.styles:
+            continue
+        while len(level_style_keys) < level:
+            level_style_keys.append([])
+        level_style_keys[level - 1].append(style_key)
+    return level_style_keys
+
+
+def _build_heading_abstract_num(
+    doc: Document,
+    level_style_keys: list[list[str]],
+    restart_levels: list[int],
+    style_definitions: dict[str, dict[str, str | dict[str, str]]],
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    word_number_formats: dict[str, str],
+    separator_suffixes: dict[str, str],
+) -> OxmlElement:
+    """
+    Build the multilevel w:abstractNum for the headings, without its id. A level
+    takes its format from its first style; levels without a style count in decimal.
+    """
+    abstract_num = OxmlElement("w:abstractNum")
+    abstract_num.append(
+        OxmlElement("w:multiLevelType", attrs={qn("w:val"): "multilevel"})
+    )
+
+    for ilvl, style_keys in enumerate(level_style_keys):
+        style_def = style_definitions[style_keys[0]] if style_keys else {}
+        numbering_def = style_def.get(
+            style_attributes_names_mapping["numbering_format"], {}
+        )
+        numbering_type = (numbering_def.get("type") or "ARABIC").upper()
+        separator = numbering_def.get("separator")
+
+        lvl = OxmlElement("w:lvl", attrs={qn("w:ilvl"): str(ilvl)})
+        lvl.append(OxmlElement("w:start", attrs={qn("w:val"): "1"}))
+        lvl.append(
+            OxmlElement(
+                "w:numFmt",
+                attrs={qn("w:val"): word_number_formats.get(numbering_type, "decimal")},
+            )
+        )
+        if restart_levels[ilvl] != ilvl:
+            lvl.append(
+                OxmlElement(
+                    "w:lvlRestart", attrs={qn("w:val"): str(restart_levels[ilvl])}
+                )
+            )
+        if style_keys:
+            style_name = style_names_mapping.get(style_keys[0], style_keys[0])
+            lvl.append(
+                OxmlElement(
+                    "w:pStyle", attrs={qn("w:val"): doc.styles[style_name].style_id}
+                )
+            )
+        if ilvl > 0 and numbering_type == "ARABIC":
+            lvl.append(OxmlElement("w:isLgl"))
+        lvl.append(
+            OxmlElement(
+                "w:suff",
+                attrs={
+                    qn("w:val"): separator_suffixes.get(
+                        " " if separator is None else separator, "space"
+                    )
+                },
+            )
+        )
+        lvl.append(
+            OxmlElement(
+                "w:lvlText",
+                attrs={
+                    qn("w:val"): build_heading_level_text(
+                        ilvl, style_def, style_attributes_names_mapping
+                    )
+                },
+            )
+        )
+        lvl.append(OxmlElement("w:lvlJc", attrs={qn("w:val"): "left"}))
+        abstract_num.append(lvl)
+
+    return abstract_num
+
+
+def _insert_abstract_num(numbering: OxmlElement, abstract_num: OxmlElement) -> int:
+    """Add a w:abstractNum under the next free id, before the w:num elements."""
+    abstract_nums = numbering.findall(qn("w:abstractNum"))
+    abstract_num_id = (
+        max(int(a.get(qn("w:abstractNumId"))) for a in abstract_nums) + 1
+        if abstract_nums
+        else 0
+    )
+    abstract_num.set(qn("w:abstractNumId"), str(abstract_num_id))
+
+    if abstract_nums:
+        abstract_nums[-1].addnext(abstract_num)
+    else:
+        first_num = numbering.find(qn("w:num"))
+        if first_num is not None:
+            first_num.addprevious(abstract_num)
+        else:
+            numbering.append(abstract_num)
+
+    return abstract_num_id
+
+
+def _find_heading_list(
+    doc: Document,
+    numbering: OxmlElement,
+    first_level_style_name: str,
+    abstract_num: OxmlElement,
+) -> int | None:
+    """
+    Return the numId the first heading level style links to if that list has the
+    same levels as abstract_num, None otherwise.
+    """
+    p_pr = doc.styles[first_level_style_name].element.pPr
+    num_pr = p_pr.numPr if p_pr is not None else None
+    if num_pr is None or num_pr.numId is None:
+        return None
+
+    num_id = num_pr.numId.val
+    try:
+        num = numbering.num_having_numId(num_id)
+    except KeyError:
+        return None
+
+    abstract_num_id = num.abstractNumId.val
+    existing = next(
+        (
+            element
+            for element in numbering.iterchildren(qn("w:abstractNum"))
+            if element.get(qn("w:abstractNumId")) == str(abstract_num_id)
+        ),
+        None,
+    )
+    if existing is None or [
+        _get_element_signature(lvl) for lvl in existing.iterchildren(qn("w:lvl"))
+    ] != [
+        _get_element_signature(lvl) for lvl in abstract_num.iterchildren(qn("w:lvl"))
+    ]:
+        return None
+    return num_id
+
+
+def _get_element_signature(element: OxmlElement) -> tuple:
+    """Return the tag, attributes and children of an element, recursively."""
+    return (
+        element.tag,
+        tuple(sorted(element.attrib.items())),
+        tuple(_get_element_signature(child) for child in element),
+    )
+
+
+def _strip_heading_text_numbering(
+    doc: Document,
+    outline_rules: OutlineRules,
+    style_definitions: dict[str, dict[str, str | dict[str, str]]],
+    style_attributes_names_mapping: dict[str, str],
+    renumbering_regex: dict[str, str],
+) -> None:
+    """
+    Remove textual numbers from heading paragraphs and suppress list numbering on
+    headings that apply_outline_numbering would leave unnumbered, advancing the
+    same outline over the document index.
+    """
+    document_index = build_document_index(doc)
+    style_names = document_index["style_names"]
+    views = document_index["views"]
+    heading_levels = outline_rules["heading_levels"]
+    outline_state = new_outline_state(outline_rules)
+
+    for position, style_code in enumerate(document_index["style_codes"]):
+        style_name = style_names[style_code]
+        levels = advance_outline(outline_state, outline_rules, style_name)
+        if style_name not in heading_levels:
+            continue
+
+        view = views[position]
+        if levels is None:
+            _suppress_paragraph_numbering(view.paragraph)
+            view.invalidate()
+            continue
+
+        style_def = style_definitions.get(style_name, {})
+        numbering_def = style_def.get(
+            style_attributes_names_mapping["numbering_format"], {}
+        )
+        common_pattern_def = style_def.get(
+            style_attributes_names_mapping["common_pattern_format"], {}
+        )
+        stripped_text = remove_all_numbering(
+            view.text,
+            common_pattern_def.get("pattern") or "",
+            numbering_def.get("type") or "ARABIC",
+            renumbering_regex,
+        )
+        if stripped_text != view.text:
+            view.set_text(stripped_text)
+
+
+def _suppress_paragraph_numbering(paragraph: Paragraph) -> None:
+    """Override the style numbering of a single paragraph with numId 0."""
+    num_pr = paragraph._p.get_or_add_pPr().get_or_add_numPr()
+    num_pr.get_or_add_numId().val = 0
@@ -0,0 +1,138 @@
+import re
+import string
+from functools import lru_cache
+from typing import Callable, Sequence
+
+import roman
+
+LOOKUP_TABLE_LIMIT = 3999
+
+UPPER_ROMAN_TABLE = (
+    "",
+    *(roman.toRoman(n) for n in range(1, LOOKUP_TABLE_LIMIT + 1)),
+)
+LOWER_ROMAN_TABLE = tuple(numeral.lower() for numeral in UPPER_ROMAN_TABLE)
+ROMAN_TO_ARABIC_TABLE = {
+    numeral: n for n, numeral in enumerate(UPPER_ROMAN_TABLE) if numeral
+}
+
+
+def _to_alpha(value: int) -> str:
+    """Convert a positive integer to spreadsheet-style letters (1 -> A, 27 -> AA)."""
+    letters = ""
+    while value > 0:
+        value, remainder = divmod(value - 1, 26)
+        letters = string.ascii_uppercase[remainder] + letters
+    return letters
+
+
+UPPER_ALPHA_TABLE = tuple(_to_alpha(n) for n in range(LOOKUP_TABLE_LIMIT + 1))
+LOWER_ALPHA_TABLE = tuple(letters.lower() for letters in UPPER_ALPHA_TABLE)
+
+NUMBER_TABLES = {
+    "ROMAN": UPPER_ROMAN_TABLE,
+    "LOWER_ROMAN": LOWER_ROMAN_TABLE,
+    "UPPER_ALPHA": UPPER_ALPHA_TABLE,
+    "LOWER_ALPHA": LOWER_ALPHA_TABLE,
+}
+
+TEMPLATE_PLACEHOLDER_REGEX = re.compile(r"\{(\d+)\}")
+
+
+def to_roman(value: int) -> str:
+    """Convert an integer to an uppercase Roman numeral using the lookup table."""
+    if 0 < value <= LOOKUP_TABLE_LIMIT:
+        return UPPER_ROMAN_TABLE[value]
+    return roman.toRoman(value)
+
+
+def from_roman(numeral: str) -> int:
+    """Convert an uppercase Roman numeral to an integer using the lookup table."""
+    value = ROMAN_TO_ARABIC_TABLE.get(numeral)
+    if value is None:
+        return roman.fromRoman(numeral)
+    return value
+
+
+def format_number(value: int, numbering_type: str = "ARABIC", padding: int = 2) -> str:
+    """Format a single counter value in the given numbering type."""
+    table = NUMBER_TABLES.get(numbering_type)
+    if table is not None:
+        if 0 < value <= LOOKUP_TABLE_LIMIT:
+            return table[value]
+        if numbering_type.endswith("ROMAN"):
+            numeral = roman.toRoman(value)
+            return numeral.lower() if numbering_type == "LOWER_ROMAN" else numeral
+        letters = _to_alpha(value)
+        return letters.lower() if numbering_type == "LOWER_ALPHA" else letters
+
+    if numbering_type == "ZERO_PADDED":
+        return str(value).zfill(padding)
+
+    return str(value)
+
+
+@lru_cache(maxsize=None)
+def compile_number_formatter(
+    numbering_type: str = "ARABIC", template: str = "", padding: int = 2
+) -> Callable[[Sequence[int]], str]:
+    """
+    Compile a formatter that turns a sequence of level counters into a label.
+
+    Without a template the levels are joined with dots ("1.2.3"). A template refers
+    to levels by 1-based index, e.g. "{1}.{2}-{3}"; it is cut after the last
+    placeholder available when fewer levels are given.
+    """
+    numbering_type = numbering_type.upper()
+    table = NUMBER_TABLES.get(numbering_type)
+
+    if table is not None:
+
+        def format_level(value: int) -> str:
+            if 0 < value <= LOOKUP_TABLE_LIMIT:
+                return table[value]
+            return format_number(value, numbering_type, padding)
+
+    elif numbering_type == "ZERO_PADDED":
+
+        def format_level(value: int) -> str:
+            return str(value).zfill(padding)
+
+    else:
+        format_level = str
+
+    if not template:
+        return lambda levels: ".".join([format_level(value) for value in levels])
+
+    placeholder_ends = [
+        match.end() for match in TEMPLATE_PLACEHOLDER_REGEX.finditer(template)
+    ]
+    format_template = TEMPLATE_PLACEHOLDER_REGEX.sub(
+        lambda match: f"{{{int(match.group(1)) - 1}}}", template
+    )
+    truncated_templates = [
+        TEMPLATE_PLACEHOLDER_REGEX.sub(
+            lambda match: f"{{{int(match.group(1)) - 1}}}", template[:end]
+        )
+        for end in placeholder_ends
+    ]
+
+    def format_with_template(levels: Sequence[int]) -> str:
+        labels = [format_level(value) for value in levels]
+        if len(labels) >= len(truncated_templates):
+            return format_template.format(*labels)
+        return truncated_templates[len(labels) - 1].format(*labels) if labels else ""
+
+    return format_with_template
+
+
+def get_number_formatter(
+    numbering_def: dict[str, str | int] | None,
+) -> Callable[[Sequence[int]], str]:
+    """Return the compiled formatter for a numbering_format style definition."""
+    numbering_def = numbering_def or {}
+    return compile_number_formatter(
+        (numbering_def.get("type") or "ARABIC").upper(),
+        numbering_def.get("template") or "",
+        numbering_def.get("padding") or 2,
+    )
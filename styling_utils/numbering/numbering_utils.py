@@ -1,23 +1,22 @@
 import re
-from typing import Callable, Pattern
-
-import roman
-from docx.document import Document
+from typing import Callable, Pattern, Sequence
 
 from config.patterns import BASE_PATTERNS
 
+from .number_formatters import from_roman, get_number_formatter, to_roman
+
 
 def arabic_to_roman(num_str: str) -> str:
     """Convert Arabic numerals to Roman numerals."""
     return ".".join(
-        roman.toRoman(int(p)) if p.isdigit() else p for p in num_str.split(".")
+        to_roman(int(p)) if p.isdigit() else p for p in num_str.split(".")
     )
 
 
 def roman_to_arabic(roman_str: str) -> str:
     """Convert Roman numerals to Arabic numerals."""
     return ".".join(
-        str(roman.fromRoman(p)) if p.isalpha() else p for p in roman_str.split(".")
+        str(from_roman(p)) if p.isalpha() else p for p in roman_str.split(".")
     )
 
 
@@ -30,13 +29,58 @@ def expand_common_pattern(common_pattern: str, numbering_format: str = "ARABIC")
         return common_pattern
 
     number_type = numbering_format.upper()
-    number_pattern = BASE_PATTERNS[
-        "roman_number" if number_type == "ROMAN" else "arabic_number"
-    ]
+    if number_type.endswith("ROMAN"):
+        number_pattern = BASE_PATTERNS["roman_number"]
+    elif number_type.endswith("ALPHA"):
+        number_pattern = BASE_PATTERNS["alpha_number"]
+    else:
+        number_pattern = BASE_PATTERNS["arabic_number"]
 
     return common_pattern.replace("number", number_pattern)
 
 
+def record_numbering_label(
+    label_map: dict[str, str] | None,
+    old_text: str,
+    new_text: str,
+    common_pattern: str,
+    renumbering_regex: dict[str, str],
+) -> None:
+    """Record an old->new label (e.g. "Table 2.3" -> "Table 3.1") after renumbering.
+    Only word patterns produce labels; number-only patterns are too ambiguous to rewrite."""
+    if label_map is None or not common_pattern or "number" in common_pattern:
+        return
+
+    label_pattern = renumbering_regex["common_word_pattern"].format(
+        common_word=re.escape(common_pattern.strip())
+    )
+    old_match = re.search(label_pattern, old_text, re.IGNORECASE)
+    new_match = re.search(label_pattern, new_text, re.IGNORECASE)
+    if not old_match or not new_match:
+        return
+
+    old_label = " ".join(old_match.group(0).split())
+    new_label = " ".join(new_match.group(0).split())
+    if old_label != new_label:
+        label_map[old_label] = new_label
+
+
+def get_common_pattern(
+    style_def: dict[str, str | dict[str, str]] | None,
+    style_attributes_names_mapping: dict[str, str] | None,
+) -> str:
+    """Return the common_pattern_format pattern of a style definition."""
+    if not style_def or not style_attributes_names_mapping:
+        return ""
+    common_pattern_def = style_def.get(
+        style_attributes_names_mapping.get(
+            "common_pattern_format", "common_pattern_format"
+        ),
+        {},
+    )
+    return common_pattern_def.get("pattern") or ""
+
+
 def remove_all_numbering(
     text: str,
     common_pattern: str = "",
@@ -177,14 +221,17 @@ def update_paragraph_numbering(
     common_pattern_side: str = "LEFT",
     common_pattern_separator: str = " ",
     renumbering_regex: dict[str, str] | None = None,
+    levels: Sequence[int] | None = None,
 ) -> str:
-    """Update paragraph text with new numbering based on the hierarchy level."""
+    """Update paragraph text with new numbering based on the hierarchy level.
+    levels replaces the three level numbers for outlines deeper than three levels."""
     if not text.strip():
         return text
 
     numbering_type = "ARABIC"
     numbering_side = "LEFT"
     separator = " "
+    numbering_def = {}
 
     if style_definitions and style_attributes_names_mapping and style_name:
         style_def = style_definitions.get(style_name)
@@ -210,19 +257,16 @@ def update_paragraph_numbering(
                 common_pattern_side = common_pattern_def.get("side", "LEFT")
                 common_pattern_separator = common_pattern_def.get("separator", " ")
 
-    if subchapter_level_3_num is not None:
-        base_numbering = (
-            f"{chapter_num}.{subchapter_level_2_num}.{subchapter_level_3_num}"
-        )
+    if levels is not None:
+        levels = tuple(levels)
+    elif subchapter_level_3_num is not None:
+        levels = (chapter_num, subchapter_level_2_num, subchapter_level_3_num)
     elif subchapter_level_2_num is not None:
-        base_numbering = f"{chapter_num}.{subchapter_level_2_num}"
+        levels = (chapter_num, subchapter_level_2_num)
     else:
-        base_numbering = str(chapter_num)
+        levels = (chapter_num,)
 
-    if numbering_type.upper() == "ROMAN":
-        new_numbering = arabic_to_roman(base_numbering)
-    else:
-        new_numbering = base_numbering
+    new_numbering = get_number_formatter(numbering_def)(levels)
 
     return apply_numbering_to_text(
         text,
@@ -238,88 +282,33 @@ def update_paragraph_numbering(
     )
 
 
-def apply_chapter_based_numbering(
-    doc: Document,
-    style_names_mapping: dict[str, str],
-    style_definitions: dict[str, dict[str, str | dict[str, str]]] | None = None,
-    style_attributes_names_mapping: dict[str, str] | None = None,
+def number_caption_text(
+    text: str,
+    levels: Sequence[int],
+    style_def: dict[str, str | dict[str, str]],
+    style_attributes_names_mapping: dict[str, str],
     chapter_section_numbering_regex: dict[str, str] | None = None,
-    target_styles: list[str] | None = None,
-    use_common_pattern: bool = True,
     renumbering_regex: dict[str, str] | None = None,
-) -> dict[str, int]:
-    """Apply chapter-based numbering for specified styles."""
-    current_chapter = 0
-    counters = dict.fromkeys(target_styles, 0) if target_styles else {}
-
-    in_chapter = False
-    chapter_numbering_applied = False
-
-    for paragraph in doc.paragraphs:
-        style_name = paragraph.style.name
-
-        if style_name == style_names_mapping.get("chapter_titles"):
-            if not chapter_numbering_applied:
-                current_chapter += 1
-                for style in counters:
-                    counters[style] = 0
-                in_chapter = True
-                chapter_numbering_applied = True
-        else:
-            chapter_numbering_applied = False
-
-        if (
-            target_styles
-            and style_name
-            in [style_names_mapping.get(style) for style in target_styles]
-            and in_chapter
-        ):
-            target_style = None
-            for style in target_styles:
-                if style_name == style_names_mapping.get(style):
-                    target_style = style
-                    break
-
-            if target_style:
-                counters[target_style] += 1
-                new_numbering = f"{current_chapter}.{counters[target_style]}"
-
-                style_def = (
-                    style_definitions.get(target_style, {}) if style_definitions else {}
-                )
-                numbering_def = style_def.get(
-                    style_attributes_names_mapping.get(
-                        "numbering_format", "numbering_format"
-                    ),
-                    {},
-                )
-
-                common_pattern = ""
-                common_pattern_side = "LEFT"
-                common_pattern_separator = " "
-
-                if use_common_pattern:
-                    common_pattern_def = style_def.get(
-                        style_attributes_names_mapping.get(
-                            "common_pattern_format", "common_pattern_format"
-                        ),
-                        {},
-                    )
-                    common_pattern = common_pattern_def.get("pattern", "")
-                    common_pattern_side = common_pattern_def.get("side", "LEFT")
-                    common_pattern_separator = common_pattern_def.get("separator", " ")
-
-                paragraph.text = apply_numbering_to_text(
-                    paragraph.text,
-                    new_numbering,
-                    numbering_def.get("type", "ARABIC"),
-                    numbering_def.get("side", "LEFT"),
-                    numbering_def.get("separator", " "),
-                    chapter_section_numbering_regex,
-                    common_pattern,
-                    common_pattern_side,
-                    common_pattern_separator,
-                    renumbering_regex,
-                )
-
-    return counters
\ No newline at end of file
+) -> str:
+    """Return caption text renumbered with its numbering and common pattern formats."""
+    numbering_def = style_def.get(
+        style_attributes_names_mapping.get("numbering_format", "numbering_format"), {}
+    )
+    common_pattern_def = style_def.get(
+        style_attributes_names_mapping.get(
+            "common_pattern_format", "common_pattern_format"
+        ),
+        {},
+    )
+    return apply_numbering_to_text(
+        text,
+        get_number_formatter(numbering_def)(levels),
+        numbering_def.get("type", "ARABIC"),
+        numbering_def.get("side", "LEFT"),
+        numbering_def.get("separator", " "),
+        chapter_section_numbering_regex,
+        common_pattern_def.get("pattern", ""),
+        common_pattern_def.get("side", "LEFT"),
+        common_pattern_def.get("separator", " "),
+        renumbering_regex,
+    )
@@ -0,0 +1,265 @@
+from docx.document import Document
+
+from .document_index_utils import DocumentIndex, build_document_index
+from .numbering_utils import (
+    get_common_pattern,
+    number_caption_text,
+    record_numbering_label,
+    update_paragraph_numbering,
+)
+
+MAX_OUTLINE_LEVELS = 9
+
+OutlineRules = dict[str, dict]
+OutlineState = dict[str, list[int] | dict[str, int] | int | bool | None]
+
+
+def build_outline_rules(
+    style_definitions: dict[str, dict[str, str | dict[str, str]]],
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    heading_level_styles: list[str],
+    caption_styles: list[str],
+) -> OutlineRules:
+    """
+    Build the outline numbering rules from the style definitions.
+
+    Headings: the styles of heading_level_styles get levels 1, 2, 3...; any style can
+    set or override its level with numbering_format.outline_level (1-9).
+    Captions: each caption style numbers within an outline level, numbering_format.
+    restart_level (default 1, i.e. "Table 2.3" within chapter 2; 0 numbers through the
+    whole document).
+    Headings of a level restart after a heading of numbering_format.restart_level or
+    above (default: the parent level; 0 never restarts).
+
+    Returns {"heading_levels": {style name: level}, "restart_levels": [restart level
+    per level], "caption_styles": {style name: (style key, restart level)}}.
+    """
+    numbering_format_key = (style_attributes_names_mapping or {}).get(
+        "numbering_format", "numbering_format"
+    )
+
+    def numbering_def(style_name: str) -> dict[str, str | int]:
+        return (style_definitions.get(style_name) or {}).get(numbering_format_key, {})
+
+    heading_levels = {
+        style_names_mapping.get(style_key, style_key): level
+        for level, style_key in enumerate(heading_level_styles, start=1)
+    }
+    for style_name in style_definitions:
+        outline_level = numbering_def(style_name).get("outline_level")
+        if outline_level:
+            heading_levels[style_name] = min(int(outline_level), MAX_OUTLINE_LEVELS)
+
+    restart_levels = [level - 1 for level in range(1, MAX_OUTLINE_LEVELS + 1)]
+    for style_name, level in heading_levels.items():
+        restart_level = numbering_def(style_name).get("restart_level")
+        if restart_level is not None:
+            restart_levels[level - 1] = min(int(restart_level), level - 1)
+
+    caption_rules = {}
+    for style_key in caption_styles:
+        style_name = style_names_mapping.get(style_key, style_key)
+        restart_level = numbering_def(style_name).get("restart_level")
+        caption_rules[style_name] = (
+            style_key,
+            1 if restart_level is None else min(int(restart_level), MAX_OUTLINE_LEVELS),
+        )
+
+    return {
+        "heading_levels": heading_levels,
+        "restart_levels": restart_levels,
+        "caption_styles": caption_rules,
+    }
+
+
+def new_outline_state(
+    outline_rules: OutlineRules, start_chapter: int = 0
+) -> OutlineState:
+    """
+    Start an outline. start_chapter is the number of chapters preceding the document
+    part being numbered.
+    """
+    return {
+        "counters": [start_chapter] + [0] * (MAX_OUTLINE_LEVELS - 1),
+        "caption_counters": {
+            style_key: 0 for style_key, _ in outline_rules["caption_styles"].values()
+        },
+        "in_chapter": False,
+        "previous_level": None,
+    }
+
+
+def advance_outline(
+    outline_state: OutlineState, outline_rules: OutlineRules, style_name: str
+) -> tuple[int, ...] | None:
+    """
+    Advance the outline by one paragraph and return its number levels, e.g. (2, 1, 3)
+    for a level 3 heading or (2, 4) for the 4th table of chapter 2, or None if the
+    paragraph is not numbered.
+
+    Consecutive chapter (level 1) paragraphs form one title block, numbered once.
+    Deeper headings and captions scoped to a level are numbered inside a chapter only,
+    and headings only once all their parent levels have started.
+    """
+    counters = outline_state["counters"]
+    level = outline_rules["heading_levels"].get(style_name)
+    previous_level = outline_state["previous_level"]
+    outline_state["previous_level"] = level
+
+    if level is not None:
+        if level == 1:
+            if previous_level == 1:
+                return None
+            outline_state["in_chapter"] = True
+        elif not outline_state["in_chapter"] or not all(counters[1 : level - 1]):
+            return None
+
+        counters[level - 1] += 1
+        restart_levels = outline_rules["restart_levels"]
+        for deeper_level in range(level, MAX_OUTLINE_LEVELS):
+            if restart_levels[deeper_level] >= level:
+                counters[deeper_level] = 0
+
+        caption_counters = outline_state["caption_counters"]
+        for style_key, restart_level in outline_rules["caption_styles"].values():
+            if restart_level >= level:
+                caption_counters[style_key] = 0
+
+        return tuple(counters[:level])
+
+    caption_rule = outline_rules["caption_styles"].get(style_name)
+    if caption_rule is None:
+        return None
+
+    style_key, restart_level = caption_rule
+    if restart_level and not outline_state["in_chapter"]:
+        return None
+
+    caption_counters = outline_state["caption_counters"]
+    caption_counters[style_key] += 1
+    return (*counters[:restart_level], caption_counters[style_key])
+
+
+def apply_outline_numbering(
+    doc: Document,
+    style_definitions: dict[str, dict[str, str | dict[str, str]]],
+    style_names_mapping: dict[str, str],
+    style_attributes_names_mapping: dict[str, str],
+    heading_level_styles: list[str],
+    caption_styles: list[str],
+    chapter_section_numbering_regex: dict[str, str] | None = None,
+    renumbering_regex: dict[str, str] | None = None,
+    start_chapter: int = 0,
+    label_map: dict[str, str] | None = None,
+    number_headings: bool = True,
+    number_captions: bool = True,
+    document_index: DocumentIndex | None = None,
+) -> dict[str, int]:
+    """
+    Number heading and caption paragraphs in one pass over the document index.
+    Headings are skipped when number_headings is False (e.g. with native numbering),
+    captions when number_captions is False; they still advance the outline.
+    Changed labels are recorded in label_map when it is given.
+    Returns the caption counters of the last chapter.
+    """
+    outline_rules = build_outline_rules(
+        style_definitions,
+        style_names_mapping,
+        style_attributes_names_mapping,
+        heading_level_styles,
+        caption_styles,
+    )
+    outline_state = new_outline_state(outline_rules, start_chapter)
+    if not number_headings and not number_captions:
+        return outline_state["caption_counters"]
+
+    if document_index is None:
+        document_index = build_document_index(doc)
+
+    style_names = document_index["style_names"]
+    views = document_index["views"]
+    caption_rules = outline_rules["caption_styles"]
+
+    for position, style_code in enumerate(document_index["style_codes"]):
+        style_name = style_names[style_code]
+        levels = advance_outline(outline_state, outline_rules, style_name)
+        if levels is None:
+            continue
+
+        is_caption = style_name in caption_rules
+        if is_caption and not number_captions:
+            continue
+        if not is_caption and not number_headings:
+            continue
+
+        style_def = style_definitions.get(
+            caption_rules[style_name][0] if is_caption else style_name, {}
+        )
+
+        view = views[position]
+        old_text = view.text
+        if is_caption:
+            view.set_text(
+                number_caption_text(
+                    old_text,
+                    levels,
+                    style_def,
+                    style_attributes_names_mapping,
+                    chapter_section_numbering_regex,
+                    renumbering_regex,
+                )
+            )
+        else:
+            view.set_text(
+                update_paragraph_numbering(
+                    old_text,
+                    levels[0],
+                    style_definitions=style_definitions,
+                    style_attributes_names_mapping=style_attributes_names_mapping,
+                    style_name=style_name,
+                    chapter_section_numbering_regex=chapter_section_numbering_regex,
+                    renumbering_regex=renumbering_regex,
+                    levels=levels,
+                )
+            )
+        record_numbering_label(
+            label_map,
+            old_text,
+            view.text,
+            get_common_pattern(style_def, style_attributes_names_mapping),
+            renumbering_regex,
+        )
+
+    return outline_state["caption_counters"]
+
+
+def apply_chapter_based_numbering(
+    doc: Document,
+    style_names_mapping: dict[str, str],
+    style_definitions: dict[str, dict[str, str | dict[str, str]]] | None = None,
+    style_attributes_names_mapping: dict[str, str] | None = None,
+    chapter_section_numbering_regex: dict[str, str] | None = None,
+    target_styles: list[str] | None = None,
+    renumbering_regex: dict[str, str] | None = None,
+    start_chapter: int = 0,
+    label_map: dict[str, str] | None = None,
+    document_index: DocumentIndex | None = None,
+) -> dict[str, int]:
+    """Apply chapter-based numbering for specified styles.
+    start_chapter is the number of chapters preceding the document part being numbered.
+    Changed labels are recorded in label_map when it is given."""
+    return apply_outline_numbering(
+        doc=doc,
+        style_definitions=style_definitions or {},
+        style_names_mapping=style_names_mapping,
+        style_attributes_names_mapping=style_attributes_names_mapping,
+        heading_level_styles=["chapter_titles"],
+        caption_styles=target_styles or [],
+        chapter_section_numbering_regex=chapter_section_numbering_regex,
+        renumbering_regex=renumbering_regex,
+        start_chapter=start_chapter,
+        label_map=label_map,
+        number_headings=False,
+        document_index=document_index,
+    )
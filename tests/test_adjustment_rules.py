@@ -0,0 +1,72 @@
+import re
+
+import pytest
+
+from styling_utils import compile_adjustment_rules
+
+
+def _literal(find: str, replace: str, **flags) -> dict:
+    return {"find": find, "replace": replace, **flags}
+
+
+def _regex(find: str, replace: str, **flags) -> dict:
+    return {"find": find, "replace": replace, "regex": True, **flags}
+
+
+def _apply_sequentially(rules: list[dict], text: str) -> str:
+    """Reference semantics for regex rules: one re.sub per rule in config order."""
+    for rule in rules:
+        flags = re.IGNORECASE if rule.get("ignore_case") else 0
+        text = re.sub(rule["find"], rule["replace"], text, flags=flags)
+    return text
+
+
+def test_overlapping_literals_take_the_longest_term():
+    adjust_text = compile_adjustment_rules(
+        [_literal("York", "Yk"), _literal("New York", "NYC"), _literal("New", "Old")]
+    )
+
+    assert adjust_text("New York and York are New") == ("NYC and Yk are Old", 3)
+
+
+def test_literal_replacements_are_not_matched_again():
+    adjust_text = compile_adjustment_rules(
+        [_literal("colour", "color"), _literal("color", "hue")]
+    )
+
+    assert adjust_text("colour color") == ("color hue", 2)
+
+
+def test_literal_replacements_are_inserted_verbatim():
+    adjust_text = compile_adjustment_rules([_literal("eg", r"e.g. \1")])
+
+    assert adjust_text("eg this") == (r"e.g. \1 this", 1)
+
+
+@pytest.mark.parametrize(
+    "rules, text",
+    [
+        # Ordering-dependent chains between anchored rules
+        ([_regex(r"colou?r", "tint"), _regex(r"tint(s?)", r"hue\1")], "colours"),
+        ([_regex(r"tint(s?)", r"hue\1"), _regex(r"colou?r", "tint")], "colours"),
+        # An earlier rule creating the anchor of a later rule
+        ([_regex(r"\d+ km", "far"), _regex(r"far away", "distant")], "5 km away"),
+        # Overlapping patterns, unanchored rules between anchored ones
+        (
+            [
+                _regex(r"(\w+)@(\w+)", r"\2 at \1"),
+                _regex(r"[A-Z]{2,}", "ACR"),
+                _regex(r"at (\w+)", r"@\1"),
+            ],
+            "user@HOST and NASA",
+        ),
+        # Backreferences and named groups
+        ([_regex(r"(\d+)-(\d+)", r"\1 to \2")], "pages 10-12, 3-4"),
+        ([_regex(r"(?P<day>\d\d)\.(?P<month>\d\d)", r"\g<month>/\g<day>")], "19.10"),
+        ([_regex(r"figure", "Figure", ignore_case=True)], "FIGURE figure"),
+    ],
+)
+def test_regex_rules_apply_sequentially_in_config_order(rules, text):
+    expected = _apply_sequentially(rules, text)
+
+    assert compile_adjustment_rules(rules)(text)[0] == expected
@@ -0,0 +1,48 @@
+import copy
+import os
+
+import docx
+import pytest
+import yaml
+
+import document_batch_formatter
+from document_batch_formatter import format_document_with_configs
+from document_formatter_config import DocumentFormatterConfig
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+INPUT_DOCX = os.path.join(INPUT_DIR, "test_yaml.docx")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+
+def _make_config(document_setup: dict) -> DocumentFormatterConfig:
+    config = copy.deepcopy(BASE_CONFIG)
+    config["document_formatter_config"]["document_setup"].update(document_setup)
+    return DocumentFormatterConfig(config)
+
+
+def test_every_config_gets_its_own_output(tmp_path):
+    output_paths = format_document_with_configs(
+        INPUT_DOCX,
+        {
+            "text": _make_config({}),
+            "native": _make_config({"native_heading_numbering": True}),
+        },
+        str(tmp_path),
+        max_workers=2,
+    )
+
+    assert sorted(output_paths) == ["native", "text"]
+    for output_path in output_paths.values():
+        assert docx.Document(output_path).paragraphs
+    assert document_batch_formatter._WORKER_STATE == {}
+
+
+def test_worker_state_is_cleared_when_a_worker_fails(tmp_path):
+    with pytest.raises(AttributeError):
+        format_document_with_configs(
+            INPUT_DOCX, {"broken": None}, str(tmp_path), max_workers=1
+        )
+
+    assert document_batch_formatter._WORKER_STATE == {}
@@ -0,0 +1,63 @@
+import copy
+import os
+
+import docx
+import yaml
+from docx.oxml.ns import qn
+
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+INPUT_DOCX = os.path.join(INPUT_DIR, "test_yaml.docx")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+
+def _make_config() -> DocumentFormatterConfig:
+    config = copy.deepcopy(BASE_CONFIG)
+    document_setup = config["document_formatter_config"]["document_setup"]
+    document_setup["caption_field_numbering"] = True
+    return DocumentFormatterConfig(config)
+
+
+def _text(element) -> str:
+    return "".join(t.text or "" for t in element.iter(qn("w:t")))
+
+
+def _sequence_fields(doc) -> list:
+    return [
+        field
+        for field in doc.element.body.iter(qn("w:fldSimple"))
+        if field.get(qn("w:instr")).split()[0] == "SEQ"
+    ]
+
+
+def _describe_fields(fields) -> list[tuple[str, str, str | None]]:
+    return [
+        (field.get(qn("w:instr")), _text(field), field.get(qn("w:dirty")))
+        for field in fields
+    ]
+
+
+def _paragraph_texts(doc) -> list[str]:
+    return [_text(p) for p in doc.element.body.iter(qn("w:p"))]
+
+
+def test_second_run_keeps_existing_sequence_fields():
+    config = _make_config()
+    doc = docx.Document(INPUT_DOCX)
+    DocumentFormattingAgent(doc, config).apply_all_styles()
+    first_fields = _sequence_fields(doc)
+    # Fields edited since the first run must survive the second one
+    for field in first_fields:
+        field.set(qn("w:dirty"), "true")
+    first_description = _describe_fields(first_fields)
+    first_texts = _paragraph_texts(doc)
+
+    DocumentFormattingAgent(doc, config).apply_all_styles()
+
+    assert first_fields
+    assert _describe_fields(_sequence_fields(doc)) == first_description
+    assert _paragraph_texts(doc) == first_texts
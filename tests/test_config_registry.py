@@ -0,0 +1,69 @@
+import os
+
+import pytest
+import yaml
+
+from document_config_registry import DocumentConfigRegistry
+from document_formatter_config import ConfigExtendsError, DocumentFormatterConfig
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+STYLE_SCHEMA = DocumentFormatterConfig.load_yaml_file(
+    input_dir=INPUT_DIR, filename="style_config_schema.yaml"
+)
+BASE_CONFIG = DocumentFormatterConfig.load_yaml_file(
+    input_dir=INPUT_DIR, filename="style_config.yaml"
+)
+TENANT_SOURCE = "document_formatter_config:\n  extends: base/base.yaml\n"
+
+
+def _write_base(config_dir, trim_spaces: bool) -> None:
+    base_config = {
+        **BASE_CONFIG,
+        "document_formatter_config": {
+            **BASE_CONFIG["document_formatter_config"],
+            "document_setup": {
+                **BASE_CONFIG["document_formatter_config"]["document_setup"],
+                "trim_spaces": trim_spaces,
+            },
+        },
+    }
+    (config_dir / "base").mkdir(exist_ok=True)
+    (config_dir / "base" / "base.yaml").write_text(
+        yaml.safe_dump(base_config), encoding="utf-8"
+    )
+
+
+def test_registry_reloads_configs_when_an_extended_file_changes(tmp_path):
+    _write_base(tmp_path, trim_spaces=True)
+    (tmp_path / "tenant.yaml").write_text(TENANT_SOURCE, encoding="utf-8")
+    registry = DocumentConfigRegistry(
+        config_dir=str(tmp_path), style_schema=STYLE_SCHEMA, check_interval=0
+    )
+    registry.register("in_memory", TENANT_SOURCE)
+
+    for config_id in ("tenant", "in_memory"):
+        assert registry.get(config_id).document_setup["trim_spaces"] is True
+        assert registry.get(config_id) is registry.get(config_id)
+
+    _write_base(tmp_path, trim_spaces=False)
+
+    for config_id in ("tenant", "in_memory"):
+        assert registry.get(config_id).document_setup["trim_spaces"] is False
+    assert registry.stats()["reloads"] == 2
+
+
+def test_registered_sources_cannot_extend_files_outside_config_dir(tmp_path):
+    config_dir = tmp_path / "configs"
+    config_dir.mkdir()
+    (tmp_path / "secret.yaml").write_text("secret-token-value\n", encoding="utf-8")
+    registry = DocumentConfigRegistry(
+        config_dir=str(config_dir), style_schema=STYLE_SCHEMA
+    )
+    registry.register(
+        "tenant", "document_formatter_config:\n  extends: ../secret.yaml\n"
+    )
+
+    with pytest.raises(ConfigExtendsError) as error:
+        registry.get("tenant")
+
+    assert "secret-token-value" not in str(error.value)
@@ -0,0 +1,83 @@
+import copy
+import io
+import os
+
+import docx
+import yaml
+from docx.shared import Pt
+
+from document_conformance_checker import check_document, format_violation
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+INPUT_DOCX = os.path.join(INPUT_DIR, "test_yaml.docx")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+
+def _make_config() -> DocumentFormatterConfig:
+    return DocumentFormatterConfig(copy.deepcopy(BASE_CONFIG))
+
+
+def _format(docx_path: str) -> io.BytesIO:
+    doc = docx.Document(docx_path)
+    DocumentFormattingAgent(doc, _make_config()).apply_all_styles()
+    output = io.BytesIO()
+    doc.save(output)
+    output.seek(0)
+    return output
+
+
+def test_unformatted_document_reports_violations_without_modifying_it():
+    with open(INPUT_DOCX, "rb") as f:
+        before = f.read()
+
+    violations = check_document(INPUT_DOCX, _make_config())
+
+    with open(INPUT_DOCX, "rb") as f:
+        assert f.read() == before
+    assert violations
+    for violation in violations:
+        assert set(violation) == {
+            "rule",
+            "part",
+            "paragraph",
+            "style",
+            "expected",
+            "actual",
+        }
+
+
+def test_formatted_document_has_no_violations():
+    assert check_document(_format(INPUT_DOCX), _make_config()) == []
+
+
+def test_changed_style_definition_is_reported():
+    doc = docx.Document(_format(INPUT_DOCX))
+    doc.styles["main_text"].font.size = Pt(20)
+    output = io.BytesIO()
+    doc.save(output)
+    output.seek(0)
+
+    violations = check_document(output, _make_config())
+
+    assert [(v["rule"], v["style"], v["actual"]) for v in violations] == [
+        ("font_format.size", "main_text", Pt(20))
+    ]
+
+
+def test_violation_report_line():
+    violation = {
+        "rule": "font.size",
+        "part": "word/document.xml",
+        "paragraph": 3,
+        "style": "Normal",
+        "expected": 12.0,
+        "actual": 11.0,
+    }
+
+    assert format_violation(violation) == (
+        "word/document.xml#paragraph 3 [Normal] font.size: expected 12.0, found 11.0"
+    )
@@ -0,0 +1,102 @@
+import copy
+import os
+
+import docx
+import yaml
+from docx.oxml.ns import qn
+
+import config as MAPPING_CONF
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+from styling_utils import apply_cross_reference_updates, compile_cross_reference_pattern
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+INPUT_DOCX = os.path.join(INPUT_DIR, "test_yaml.docx")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+REFERENCE_TEXT = "See Figure 1.4 in CHAPTER II, not Figure 1.40."
+
+
+def _make_config(update_cross_references: bool) -> DocumentFormatterConfig:
+    config = copy.deepcopy(BASE_CONFIG)
+    document_setup = config["document_formatter_config"]["document_setup"]
+    document_setup["update_cross_references"] = update_cross_references
+    return DocumentFormatterConfig(config)
+
+
+def _text(element) -> str:
+    return "".join(t.text or "" for t in element.iter(qn("w:t")))
+
+
+def _format_with_reference(update_cross_references: bool):
+    doc = docx.Document(INPUT_DOCX)
+    reference = doc.add_paragraph(REFERENCE_TEXT)
+    agent = DocumentFormattingAgent(doc, _make_config(update_cross_references))
+    agent.apply_all_styles()
+    return agent, reference
+
+
+def test_chained_renames_are_rewritten_in_one_sweep():
+    doc = docx.Document()
+    paragraph = doc.add_paragraph("Chapter 1 and CHAPTER II, see Table 2.3.")
+    label_map = {
+        "CHAPTER 1": "CHAPTER II",
+        "CHAPTER II": "CHAPTER III",
+        "Table 2.3": "Table 3.1",
+    }
+
+    rewritten = apply_cross_reference_updates(
+        doc, label_map, set(), MAPPING_CONF.W_TAGS
+    )
+
+    assert rewritten == 3
+    assert paragraph.text == "Chapter II and CHAPTER III, see Table 3.1."
+
+
+def test_longer_numbers_and_subsections_are_not_rewritten():
+    doc = docx.Document()
+    paragraph = doc.add_paragraph("Table 2.30, Table 2.3.1 and Tables 2.3")
+
+    rewritten = apply_cross_reference_updates(
+        doc, {"Table 2.3": "Table 3.1"}, set(), MAPPING_CONF.W_TAGS
+    )
+
+    assert rewritten == 0
+    assert paragraph.text == "Table 2.30, Table 2.3.1 and Tables 2.3"
+
+
+def test_skipped_styles_and_run_formatting_are_kept():
+    doc = docx.Document()
+    title = doc.add_paragraph("Table 2.3", style="Caption")
+    paragraph = doc.add_paragraph("see ")
+    paragraph.add_run("Table 2.3").bold = True
+
+    apply_cross_reference_updates(
+        doc, {"Table 2.3": "Table 3.1"}, {"Caption"}, MAPPING_CONF.W_TAGS
+    )
+
+    assert title.text == "Table 2.3"
+    assert paragraph.text == "see Table 3.1"
+    assert paragraph.runs[1].bold
+
+
+def test_labels_without_a_word_are_ignored():
+    assert compile_cross_reference_pattern({}) is None
+    assert compile_cross_reference_pattern({"1.2": "2.1"}) is None
+
+
+def test_formatting_rewrites_references_to_renumbered_labels():
+    agent, reference = _format_with_reference(update_cross_references=True)
+
+    assert agent.label_map["Figure 1.4"] == "Figure 3.1"
+    assert agent.label_map["CHAPTER II"] == "CHAPTER III"
+    assert _text(reference._p) == "See Figure 3.1 in CHAPTER III, not Figure 1.40."
+
+
+def test_references_are_kept_when_disabled():
+    agent, reference = _format_with_reference(update_cross_references=False)
+
+    assert agent.label_map
+    assert _text(reference._p) == REFERENCE_TEXT
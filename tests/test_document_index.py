@@ -0,0 +1,87 @@
+import docx
+from docx.oxml import OxmlElement
+
+import config as MAPPING_CONF
+from styling_utils import (
+    build_document_index,
+    build_object_index,
+    count_style_usage,
+    find_element_positions,
+    find_list_groups,
+    find_style_run_starts,
+)
+from styling_utils.numbering.document_index_utils import (
+    FIGURE_OBJECT,
+    NO_NUM_ID,
+    NO_POSITION,
+    TABLE_OBJECT,
+)
+
+W_TAGS = MAPPING_CONF.W_TAGS
+
+
+def _add_list_paragraph(doc, text: str, num_id: int, ilvl: int):
+    paragraph = doc.add_paragraph(text)
+    num_pr = paragraph._p.get_or_add_pPr().get_or_add_numPr()
+    num_pr.get_or_add_ilvl().val = ilvl
+    num_pr.get_or_add_numId().val = num_id
+    return paragraph
+
+
+def test_style_columns_are_coded_in_document_order():
+    doc = docx.Document()
+    for style_name in ["Normal", "Normal", "Caption", "Normal", "Caption", "Caption"]:
+        doc.add_paragraph("text", style=style_name)
+
+    document_index = build_document_index(doc)
+
+    assert document_index["style_names"] == ["Normal", "Caption"]
+    assert list(document_index["style_codes"]) == [0, 0, 1, 0, 1, 1]
+    assert list(document_index["run_starts"]) == [1, 0, 1, 1, 1, 0]
+    assert find_style_run_starts(document_index, "Caption") == [2, 4]
+    assert find_style_run_starts(document_index, "Title") == []
+    assert count_style_usage(doc, W_TAGS) == {"Normal": 3, "Caption": 3}
+
+
+def test_list_columns_are_only_read_with_tags():
+    doc = docx.Document()
+    _add_list_paragraph(doc, "item", num_id=3, ilvl=1)
+
+    assert list(build_document_index(doc)["num_ids"]) == [NO_NUM_ID]
+    document_index = build_document_index(doc, W_TAGS)
+    assert list(document_index["num_ids"]) == [3]
+    assert list(document_index["ilvls"]) == [1]
+
+
+def test_list_groups_split_on_num_id_and_return_to_level_zero():
+    doc = docx.Document()
+    _add_list_paragraph(doc, "a", num_id=1, ilvl=0)
+    _add_list_paragraph(doc, "a.1", num_id=1, ilvl=1)
+    doc.add_paragraph("between")
+    _add_list_paragraph(doc, "b", num_id=1, ilvl=0)
+    _add_list_paragraph(doc, "removed", num_id=0, ilvl=0)
+    _add_list_paragraph(doc, "c", num_id=2, ilvl=0)
+    _add_list_paragraph(doc, "d", num_id=2, ilvl=0)
+
+    groups = find_list_groups(build_document_index(doc, W_TAGS))
+
+    assert groups == [[0, 1], [3], [5, 6]]
+
+
+def test_object_index_links_tables_and_figures_to_neighbours():
+    doc = docx.Document()
+    doc.add_paragraph("Table 1 title")
+    doc.add_table(rows=1, cols=1)
+    doc.add_table(rows=1, cols=1)
+    doc.add_paragraph("after tables")
+    doc.add_paragraph().add_run()._r.append(OxmlElement("w:drawing"))
+    doc.add_paragraph("Figure 1 title")
+
+    document_index = build_document_index(doc, W_TAGS)
+    object_index = build_object_index(doc, document_index, W_TAGS)
+
+    assert find_element_positions(doc, document_index, [W_TAGS["drawing"]]) == [2]
+    assert object_index["kinds"] == [TABLE_OBJECT, TABLE_OBJECT, FIGURE_OBJECT]
+    assert list(object_index["before"]) == [0, NO_POSITION, 1]
+    assert list(object_index["after"]) == [NO_POSITION, 1, 3]
+    assert object_index["elements"][2] is document_index["views"][2].element
@@ -0,0 +1,59 @@
+import copy
+import json
+import os
+
+import docx
+import pytest
+import yaml
+from lxml import etree
+
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+INPUT_DOCX = os.path.join(INPUT_DIR, "test_yaml.docx")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+
+def _make_config(document_setup: dict) -> DocumentFormatterConfig:
+    config = copy.deepcopy(BASE_CONFIG)
+    config["document_formatter_config"]["document_setup"].update(document_setup)
+    return DocumentFormatterConfig(config)
+
+
+def _parts(doc) -> dict[str, bytes]:
+    return {
+        "styles": etree.tostring(doc.styles.element),
+        "numbering": etree.tostring(doc.part.numbering_part.element),
+        "body": etree.tostring(doc.element.body),
+    }
+
+
+@pytest.mark.parametrize(
+    "document_setup",
+    [
+        {},
+        {"refactor_section_numbering": False},
+        {"native_heading_numbering": True},
+        {"caption_field_numbering": True},
+        {"trim_spaces": False},
+        {"slim_xml": True, "update_cross_references": True},
+    ],
+)
+def test_planned_styles_match_direct_styles(document_setup):
+    config = _make_config(document_setup)
+    direct = docx.Document(INPUT_DOCX)
+    direct_agent = DocumentFormattingAgent(direct, config)
+    direct_agent.apply_all_styles()
+    planned = docx.Document(INPUT_DOCX)
+    planned_agent = DocumentFormattingAgent(planned, config)
+    plan = planned_agent.apply_planned_styles()
+    replayed = docx.Document(INPUT_DOCX)
+    replayed_agent = DocumentFormattingAgent(replayed, config)
+    replayed_agent.apply_planned_styles(json.loads(json.dumps(plan)))
+
+    assert _parts(planned) == _parts(direct)
+    assert _parts(replayed) == _parts(direct)
+    assert planned_agent.label_map == direct_agent.label_map
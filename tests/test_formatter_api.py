@@ -0,0 +1,86 @@
+import copy
+import io
+import os
+
+import docx
+import yaml
+
+from document_formatter_api import format_docx
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+INPUT_DOCX = os.path.join(INPUT_DIR, "test_yaml.docx")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+
+class _StreamOnly(io.RawIOBase):
+    """A binary stream that can only be read or written front to back."""
+
+    def __init__(self, data: bytes = b""):
+        self._source = io.BytesIO(data)
+        self.written = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def readinto(self, buffer) -> int:
+        data = self._source.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def write(self, data) -> int:
+        self.written.extend(data)
+        return len(data)
+
+
+def _make_config() -> DocumentFormatterConfig:
+    return DocumentFormatterConfig(copy.deepcopy(BASE_CONFIG))
+
+
+def _read_input() -> bytes:
+    with open(INPUT_DOCX, "rb") as f:
+        return f.read()
+
+
+def _paragraphs(data: bytes) -> list[tuple[str, str]]:
+    doc = docx.Document(io.BytesIO(data))
+    return [(paragraph.style.name, paragraph.text) for paragraph in doc.paragraphs]
+
+
+def _format_from_file() -> bytes:
+    doc = docx.Document(INPUT_DOCX)
+    DocumentFormattingAgent(doc, _make_config()).apply_all_styles()
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def test_bytes_in_bytes_out_matches_file_formatting():
+    formatted = format_docx(_read_input(), _make_config())
+
+    assert isinstance(formatted, bytes)
+    assert _paragraphs(formatted) == _paragraphs(_format_from_file())
+
+
+def test_non_seekable_streams_are_read_and_written():
+    source = _StreamOnly(_read_input())
+    output = _StreamOnly()
+
+    assert format_docx(source, _make_config(), output=output) is None
+
+    assert _paragraphs(bytes(output.written)) == _paragraphs(_format_from_file())
+
+
+def test_seekable_stream_is_used_directly():
+    formatted = format_docx(io.BytesIO(_read_input()), _make_config())
+
+    assert _paragraphs(formatted) == _paragraphs(_format_from_file())
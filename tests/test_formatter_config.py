@@ -0,0 +1,153 @@
+import json
+import os
+
+import pytest
+
+from document_formatter_config import ConfigExtendsError, DocumentFormatterConfig
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+STYLE_SCHEMA = DocumentFormatterConfig.load_yaml_file(
+    input_dir=INPUT_DIR, filename="style_config_schema.yaml"
+)
+
+
+def _load(base_dir, source: str) -> DocumentFormatterConfig:
+    return DocumentFormatterConfig.from_yaml_source(
+        source.encode("utf-8"), STYLE_SCHEMA, base_dir=str(base_dir)
+    )
+
+
+def test_extends_merges_the_parent_config(tmp_path):
+    base_source = DocumentFormatterConfig.read_config_source(
+        input_dir=INPUT_DIR, filename="style_config.yaml"
+    )
+    (tmp_path / "base.yaml").write_bytes(base_source)
+    base_config = _load(tmp_path, base_source.decode("utf-8"))
+
+    config = _load(
+        tmp_path,
+        "document_formatter_config:\n"
+        "  extends: base.yaml\n"
+        "  document_setup: {slim_xml: true}\n",
+    )
+
+    assert config.document_setup == {**base_config.document_setup, "slim_xml": True}
+    assert config.paragraph_styles == base_config.paragraph_styles
+
+
+@pytest.mark.parametrize(
+    "source, message",
+    [
+        ("", "'document_formatter_config' is a required property"),
+        ("other: 1\n", "'document_formatter_config' is a required property"),
+        ("document_formatter_config: 5\n", "5 is not of type 'object'"),
+        ("- document_formatter_config\n", "is not of type 'object'"),
+        ("document_formatter_config: {extends: 5}\n", "5 is not of type 'string'"),
+        ("document_formatter_config: {extends: self.yaml}\n", "extends itself"),
+    ],
+)
+def test_invalid_config_layers_raise_validation_errors(tmp_path, source, message):
+    (tmp_path / "self.yaml").write_text(source, encoding="utf-8")
+
+    with pytest.raises(ValueError, match="^YAML validation error: ") as error:
+        _load(tmp_path, source)
+
+    assert message in str(error.value)
+
+
+@pytest.mark.parametrize(
+    "parent_name",
+    ["../outside.yaml", "nested/../../outside.yaml", "OUTSIDE_ABSOLUTE"],
+)
+def test_extends_cannot_leave_the_config_directory(tmp_path, parent_name):
+    config_dir = tmp_path / "configs"
+    (config_dir / "nested").mkdir(parents=True)
+    (tmp_path / "outside.yaml").write_text("secret: value\n", encoding="utf-8")
+    if parent_name == "OUTSIDE_ABSOLUTE":
+        parent_name = str(tmp_path / "outside.yaml")
+
+    with pytest.raises(ConfigExtendsError, match="outside the config directory"):
+        _load(config_dir, f"document_formatter_config: {{extends: '{parent_name}'}}\n")
+
+
+def test_invalid_parent_content_is_not_quoted(tmp_path):
+    (tmp_path / "parent.yaml").write_text("secret-token-value\n", encoding="utf-8")
+
+    with pytest.raises(ConfigExtendsError) as error:
+        _load(tmp_path, "document_formatter_config: {extends: parent.yaml}\n")
+
+    assert "secret-token-value" not in str(error.value)
+    assert "'parent.yaml' is not a valid config" in str(error.value)
+
+
+def _compile_snapshot(tmp_path) -> str:
+    for filename in ("style_config.yaml", "style_config_schema.yaml"):
+        (tmp_path / filename).write_bytes(
+            DocumentFormatterConfig.read_config_source(
+                input_dir=INPUT_DIR, filename=filename
+            )
+        )
+    return DocumentFormatterConfig.compile_snapshot(
+        str(tmp_path), "style_config.yaml", "style_config_schema.yaml"
+    )
+
+
+def _load_with_snapshot(tmp_path) -> DocumentFormatterConfig:
+    return DocumentFormatterConfig.load_and_validate_yaml(
+        str(tmp_path), "style_config.yaml", "style_config_schema.yaml"
+    )
+
+
+def test_current_snapshot_is_used_instead_of_the_yaml(tmp_path):
+    snapshot_path = _compile_snapshot(tmp_path)
+    with open(snapshot_path, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    snapshot["config"]["document_formatter_config"]["document_setup"][
+        "from_snapshot"
+    ] = True
+    with open(snapshot_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f)
+
+    assert _load_with_snapshot(tmp_path).document_setup["from_snapshot"] is True
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda snapshot: b"\x80\x04garbage",
+        lambda snapshot: b"[]",
+        lambda snapshot: json.dumps({**snapshot, "source_hashes": None}).encode(),
+        lambda snapshot: json.dumps({**snapshot, "config": []}).encode(),
+        lambda snapshot: json.dumps(
+            {k: v for k, v in snapshot.items() if k != "source_hashes"}
+        ).encode(),
+        lambda snapshot: json.dumps(
+            {**snapshot, "source_hashes": {"../outside.yaml": "0"}}
+        ).encode(),
+        lambda snapshot: json.dumps({**snapshot, "version": 0}).encode(),
+    ],
+)
+def test_unusable_snapshots_fall_back_to_the_yaml(tmp_path, corrupt):
+    snapshot_path = _compile_snapshot(tmp_path)
+    with open(snapshot_path, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    snapshot["config"]["document_formatter_config"]["document_setup"][
+        "from_snapshot"
+    ] = True
+    with open(snapshot_path, "wb") as f:
+        f.write(corrupt(snapshot))
+
+    assert "from_snapshot" not in _load_with_snapshot(tmp_path).document_setup
+
+
+def test_snapshot_of_a_changed_config_falls_back_to_the_yaml(tmp_path):
+    _compile_snapshot(tmp_path)
+    style_path = tmp_path / "style_config.yaml"
+    style_path.write_text(
+        style_path.read_text(encoding="utf-8").replace(
+            "document_setup:", "document_setup:\n    from_yaml: true", 1
+        ),
+        encoding="utf-8",
+    )
+
+    assert _load_with_snapshot(tmp_path).document_setup["from_yaml"] is True
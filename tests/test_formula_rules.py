@@ -0,0 +1,157 @@
+import docx
+import pytest
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_TAB_ALIGNMENT
+from docx.oxml import OxmlElement
+from docx.shared import Pt
+
+import config as MAPPING_CONF
+from styling_utils import (
+    apply_formula_rules,
+    get_formula_number_template,
+    is_equation_paragraph,
+)
+
+W_TAGS = MAPPING_CONF.W_TAGS
+
+
+def _add_equation(doc, label: str = "", display: bool = False):
+    paragraph = doc.add_paragraph()
+    equation = OxmlElement("m:oMath")
+    math_run = OxmlElement("m:r")
+    math_text = OxmlElement("m:t")
+    math_text.text = "x=1"
+    math_run.append(math_text)
+    equation.append(math_run)
+    if display:
+        math_para = OxmlElement("m:oMathPara")
+        math_para.append(equation)
+        equation = math_para
+    paragraph._p.append(equation)
+    if label:
+        paragraph.add_run(label)
+    return paragraph
+
+
+def _make_document():
+    doc = docx.Document()
+    doc.styles.add_style("chapter_titles", WD_STYLE_TYPE.PARAGRAPH)
+    doc.add_paragraph("Introduction")
+    equations = [_add_equation(doc, "(7)")]
+    doc.add_paragraph("Chapter one", style="chapter_titles")
+    equations.append(_add_equation(doc, display=True))
+    equations.append(_add_equation(doc))
+    doc.add_paragraph("Chapter two", style="chapter_titles")
+    equations.append(_add_equation(doc, "[9]"))
+    return doc, equations
+
+
+def _apply(doc, formula_rules: dict, start_chapter: int = 0) -> int:
+    return apply_formula_rules(
+        doc=doc,
+        formula_rules=formula_rules,
+        style_names_mapping=MAPPING_CONF.STYLE_NAMES_MAPPING,
+        style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+        font_mapping=MAPPING_CONF.FONT_MAPPING,
+        paragraph_format_mapping=MAPPING_CONF.PARAGRAPH_FORMAT_MAPPING,
+        w_tags=MAPPING_CONF.W_TAGS,
+        start_chapter=start_chapter,
+    )
+
+
+@pytest.mark.parametrize(
+    ("number_format", "levels", "expected"),
+    [
+        ("[1], [2], ...", 1, "[{1}]"),
+        ("(1.1), (1.2), ...", 2, "({1}.{2})"),
+        ("(1-1), (1-2), ...", 2, "({1}-{2})"),
+        ("", 1, "({1})"),
+    ],
+)
+def test_number_template_follows_the_sample(number_format, levels, expected):
+    assert get_formula_number_template(number_format, levels) == expected
+
+
+def test_equations_are_told_from_inline_math():
+    doc = docx.Document()
+    labelled = _add_equation(doc, "(3)")
+    inline = _add_equation(doc, " is the unit")
+
+    assert is_equation_paragraph(labelled._p, W_TAGS)
+    assert not is_equation_paragraph(inline._p, W_TAGS)
+    assert not is_equation_paragraph(doc.add_paragraph("x=1")._p, W_TAGS)
+
+
+def test_global_numbering_labels_every_equation():
+    doc, equations = _make_document()
+
+    numbered = _apply(doc, {"numbering": "Sequential_Global", "number_format": "[1]"})
+
+    assert numbered == 4
+    assert [p.text for p in equations] == ["\t\t[1]", "\t\t[2]", "\t\t[3]", "\t\t[4]"]
+
+
+def test_chapter_numbering_restarts_in_every_chapter():
+    doc, equations = _make_document()
+
+    numbered = _apply(
+        doc,
+        {"numbering": "Sequential_Chapter", "number_format": "(1.1), (1.2), ..."},
+        start_chapter=1,
+    )
+
+    assert numbered == 3
+    assert [p.text.strip() for p in equations] == ["(7)", "(2.1)", "(2.2)", "(3.1)"]
+
+
+def test_numbered_equation_is_laid_out_with_tab_stops():
+    doc, equations = _make_document()
+    text_width = (
+        doc.sections[0].page_width
+        - doc.sections[0].left_margin
+        - doc.sections[0].right_margin
+    )
+
+    _apply(
+        doc,
+        {
+            "numbering": "Sequential_Global",
+            "number_format": "(1)",
+            "font_format": {"size": 10},
+        },
+    )
+
+    p_element = equations[1]._p
+    tab_stops = equations[1].paragraph_format.tab_stops
+    assert p_element.find(W_TAGS["oMathPara"]) is None
+    assert p_element[1].find(W_TAGS["tab"]) is not None
+    assert p_element[2].tag == W_TAGS["oMath"]
+    assert [(t.position, t.alignment) for t in tab_stops] == [
+        (text_width // 2, WD_TAB_ALIGNMENT.CENTER),
+        (text_width, WD_TAB_ALIGNMENT.RIGHT),
+    ]
+    assert equations[1].runs[-1].font.size == Pt(10)
+
+
+def test_description_list_after_an_equation_is_styled():
+    doc = docx.Document()
+    _add_equation(doc)
+    keyword = doc.add_paragraph("where:")
+    items = [doc.add_paragraph("x - unknown"), doc.add_paragraph("y - result")]
+    doc.add_paragraph("")
+    after = doc.add_paragraph("Body text")
+
+    _apply(
+        doc,
+        {
+            "description_list": {
+                "keyword": "where",
+                "keyword_style": {"font_format": {"bold": True}},
+                "list_style": {"paragraph_format": {"first_line_indent": 1.0}},
+            }
+        },
+    )
+
+    assert keyword.runs[0].bold
+    assert all(item.paragraph_format.first_line_indent for item in items)
+    assert after.paragraph_format.first_line_indent is None
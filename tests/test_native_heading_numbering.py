@@ -0,0 +1,119 @@
+import copy
+import os
+import re
+
+import docx
+import pytest
+import yaml
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+HEADING_STYLES = [
+    "chapter_titles",
+    "subchapter_titles_level_2",
+    "subchapter_titles_level_3",
+    "annex_titles",
+]
+PARAGRAPHS = [
+    ("subchapter_titles_level_2", "Early"),
+    ("chapter_titles", "Introduction"),
+    ("subchapter_titles_level_3", "Orphan"),
+    ("subchapter_titles_level_2", "Scope"),
+    ("subchapter_titles_level_3", "Goals"),
+    ("annex_titles", "Annex"),
+    ("subchapter_titles_level_3", "Terms"),
+    ("Normal", "Body text"),
+    ("chapter_titles", "Methods"),
+    ("chapter_titles", "Methods subtitle"),
+    ("subchapter_titles_level_2", "Design"),
+    ("subchapter_titles_level_3", "Sample"),
+    ("annex_titles", "Tools"),
+]
+
+
+def _make_config(native: bool, level_3_restart: int | None) -> DocumentFormatterConfig:
+    config = copy.deepcopy(BASE_CONFIG)
+    root = config["document_formatter_config"]
+    root["document_setup"]["native_heading_numbering"] = native
+    rules = root["chapter_and_section_rules"]
+    rules["chapter_titles"]["numbering_format"] = {"type": "ARABIC"}
+    rules["chapter_titles"]["common_pattern_format"] = {"pattern": "number"}
+    rules["subchapter_titles_level_3"]["numbering_format"]["restart_level"] = (
+        level_3_restart
+    )
+    rules["annex_titles"] = copy.deepcopy(rules["subchapter_titles_level_2"])
+    rules["annex_titles"]["numbering_format"]["outline_level"] = 2
+    return DocumentFormatterConfig(config)
+
+
+def _format(native: bool, level_3_restart: int | None):
+    doc = docx.Document()
+    for style_name in HEADING_STYLES:
+        doc.styles.add_style(style_name, WD_STYLE_TYPE.PARAGRAPH)
+    for style_name, text in PARAGRAPHS:
+        doc.add_paragraph(text, style=style_name)
+    DocumentFormattingAgent(
+        doc, _make_config(native, level_3_restart)
+    ).apply_all_styles()
+    return doc
+
+
+def _text_numbers(doc) -> list[str | None]:
+    numbers = []
+    for paragraph in doc.paragraphs:
+        match = re.match(r"(\d+(?:\.\d+)*) ", paragraph.text)
+        numbers.append(match.group(1) if match else None)
+    return numbers
+
+
+def _list_numbers(doc) -> list[str | None]:
+    """Number the paragraphs the way Word counts the heading list levels."""
+    numbering = doc.part.numbering_part.element
+    restarts = {}
+    for lvl in numbering.iter(qn("w:lvl")):
+        restart = lvl.find(qn("w:lvlRestart"))
+        ilvl = int(lvl.get(qn("w:ilvl")))
+        restarts[ilvl] = ilvl if restart is None else int(restart.get(qn("w:val")))
+
+    counters = [0] * 9
+    numbers = []
+    for paragraph in doc.paragraphs:
+        num_pr = paragraph._p.pPr.numPr if paragraph._p.pPr is not None else None
+        style_p_pr = paragraph.style.element.pPr
+        style_num_pr = style_p_pr.numPr if style_p_pr is not None else None
+        if style_num_pr is None or (num_pr is not None and num_pr.numId.val == 0):
+            numbers.append(None)
+            continue
+
+        ilvl = style_num_pr.ilvl.val if style_num_pr.ilvl is not None else 0
+        counters[ilvl] += 1
+        for deeper_ilvl in range(ilvl + 1, len(counters)):
+            if ilvl < restarts.get(deeper_ilvl, deeper_ilvl):
+                counters[deeper_ilvl] = 0
+        numbers.append(".".join(str(counter) for counter in counters[: ilvl + 1]))
+    return numbers
+
+
+@pytest.mark.parametrize("level_3_restart", [None, 1, 0])
+def test_native_numbering_matches_text_numbering(level_3_restart):
+    text_doc = _format(native=False, level_3_restart=level_3_restart)
+    native_doc = _format(native=True, level_3_restart=level_3_restart)
+
+    assert _list_numbers(native_doc) == _text_numbers(text_doc)
+    assert [p.text for p in native_doc.paragraphs] == [text for _, text in PARAGRAPHS]
+
+
+def test_outline_level_styles_join_the_heading_list():
+    doc = _format(native=True, level_3_restart=None)
+
+    num_pr = doc.styles["annex_titles"].element.pPr.numPr
+    chapter_num_pr = doc.styles["chapter_titles"].element.pPr.numPr
+    assert (num_pr.numId.val, num_pr.ilvl.val) == (chapter_num_pr.numId.val, 1)
@@ -0,0 +1,82 @@
+import pytest
+import roman
+
+from styling_utils import compile_number_formatter, format_number, get_number_formatter
+from styling_utils.numbering.number_formatters import (
+    LOOKUP_TABLE_LIMIT,
+    from_roman,
+    to_roman,
+)
+
+
+@pytest.mark.parametrize(
+    ("numbering_type", "value", "expected"),
+    [
+        ("ARABIC", 0, "0"),
+        ("ARABIC", 12, "12"),
+        ("ROMAN", 1, "I"),
+        ("ROMAN", 14, "XIV"),
+        ("ROMAN", LOOKUP_TABLE_LIMIT, "MMMCMXCIX"),
+        ("LOWER_ROMAN", 9, "ix"),
+        ("UPPER_ALPHA", 1, "A"),
+        ("UPPER_ALPHA", 27, "AA"),
+        ("LOWER_ALPHA", 28, "ab"),
+        ("ZERO_PADDED", 0, "00"),
+        ("ZERO_PADDED", 7, "07"),
+        ("ZERO_PADDED", 123, "123"),
+    ],
+)
+def test_format_number(numbering_type, value, expected):
+    assert format_number(value, numbering_type) == expected
+    assert compile_number_formatter(numbering_type)([value]) == expected
+
+
+@pytest.mark.parametrize("value", [0, LOOKUP_TABLE_LIMIT + 1])
+def test_roman_values_outside_the_table_fall_back_to_roman(value):
+    numeral = roman.toRoman(value)
+
+    assert format_number(value, "ROMAN") == numeral
+    assert format_number(value, "LOWER_ROMAN") == numeral.lower()
+    assert compile_number_formatter("ROMAN")([value]) == numeral
+    assert to_roman(value) == numeral
+
+
+@pytest.mark.parametrize(
+    ("numbering_type", "expected"),
+    [("UPPER_ALPHA", "EWV"), ("LOWER_ALPHA", "ewv"), ("ARABIC", "4000")],
+)
+def test_formats_past_the_table_are_computed(numbering_type, expected):
+    value = LOOKUP_TABLE_LIMIT + 1
+    assert format_number(value, numbering_type) == expected
+    assert compile_number_formatter(numbering_type)([value]) == expected
+
+
+def test_alpha_formats_of_zero_are_empty():
+    assert format_number(0, "UPPER_ALPHA") == ""
+    assert format_number(0, "LOWER_ALPHA") == ""
+
+
+def test_roman_conversion_round_trips_across_the_table():
+    for value in (1, 4, 40, 1994, LOOKUP_TABLE_LIMIT):
+        assert from_roman(to_roman(value)) == value
+        assert to_roman(value) == roman.toRoman(value)
+
+
+def test_levels_are_joined_with_dots_without_a_template():
+    assert compile_number_formatter("ROMAN")([1, 2, 3]) == "I.II.III"
+
+
+def test_template_is_cut_after_the_last_available_level():
+    formatter = compile_number_formatter("ARABIC", "{1}.{2}-{3}")
+
+    assert formatter([1, 2, 3]) == "1.2-3"
+    assert formatter([1, 2]) == "1.2"
+    assert formatter([1]) == "1"
+    assert formatter([]) == ""
+
+
+def test_numbering_definitions_select_a_formatter():
+    formatter = get_number_formatter({"type": "zero_padded", "padding": 3})
+
+    assert formatter([4, 12]) == "004.012"
+    assert get_number_formatter(None)([2, 5]) == "2.5"
@@ -0,0 +1,97 @@
+import copy
+import os
+
+import docx
+import pytest
+import yaml
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+
+def _make_config(document_setup: dict) -> DocumentFormatterConfig:
+    config = copy.deepcopy(BASE_CONFIG)
+    config["document_formatter_config"]["document_setup"].update(document_setup)
+    return DocumentFormatterConfig(config)
+
+
+def _text(element) -> str:
+    return "".join(t.text or "" for t in element.iter(qn("w:t")))
+
+
+def _make_document(before: str, after: list[str]):
+    doc = docx.Document()
+    for style_name in ("table_titles", "figure_titles", "source_text"):
+        doc.styles.add_style(style_name, WD_STYLE_TYPE.PARAGRAPH)
+    doc.add_paragraph("Introduction")
+    doc.add_paragraph(before)
+    doc.add_table(rows=1, cols=1)
+    for text in after:
+        doc.add_paragraph(text)
+    return doc
+
+
+def _styles(doc) -> list[str]:
+    return [paragraph.style.name for paragraph in doc.paragraphs]
+
+
+@pytest.mark.parametrize(
+    "before",
+    [
+        "Table shows the results of the treatment group.",
+        "Tables 1 and 2 compare both groups.",
+        "table of contents",
+    ],
+)
+def test_sentences_starting_with_the_caption_word_are_not_captions(before):
+    doc = _make_document(before, ["Sources differ between both groups."])
+    agent = DocumentFormattingAgent(doc, _make_config({"detect_object_captions": True}))
+
+    assert agent.apply_object_captions() == 0
+    assert _styles(doc) == ["Normal", "Normal", "Normal"]
+
+
+@pytest.mark.parametrize(
+    "before",
+    ["Table 3: Results", "TABLE 2.1 Results", "Table IV Results", "Table A.1 Results"],
+)
+def test_captions_with_a_number_or_label_are_detected(before):
+    doc = _make_document(before, ["Source: own survey"])
+    agent = DocumentFormattingAgent(doc, _make_config({"detect_object_captions": True}))
+
+    assert agent.apply_object_captions() == 2
+    assert _styles(doc) == ["Normal", "table_titles", "source_text"]
+
+
+def test_source_below_a_caption_under_the_object_is_detected():
+    doc = _make_document(
+        "The results are listed below.",
+        ["Table 1 Results", "Source: own survey", "Source data were checked twice."],
+    )
+    agent = DocumentFormattingAgent(doc, _make_config({"detect_object_captions": True}))
+
+    assert agent.apply_object_captions() == 2
+    assert _styles(doc) == [
+        "Normal",
+        "Normal",
+        "table_titles",
+        "source_text",
+        "Normal",
+    ]
+
+
+def test_caption_detection_is_opt_in():
+    sentence = "Table 3 shows that the treatment group improved by 12%."
+    doc = _make_document(sentence, [])
+    agent = DocumentFormattingAgent(doc, _make_config({}))
+
+    agent.apply_all_styles()
+
+    assert sentence in [_text(p) for p in doc.element.body.iter(qn("w:p"))]
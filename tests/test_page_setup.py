@@ -0,0 +1,35 @@
+import docx
+from docx.enum.section import WD_SECTION
+from docx.oxml.ns import qn
+
+from config import PAGE_SIZES
+from styling_utils import apply_page_setup
+
+
+def _margins(section) -> dict[str, str]:
+    return {
+        name.split("}")[1]: value
+        for name, value in section._sectPr.pgMar.attrib.items()
+    }
+
+
+def test_created_page_margins_get_all_required_attributes():
+    doc = docx.Document()
+    doc.sections[0]._sectPr.pgMar.attrib[qn("w:header")] = "500"
+    doc.add_section(WD_SECTION.NEW_PAGE)
+    for section in doc.sections[1:]:
+        section._sectPr.remove(section._sectPr.pgMar)
+
+    apply_page_setup(doc, {"margins": {"top": 2, "left": 3}}, PAGE_SIZES)
+
+    first, second = (_margins(section) for section in doc.sections)
+    assert first == {
+        "top": "1134",
+        "right": "1800",
+        "bottom": "1440",
+        "left": "1701",
+        "header": "500",
+        "footer": "720",
+        "gutter": "0",
+    }
+    assert second == first
@@ -0,0 +1,41 @@
+import docx
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from lxml import etree
+
+from styling_utils import apply_paragraph_cleaning
+
+
+def _make_paragraph(*texts: str):
+    paragraph = docx.Document().add_paragraph()
+    for text in texts:
+        paragraph.add_run(text)
+    return paragraph
+
+
+def test_paragraphs_without_surrounding_spaces_keep_runs_and_fields():
+    paragraph = _make_paragraph("Bold start", " and the rest")
+    paragraph.runs[0].bold = True
+    field = OxmlElement("w:fldSimple", attrs={qn("w:instr"): " PAGE "})
+    paragraph._p.append(field)
+    before = etree.tostring(paragraph._p)
+
+    apply_paragraph_cleaning(paragraph)
+
+    assert etree.tostring(paragraph._p) == before
+
+
+def test_surrounding_spaces_and_newlines_are_trimmed():
+    paragraph = _make_paragraph("\n  Padded", " text  ")
+
+    apply_paragraph_cleaning(paragraph)
+
+    assert paragraph.text == "Padded text"
+
+
+def test_trimming_can_be_disabled():
+    paragraph = _make_paragraph("  Padded  ")
+
+    apply_paragraph_cleaning(paragraph, trim_spaces=False)
+
+    assert paragraph.text == "  Padded  "
@@ -0,0 +1,70 @@
+import copy
+import os
+
+import docx
+import pytest
+import yaml
+from lxml import etree
+
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+from document_parallel_formatter import format_document_by_chapters
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+INPUT_DOCX = os.path.join(INPUT_DIR, "test_yaml.docx")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+
+def _make_config(
+    document_setup: dict, restart_levels: dict | None = None
+) -> DocumentFormatterConfig:
+    config = copy.deepcopy(BASE_CONFIG)
+    formatter_config = config["document_formatter_config"]
+    formatter_config["document_setup"].update(document_setup)
+    for style_key, restart_level in (restart_levels or {}).items():
+        style_rule = formatter_config["chapter_and_section_rules"][style_key]
+        style_rule["numbering_format"]["restart_level"] = restart_level
+    return DocumentFormatterConfig(config)
+
+
+def _format_both(config: DocumentFormatterConfig):
+    sequential = docx.Document(INPUT_DOCX)
+    DocumentFormattingAgent(sequential, config).apply_all_styles()
+    parallel = docx.Document(INPUT_DOCX)
+    format_document_by_chapters(parallel, config, max_workers=2)
+    return sequential, parallel
+
+
+def _parts(doc) -> dict[str, bytes]:
+    return {
+        "styles": etree.tostring(doc.styles.element),
+        "numbering": etree.tostring(doc.part.numbering_part.element),
+        "body": etree.tostring(doc.element.body),
+    }
+
+
+@pytest.mark.parametrize(
+    "document_setup",
+    [
+        {},
+        {"native_heading_numbering": True},
+        {"caption_field_numbering": True},
+        {"native_heading_numbering": True, "caption_field_numbering": True},
+    ],
+)
+def test_parallel_formatting_matches_sequential(document_setup):
+    sequential, parallel = _format_both(_make_config(document_setup))
+
+    assert _parts(parallel) == _parts(sequential)
+
+
+@pytest.mark.parametrize(
+    "restart_levels",
+    [{"figure_titles": 0}, {"subchapter_titles_level_2": 0}],
+)
+def test_parallel_formatting_numbers_through_chapters(restart_levels):
+    sequential, parallel = _format_both(_make_config({}, restart_levels))
+
+    assert _parts(parallel) == _parts(sequential)
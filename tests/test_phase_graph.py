@@ -0,0 +1,59 @@
+import copy
+import os
+
+import docx
+import yaml
+from lxml import etree
+
+from document_formatter_config import DocumentFormatterConfig
+from document_formatting_agent import DocumentFormattingAgent
+from styling_utils import group_phase_stages
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+INPUT_DOCX = os.path.join(INPUT_DIR, "test_yaml.docx")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+
+def _make_agent() -> DocumentFormattingAgent:
+    config = DocumentFormatterConfig(copy.deepcopy(BASE_CONFIG))
+    return DocumentFormattingAgent(docx.Document(INPUT_DOCX), config)
+
+
+def _parts(doc) -> list[bytes]:
+    return [
+        etree.tostring(element)
+        for element in (
+            doc.styles.element,
+            doc.part.numbering_part.element,
+            doc.element.body,
+        )
+    ]
+
+
+def test_phases_writing_the_same_part_never_share_a_stage():
+    for stage in group_phase_stages(_make_agent().describe_phases()):
+        written_parts = [part for phase in stage for part in phase["writes"]]
+        assert len(written_parts) == len(set(written_parts))
+
+
+def test_threaded_phases_give_the_sequential_output():
+    sequential_agent = _make_agent()
+    threaded_agent = _make_agent()
+
+    sequential_phases = sequential_agent.apply_all_styles()
+    threaded_phases = threaded_agent.apply_all_styles(max_workers=4)
+
+    assert threaded_phases == sequential_phases
+    assert _parts(threaded_agent.doc) == _parts(sequential_agent.doc)
+
+
+def test_apply_phases_runs_the_named_phases_with_work_in_declared_order():
+    agent = _make_agent()
+
+    phase_names = agent.apply_phases(
+        ["apply_nested_styling", "clean_paragraphs", "slim_xml"]
+    )
+
+    assert phase_names == ["clean_paragraphs", "apply_nested_styling"]
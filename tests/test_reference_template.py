@@ -0,0 +1,90 @@
+import copy
+import os
+import zipfile
+from io import BytesIO
+
+import docx
+import yaml
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.shared import Pt
+
+from document_formatter_config import DocumentFormatterConfig
+from document_template_exporter import TEMPLATE_CONTENT_TYPE, export_reference_template
+from styling_utils import import_reference_template, read_reference_template
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+
+with open(os.path.join(INPUT_DIR, "style_config.yaml"), encoding="utf-8") as f:
+    BASE_CONFIG = yaml.safe_load(f)
+
+
+def _export_template(tmp_path, filename: str = "house_style.dotx") -> str:
+    template_path = str(tmp_path / filename)
+    export_reference_template(
+        DocumentFormatterConfig(copy.deepcopy(BASE_CONFIG)), template_path
+    )
+    return template_path
+
+
+def _save_and_reopen(doc):
+    buffer = BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return docx.Document(buffer), buffer
+
+
+def test_dotx_export_sets_the_template_content_type(tmp_path):
+    template_path = _export_template(tmp_path)
+
+    with zipfile.ZipFile(template_path) as package:
+        names = package.namelist()
+        content_types = package.read("[Content_Types].xml").decode("utf-8")
+
+    assert len(names) == len(set(names))
+    assert (
+        f'<Override PartName="/word/document.xml" ContentType="{TEMPLATE_CONTENT_TYPE}"/>'
+        in content_types
+    )
+
+
+def test_docx_export_keeps_the_document_content_type(tmp_path):
+    template_path = _export_template(tmp_path, "house_style.docx")
+
+    assert docx.Document(template_path).styles["table_titles"] is not None
+
+
+def test_exported_template_round_trips_its_styles(tmp_path):
+    reference_template = read_reference_template(_export_template(tmp_path))
+    doc = docx.Document()
+
+    import_reference_template(doc, reference_template)
+    reopened, _ = _save_and_reopen(doc)
+
+    paragraph_format = reopened.styles["table_titles"].paragraph_format
+    assert (paragraph_format.space_before, paragraph_format.space_after) == (
+        Pt(12),
+        Pt(6),
+    )
+
+
+def test_template_theme_replaces_the_document_theme(tmp_path):
+    reference_template = read_reference_template(_export_template(tmp_path))
+    partname, content_type, blob = reference_template["parts"][RT.THEME]
+    theme_blob = blob.replace(b'name="Office Theme"', b'name="House Theme"', 1)
+    assert theme_blob != blob
+    reference_template = {
+        **reference_template,
+        "parts": {
+            **reference_template["parts"],
+            RT.THEME: (partname, content_type, theme_blob),
+        },
+    }
+    doc = docx.Document()
+
+    import_reference_template(doc, reference_template)
+    reopened, buffer = _save_and_reopen(doc)
+
+    assert reopened.part.part_related_by(RT.THEME).blob == theme_blob
+    with zipfile.ZipFile(buffer) as package:
+        theme_names = [name for name in package.namelist() if "theme" in name]
+    assert theme_names == ["word/theme/theme1.xml"]
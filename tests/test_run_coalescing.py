@@ -0,0 +1,78 @@
+import docx
+from docx.oxml import OxmlElement
+from lxml import etree
+
+import config as MAPPING_CONF
+from styling_utils import apply_run_coalescing, coalesce_paragraph_runs
+
+W_TAGS = MAPPING_CONF.W_TAGS
+
+
+def _make_paragraph(*texts: str):
+    paragraph = docx.Document().add_paragraph()
+    for text in texts:
+        paragraph.add_run(text)
+    return paragraph
+
+
+def test_runs_with_identical_properties_keep_text_and_properties():
+    paragraph = _make_paragraph("Bold ", "and", " bold")
+    for run in paragraph.runs:
+        run.bold = True
+    r_pr = etree.tostring(paragraph.runs[0]._r.rPr)
+
+    removed_runs = coalesce_paragraph_runs(paragraph._p, W_TAGS)
+
+    assert removed_runs == 2
+    assert len(paragraph.runs) == 1
+    assert paragraph.text == "Bold and bold"
+    assert etree.tostring(paragraph.runs[0]._r.rPr) == r_pr
+    assert paragraph.runs[0].bold
+
+
+def test_runs_with_different_properties_are_kept():
+    paragraph = _make_paragraph("Bold", " plain", " plain")
+    paragraph.runs[0].bold = True
+
+    removed_runs = coalesce_paragraph_runs(paragraph._p, W_TAGS)
+
+    assert removed_runs == 1
+    assert [run.text for run in paragraph.runs] == ["Bold", " plain plain"]
+    assert paragraph.runs[0].bold
+    assert not paragraph.runs[1].bold
+
+
+def test_spell_check_markers_between_merged_runs_are_dropped():
+    paragraph = _make_paragraph("Speling", " error")
+    paragraph.runs[0]._r.addnext(OxmlElement("w:proofErr"))
+
+    coalesce_paragraph_runs(paragraph._p, W_TAGS)
+
+    assert paragraph._p.find(W_TAGS["proofErr"]) is None
+    assert paragraph.text == "Speling error"
+
+
+def test_runs_with_other_content_are_not_merged():
+    paragraph = _make_paragraph("Before", "After")
+    paragraph.runs[0].add_tab()
+    before = etree.tostring(paragraph._p)
+
+    assert coalesce_paragraph_runs(paragraph._p, W_TAGS) == 0
+    assert etree.tostring(paragraph._p) == before
+
+
+def test_document_coalescing_counts_runs_and_preserves_spaces():
+    doc = docx.Document()
+    doc.add_paragraph().add_run("Single")
+    paragraph = doc.add_paragraph()
+    paragraph.add_run("Trailing")
+    paragraph.add_run(" space ")
+
+    removed_runs = apply_run_coalescing(doc, W_TAGS)
+
+    assert removed_runs == 1
+    assert paragraph.text == "Trailing space "
+    assert (
+        paragraph.runs[0]._r.t_lst[0].get("{http://www.w3.org/XML/1998/namespace}space")
+        == "preserve"
+    )
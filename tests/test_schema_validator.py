@@ -0,0 +1,93 @@
+import copy
+import os
+import warnings
+
+import pytest
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+from document_formatter_config import DocumentFormatterConfig
+from document_schema_validator import compile_schema_validator, get_schema_validator
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "input")
+STYLE_SCHEMA = DocumentFormatterConfig.load_yaml_file(
+    input_dir=INPUT_DIR, filename="style_config_schema.yaml"
+)
+BASE_CONFIG = DocumentFormatterConfig.load_yaml_file(
+    input_dir=INPUT_DIR, filename="style_config.yaml"
+)
+FIGURE_TITLES = ("chapter_and_section_rules", "figure_titles")
+DELETE = object()
+
+with warnings.catch_warnings():
+    # The schema's $schema URI is not one jsonschema knows
+    warnings.simplefilter("ignore", DeprecationWarning)
+    JSONSCHEMA_VALIDATOR = validator_for(STYLE_SCHEMA)(STYLE_SCHEMA)
+
+
+def _generated_is_valid():
+    namespace = {}
+    exec(compile_schema_validator(STYLE_SCHEMA), namespace)
+    return namespace["is_valid"]
+
+
+GENERATED_IS_VALID = _generated_is_valid()
+
+
+def _mutate(path: tuple[str, ...], value) -> dict:
+    config = copy.deepcopy(BASE_CONFIG)
+    parent = config["document_formatter_config"]
+    for key in path[:-1]:
+        parent = parent.setdefault(key, {})
+    if value is DELETE:
+        del parent[path[-1]]
+    else:
+        parent[path[-1]] = value
+    return config
+
+
+@pytest.mark.parametrize(
+    "path, value",
+    [
+        ((*FIGURE_TITLES, "numbering_format", "restart_level"), 1),
+        ((*FIGURE_TITLES, "numbering_format", "restart_level"), 1.0),
+        ((*FIGURE_TITLES, "numbering_format", "restart_level"), 1.5),
+        ((*FIGURE_TITLES, "numbering_format", "restart_level"), True),
+        ((*FIGURE_TITLES, "numbering_format", "restart_level"), "1"),
+        ((*FIGURE_TITLES, "numbering_format", "restart_level"), None),
+        ((*FIGURE_TITLES, "numbering_format", "restart_level"), -1),
+        ((*FIGURE_TITLES, "numbering_format", "restart_level"), 10.0),
+        ((*FIGURE_TITLES, "font_format", "color_rgb"), "#A1b2C3"),
+        ((*FIGURE_TITLES, "font_format", "color_rgb"), "#A1B2C"),
+        ((*FIGURE_TITLES, "font_format", "color_rgb"), "x#A1B2C3"),
+        ((*FIGURE_TITLES, "font_format", "color_rgb"), "#A1B2C3\n"),
+        ((*FIGURE_TITLES, "font_format", "color_rgb"), None),
+        (("formula_rules", "numbering"), "Sequential_Chapter"),
+        (("formula_rules", "numbering"), "Sequential"),
+        (("formula_rules", "numbering"), 1),
+        (("document_setup", "margins", "top"), 2),
+        (("document_setup", "margins", "top"), True),
+        (("document_setup", "margins", "top"), "2"),
+        (("document_setup", "page_size"), DELETE),
+        (("table_rules", "header_row_style", "shading"), "#ABCDEF"),
+        (("table_rules", "header_row_style", "shading"), "ABCDEF"),
+        (("adjustment_rules", "rules"), [{"find": "", "replace": "x"}]),
+        (("adjustment_rules", "rules"), [{"find": "a", "replace": "b", "x": 1}]),
+    ],
+)
+def test_generated_validator_matches_jsonschema(path, value):
+    config = _mutate(path, value)
+    expected_error = best_match(JSONSCHEMA_VALIDATOR.iter_errors(config))
+
+    assert GENERATED_IS_VALID(config) == (expected_error is None)
+    if expected_error is None:
+        get_schema_validator(STYLE_SCHEMA).validate(config)
+    else:
+        with pytest.raises(ValueError) as error:
+            get_schema_validator(STYLE_SCHEMA).validate(config)
+        assert str(error.value) == f"YAML validation error: {expected_error.message}"
+
+
+def test_generated_validator_accepts_the_base_config():
+    assert JSONSCHEMA_VALIDATOR.is_valid(BASE_CONFIG)
+    assert GENERATED_IS_VALID(BASE_CONFIG)
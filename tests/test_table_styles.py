@@ -0,0 +1,135 @@
+import docx
+import pytest
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.shared import Pt
+from lxml import etree
+
+import config as MAPPING_CONF
+from styling_utils import apply_table_styles, compile_table_look, has_table_style_rules
+
+STYLE_NAMES_MAPPING = MAPPING_CONF.STYLE_NAMES_MAPPING
+TABLE_STYLE_NAME = STYLE_NAMES_MAPPING["table_style"]
+
+TABLE_RULES = {
+    "table_style": {
+        "font_format": {"size": 10},
+        "borders": {"style": "single", "size": 0.5, "color": "#808080"},
+    },
+    "header_row_style": {
+        "font_format": {"bold": True},
+        "shading": "#D9D9D9",
+        "repeat_header": True,
+    },
+    "banded_rows": {"shading": "#F2F2F2"},
+}
+
+
+def _apply(doc, table_rules: dict) -> int:
+    return apply_table_styles(
+        doc=doc,
+        table_rules=table_rules,
+        style_names_mapping=STYLE_NAMES_MAPPING,
+        style_attributes_names_mapping=MAPPING_CONF.STYLE_ATTRIBUTES_NAMES_MAPPING,
+        font_mapping=MAPPING_CONF.FONT_MAPPING,
+        paragraph_format_mapping=MAPPING_CONF.PARAGRAPH_FORMAT_MAPPING,
+        w_tags=MAPPING_CONF.W_TAGS,
+    )
+
+
+def _conditional_formatting(style_element) -> dict:
+    return {
+        element.get(qn("w:type")): element
+        for element in style_element.iterchildren(qn("w:tblStylePr"))
+    }
+
+
+def test_table_style_is_written_once_to_styles():
+    doc = docx.Document()
+    tables = [doc.add_table(rows=3, cols=2) for _ in range(2)]
+
+    assert _apply(doc, TABLE_RULES) == 2
+
+    style = doc.styles[TABLE_STYLE_NAME]
+    assert style.type == WD_STYLE_TYPE.TABLE
+    assert style.font.size == Pt(10)
+    borders = style.element.find(qn("w:tblPr")).find(qn("w:tblBorders"))
+    assert [border.tag for border in borders] == [
+        qn(f"w:{side}")
+        for side in ("top", "left", "bottom", "right", "insideH", "insideV")
+    ]
+    assert {border.get(qn("w:sz")) for border in borders} == {"4"}
+    assert {border.get(qn("w:color")) for border in borders} == {"808080"}
+    for table in tables:
+        assert table.style.name == TABLE_STYLE_NAME
+        assert not table._tbl.xpath(".//w:tcPr/w:shd | .//w:r/w:rPr")
+
+
+def test_header_and_banding_become_conditional_formatting():
+    doc = docx.Document()
+    table = doc.add_table(rows=3, cols=2)
+
+    _apply(doc, TABLE_RULES)
+
+    style_element = doc.styles[TABLE_STYLE_NAME].element
+    conditional_formatting = _conditional_formatting(style_element)
+    assert list(conditional_formatting) == ["firstRow", "band1Horz"]
+    header = conditional_formatting["firstRow"]
+    assert header.find(qn("w:rPr")).find(qn("w:b")) is not None
+    assert header.find(qn("w:tcPr")).find(qn("w:shd")).get(qn("w:fill")) == "D9D9D9"
+    band = conditional_formatting["band1Horz"]
+    assert band.find(qn("w:tcPr")).find(qn("w:shd")).get(qn("w:fill")) == "F2F2F2"
+    band_size = style_element.find(qn("w:tblPr")).find(qn("w:tblStyleRowBandSize"))
+    assert band_size.get(qn("w:val")) == "1"
+
+    look = table._tbl.tblPr.find(qn("w:tblLook"))
+    assert look.get(qn("w:firstRow")) == "1"
+    assert look.get(qn("w:noHBand")) == "0"
+    assert table.rows[0]._tr.trPr.find(qn("w:tblHeader")) is not None
+    assert table.rows[1]._tr.trPr is None
+
+
+def test_reapplying_replaces_the_conditional_formatting():
+    doc = docx.Document()
+    doc.add_table(rows=2, cols=2)
+    _apply(doc, TABLE_RULES)
+
+    _apply(doc, {"table_style": {"font_format": {"size": 11}}})
+
+    style_element = doc.styles[TABLE_STYLE_NAME].element
+    assert _conditional_formatting(style_element) == {}
+    assert style_element.find(qn("w:tblPr")) is None
+    assert doc.styles[TABLE_STYLE_NAME].font.size == Pt(11)
+
+
+@pytest.mark.parametrize(
+    ("header_row", "banded_rows", "legacy_value"),
+    [(False, False, "0600"), (True, False, "0620"), (True, True, "0420")],
+)
+def test_table_look_flags_match_the_legacy_value(header_row, banded_rows, legacy_value):
+    table_look = compile_table_look(header_row=header_row, banded_rows=banded_rows)
+
+    assert table_look[qn("w:val")] == legacy_value
+    assert table_look[qn("w:firstRow")] == str(int(header_row))
+    assert table_look[qn("w:noHBand")] == str(int(not banded_rows))
+
+
+def test_tables_are_left_alone_without_table_style_rules():
+    doc = docx.Document()
+    table = doc.add_table(rows=1, cols=1)
+    before = etree.tostring(table._tbl)
+
+    assert not has_table_style_rules({"caption_style": {}}, STYLE_NAMES_MAPPING)
+    assert _apply(doc, {"caption_style": {"font_format": {"bold": True}}}) == 0
+    assert etree.tostring(table._tbl) == before
+    with pytest.raises(KeyError):
+        doc.styles[TABLE_STYLE_NAME]
+
+
+def test_existing_paragraph_style_with_the_table_style_name_is_rejected():
+    doc = docx.Document()
+    doc.styles.add_style(TABLE_STYLE_NAME, WD_STYLE_TYPE.PARAGRAPH)
+    doc.add_table(rows=1, cols=1)
+
+    with pytest.raises(ValueError):
+        _apply(doc, TABLE_RULES)
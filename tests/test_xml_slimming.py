@@ -0,0 +1,52 @@
+import docx
+from docx.oxml import parse_xml
+
+import config as MAPPING_CONF
+from styling_utils import apply_xml_slimming
+
+W_NAMESPACE = MAPPING_CONF.OPENXML_FORMATS["W"]
+
+
+def _add_body_xml(doc, xml: str) -> None:
+    doc.element.body.append(parse_xml(f'<w:p xmlns:w="{W_NAMESPACE}">{xml}</w:p>'))
+
+
+def _bookmark(bookmark_id: int, name: str) -> str:
+    return (
+        f'<w:bookmarkStart w:id="{bookmark_id}" w:name="{name}"/>'
+        f'<w:bookmarkEnd w:id="{bookmark_id}"/>'
+    )
+
+
+def _bookmark_names(doc) -> set[str]:
+    return {
+        element.get(MAPPING_CONF.W_TAGS["name"])
+        for element in doc.element.body.iter(MAPPING_CONF.W_TAGS["bookmarkStart"])
+    }
+
+
+def test_slimming_keeps_referenced_collapsed_bookmarks():
+    doc = docx.Document()
+    _add_body_xml(
+        doc,
+        _bookmark(1, "_Ref1")
+        + _bookmark(2, "_Toc2")
+        + _bookmark(3, "_Ref3")
+        + _bookmark(4, "_GoBack")
+        + _bookmark(5, "Intro")
+        + _bookmark(6, "_Ref6"),
+    )
+    # REF field with its instruction split over two runs
+    _add_body_xml(
+        doc,
+        '<w:r><w:fldChar w:fldCharType="begin"/></w:r>'
+        "<w:r><w:instrText> REF _Re</w:instrText></w:r>"
+        "<w:r><w:instrText>f1 \\h </w:instrText></w:r>"
+        '<w:r><w:fldChar w:fldCharType="end"/></w:r>'
+        '<w:hyperlink w:anchor="_Toc2"><w:r><w:t>1</w:t></w:r></w:hyperlink>'
+        '<w:fldSimple w:instr=" PAGEREF _Ref6 \\h "/>',
+    )
+
+    apply_xml_slimming(doc, MAPPING_CONF.W_TAGS, MAPPING_CONF.OPENXML_FORMATS)
+
+    assert _bookmark_names(doc) == {"_Ref1", "_Toc2", "Intro", "_Ref6"}